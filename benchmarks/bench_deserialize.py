@@ -0,0 +1,79 @@
+"""
+Compares the generated `ApiClient.__deserialize` with the compiled decoders in
+`presalytics.client.deserializer` on large list responses.  The "lazy" column times
+decoding into lazy, dict-backed models (`lazy_models=True`), which defer attribute decoding.
+
+Usage:
+
+    python benchmarks/bench_deserialize.py [--count 2000] [--repeat 5]
+"""
+import argparse
+import datetime
+import importlib
+import re
+import timeit
+import presalytics.client.deserializer
+
+
+SAMPLES = [
+    ("presalytics.client.presalytics_story", "list[Story]"),
+    ("presalytics.client.presalytics_ooxml_automation", "list[SlideSlidesDetails]"),
+    ("presalytics.client.presalytics_ooxml_automation", "list[ChartChartsDetails]"),
+]
+
+
+def sample_value(models, type_string, depth=0):
+    """ Builds a json value that matches `type_string`, with nested models down to a limited depth """
+    if type_string.startswith('list['):
+        if depth > 2:
+            return []
+        item_type = re.match(r'list\[(.*)\]', type_string).group(1)
+        return [sample_value(models, item_type, depth + 1) for _ in range(3)]
+    if type_string.startswith('dict('):
+        return {}
+    if type_string in ('str',):
+        return "value"
+    if type_string in ('int', 'long'):
+        return 42
+    if type_string == 'float':
+        return 4.2
+    if type_string == 'bool':
+        return True
+    if type_string == 'datetime':
+        return datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc).isoformat()
+    if type_string == 'date':
+        return "2020-01-01"
+    if type_string == 'object':
+        return {"key": "value"}
+    klass = getattr(models, type_string)
+    if depth > 3:
+        return None
+    return {
+        klass.attribute_map[attr]: sample_value(models, attr_type, depth + 1)
+        for attr, attr_type in (klass.openapi_types or {}).items()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=2000, help="number of items in each list response")
+    parser.add_argument("--repeat", type=int, default=5, help="number of timed runs")
+    args = parser.parse_args()
+    for package, response_type in SAMPLES:
+        models = importlib.import_module(package + ".models")
+        api_client_module = importlib.import_module(package + ".api_client")
+        item_type = re.match(r'list\[(.*)\]', response_type).group(1)
+        data = [sample_value(models, item_type) for _ in range(args.count)]
+        generated = api_client_module.ApiClient()
+        plans = presalytics.client.deserializer.DeserializerPlans(package)
+        assert [m.to_dict() for m in plans.decode(data, response_type)] == \
+            [m.to_dict() for m in generated._ApiClient__deserialize(data, response_type)]
+        baseline = min(timeit.repeat(lambda: generated._ApiClient__deserialize(data, response_type), number=1, repeat=args.repeat))
+        compiled = min(timeit.repeat(lambda: plans.decode(data, response_type), number=1, repeat=args.repeat))
+        lazy = min(timeit.repeat(lambda: plans.decode_lazy(data, response_type), number=1, repeat=args.repeat))
+        print("{0:<28} {1:>6} items  generated: {2:8.3f}s  compiled: {3:8.3f}s  speedup: {4:5.1f}x  lazy: {5:8.4f}s".format(
+            response_type, args.count, baseline, compiled, baseline / compiled, lazy))
+
+
+if __name__ == "__main__":
+    main()
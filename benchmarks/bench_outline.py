@@ -0,0 +1,123 @@
+"""
+Compares the single-pass `presalytics.story.outline.OutlineDictConverter` with the previous
+`OutlineBase.to_dict`, which encoded each attribute to json and decoded it again (so nested pages,
+widgets and plugins were encoded once per level of nesting).  Times `to_dict`, `dump` and `export_yaml`
+on an outline with many pages and large widget `data` payloads.  The legacy `export_yaml` uses `yaml.dump`
+with the pure-python emitter.
+
+Usage:
+
+    python benchmarks/bench_outline.py [--pages 500] [--points 2000] [--repeat 3]
+"""
+import argparse
+import datetime
+import os
+import tempfile
+import timeit
+import uuid
+import yaml
+import presalytics.lib.json_codec
+import presalytics.story.outline
+from presalytics.story.util import to_camel_case
+
+
+def legacy_default(obj):
+    if isinstance(obj, presalytics.story.outline.OutlineBase):
+        return legacy_to_dict(obj)
+    raise TypeError("Object of type {0} is not JSON serializable".format(obj.__class__.__name__))
+
+
+def legacy_to_dict(outline):
+    """ The per-attribute json round trip used by `OutlineBase.to_dict` before the single-pass converter """
+    ret = {}
+    for key, val in outline.__dict__.items():
+        if key not in outline.__required__:
+            if isinstance(val, (list, dict)) and len(val) == 0:
+                continue
+        ret[to_camel_case(key)] = presalytics.lib.json_codec.loads(
+            presalytics.lib.json_codec.dumpb(val, default=legacy_default),
+            object_hook=presalytics.story.outline.json_numpy_obj_hook
+        )
+    return ret
+
+
+def legacy_dump(outline):
+    return presalytics.lib.json_codec.dumps(outline, default=legacy_default)
+
+
+def build_outline(pages, points):
+    """ Builds an outline without `OutlineBase.deserialize`, so nested objects are not copied """
+    outline_module = presalytics.story.outline
+    plugin = outline_module.Plugin("script", "mpld3", {"version": "0.3.1"})
+    page_list = []
+    for i in range(pages):
+        widget = outline_module.Widget("widget-{0}".format(i), "matplotlib-responsive", {
+            "figure": {
+                "x": [float(x) for x in range(points)],
+                "y": [x * 0.5 for x in range(points)],
+                "labels": ["label-{0}".format(x) for x in range(points // 10)],
+            },
+            "updated": datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc),
+            "id": uuid.UUID(int=i)
+        })
+        widget.plugins = [plugin]
+        page = outline_module.Page("page-{0}".format(i), "widget-page", None)
+        page.widgets = [widget]
+        page_list.append(page)
+    info = outline_module.Info.__new__(outline_module.Info)
+    info.__dict__.update({
+        "additional_properties": {},
+        "revision": "0",
+        "date_created": datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc),
+        "date_modified": datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc),
+        "created_by": "benchmark",
+        "modified_by": "benchmark",
+        "revision_notes": "benchmark"
+    })
+    outline = outline_module.StoryOutline.__new__(outline_module.StoryOutline)
+    outline.__dict__.update({
+        "additional_properties": {},
+        "outline_version": "0.3.1",
+        "info": info,
+        "pages": page_list,
+        "description": "benchmark",
+        "title": "benchmark",
+        "themes": [],
+        "plugins": [],
+        "story_id": "empty"
+    })
+    return outline
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=500, help="number of pages in the outline")
+    parser.add_argument("--points", type=int, default=2000, help="number of points in each widget's data")
+    parser.add_argument("--repeat", type=int, default=3, help="number of timed runs")
+    args = parser.parse_args()
+    outline = build_outline(args.pages, args.points)
+    assert outline.to_dict() == legacy_to_dict(outline)
+    assert outline.dump() == legacy_dump(outline)
+
+    def timed(func):
+        return min(timeit.repeat(func, number=1, repeat=args.repeat))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "outline.yaml")
+
+        def legacy_export_yaml():
+            with open(filename, 'w') as f:
+                yaml.dump(legacy_to_dict(outline), f)
+
+        results = [
+            ("to_dict", timed(lambda: legacy_to_dict(outline)), timed(outline.to_dict)),
+            ("dump", timed(lambda: legacy_dump(outline)), timed(outline.dump)),
+            ("export_yaml", timed(legacy_export_yaml), timed(lambda: outline.export_yaml(filename))),
+        ]
+    for name, legacy, single_pass in results:
+        print("{0:<12} {1:>5} pages  legacy: {2:8.3f}s  single-pass: {3:8.3f}s  speedup: {4:5.1f}x".format(
+            name, args.pages, legacy, single_pass, legacy / single_pass))
+
+
+if __name__ == "__main__":
+    main()
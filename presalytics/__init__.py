@@ -44,29 +44,34 @@ exchanges infromation with other web APIs that may be proprietary and carry thei
 information on licensing, please contact [inquires@presalytics.io](mailto:inquires@presalytics.io).
 
 """
-import os
-import environs
 import logging
-import pkg_resources
+import threading
+import typing
 import presalytics.lib
-import presalytics.lib.logger
-import presalytics.lib.plugins
-import presalytics.lib.plugins.base
-import presalytics.lib.config_loader
-import presalytics.story
-import presalytics.story.components
+import presalytics.lib.util
+if typing.TYPE_CHECKING:
+    import environs
+    from presalytics.lib.plugins.base import PluginRegistry
+    from presalytics.story.components import ComponentRegistry
 
-env = environs.Env()
-env.read_env()
 
-# A comma-separated list of paths to search of config.py, plugin classes, and component classes
-autodiscover_paths = env.list('AUTODISCOVER_PATHS', [])
+env: 'environs.Env'
+"""
+Instance of `environs.Env` holding the environment variables (including any variables in a `.env` file
+in the current working directory) read by `presalytics.init`.
+"""
 
-CONFIG = presalytics.lib.config_loader.load_config(additional_paths=autodiscover_paths)
+autodiscover_paths: typing.List[str]
+"""
+A list of paths to search for config.py, plugin classes, and component classes.  Read by `presalytics.init`
+from the comma-separated `AUTODISCOVER_PATHS` environment variable.
+"""
+
+CONFIG: typing.Dict
 """
 Nested `dict` containing runtime configuration values for the Presalytics Python Library.
-Typically, these are reuseable values stored in separate file that are loaded when the 
-module in imported via the `import presalytics` command.  This top-level module then
+Typically, these are reuseable values stored in separate file that are loaded the first
+time `CONFIG` is accessed, or when `presalytics.init` is called.  This top-level module then
 runs the `presalytics.lib.config_loader.load_config` method into load values into the
 the `CONFIG` global variable.  Modules through the package use the `CONFIG` variable to
 simplify their API calls store conststants for use throughout the package.  See 
@@ -139,99 +144,267 @@ BROWSER_API_HOST: dict, optional
     deletegates certificate authentication to an external service or in debug/test environments.  
     See for more info: https://developer.mozilla.org/en-US/docs/Web/Security/Mixed_content
 
-The object can also take on values for user-defined extensions, and please consult
-the documentation for those package for those vairables definition.
-"""
+CLIENT_POOL_MAX_SIZE: int, optional
+    Defaults to 32.  The maximum number of `presalytics.client.api.Client` instances held by
+    the process-wide `presalytics.client.pool.ClientPool`.
 
+CLIENT_POOL_IDLE_TIMEOUT: int, optional
+    Defaults to 600.  The number of seconds a pooled `presalytics.client.api.Client` can sit unused 
+    before it is evicted from the `presalytics.client.pool.ClientPool`.
 
+HTTP_POOL_MAXSIZE: int, optional
+    Defaults to 20.  The maximum number of keep-alive connections per host held by the sessions in
+    `presalytics.client.transport`.
 
-file_logger = CONFIG.get("USE_LOGGER", True)
-log_level = CONFIG.get("LOG_LEVEL", logging.DEBUG)
+TOKEN_REFRESH_SKEW: int, optional
+    Defaults to 30.  The number of seconds before expiry that a `presalytics.client.api.Client`
+    that can refresh tokens without user interaction will replace its access token.
 
-presalytics.lib.logger.configure_logger(log_level=log_level, file_logger=file_logger)
+TOKEN_BACKGROUND_REFRESH: int, optional
+    Defaults to 120.  When an access token will expire within this many seconds, the 
+    `presalytics.client.api.Client` refreshes it on a background thread.  Set to 0 to disable.
 
-registry_kwargs = {
-    'show_errors': False,
-    'autodiscover_paths': autodiscover_paths,
-    'reserved_names': CONFIG.get("RESERVED_NAMES", []),
-    'ignore_paths': CONFIG.get("IGNORE_PATHS", [])
-}
+TOKEN_STORE: str, optional
+    Defaults to "file".  The `presalytics.client.token_store.TokenStoreBase` used to cache tokens
+    when `CACHE_TOKENS` is True.  One of "memory", "file" or "sqlite".  The "file" and "sqlite"
+    stores are locked, so they can be shared by worker processes and cron jobs on the same host.
+
+TOKEN_STORE_PATH: str, optional
+    Defaults to "token.json" for the "file" store and "token.sqlite3" for the "sqlite" store.
+
+RESPONSE_CACHE_TTL: int, optional
+    Defaults to 3600.  The number of seconds that responses from the Ooxml Automation service's
+    reference data endpoints (e.g., color types) are cached.  Set to 0 to turn caching off.
+
+RESPONSE_CACHE_MAX_SIZE: int, optional
+    Defaults to 256.  The maximum number of cached responses.
+
+RESPONSE_CACHE_DIR: str, optional
+    Defaults to None.  A directory where cached responses and the ETag and Last-Modified
+    validators of Story service responses are persisted, so they can be reused by later processes
+    (e.g., scripts run by cron).  If None, responses are cached in memory only.
+
+JSON_BACKEND: str, optional
+    Defaults to "orjson" if the orjson package is installed, and "json" otherwise.  The library used
+    to encode and decode json (see `presalytics.lib.json_codec`).
 
-PLUGINS = presalytics.lib.plugins.base.PluginRegistry(**registry_kwargs)
+REGISTRY_INDEX_DIR: str, optional
+    Defaults to a "presalytics" folder in `$XDG_CACHE_HOME` (or ~/.cache).  The directory where the registry
+    index (see `presalytics.lib.registry.get_registry_index`) is cached between processes.  Set to False to
+    disable the cache.
+
+The object can also take on values for user-defined extensions, and please consult
+the documentation for those package for those vairables definition.
+"""
+
+
+
+PLUGINS: 'PluginRegistry'
 """
 Instance of `presalytics.lib.plugins.base.PluginRegistry`.  A container listing the
 Presalytics Library Plugins available and loaded in this environment. This instance is used 
 by `presalytics.story.components.Renderer` subclasses (e.g., `presalytics.story.revealer.Revealer`)
-to write scripts and links into stories.
+to write scripts and links into stories.  Built the first time it is accessed, or when `presalytics.init`
+is called.
 """
 
-COMPONENTS = presalytics.story.components.ComponentRegistry(**registry_kwargs)
+COMPONENTS: 'ComponentRegistry'
 """
 Instance of `presalytics.story.components.ComponentRegistry`.  Registry for Library components and 
 component instances.  A container listing the Presalytics Library components and instances available 
 and loaded in this environment. This instance is used by `presalytics.story.components.Renderer` subclasses 
-(e.g., `presalytics.story.revealer.Revealer`) to convert widgets, pages, and themes into stories.
+(e.g., `presalytics.story.revealer.Revealer`) to convert widgets, pages, and themes into stories.  Built the
+first time it is accessed, or when `presalytics.init` is called.
 """
 
-try:
-    __version__ = pkg_resources.require(presalytics.__name__)[0].version
-except Exception:
-    __version__ = "build"
-
-from presalytics.client.api import Client
-from presalytics.lib.plugins.base import PluginBase
-from presalytics.lib.plugins.external import ApprovedExternalLinks, ApprovedExternalScripts
-from presalytics.lib.plugins.jinja import JinjaPluginMakerMixin
-from presalytics.lib.plugins.local import LocalStylesPlugin
-from presalytics.lib.plugins.matplotlib import Mpld3Plugin
-from presalytics.lib.plugins.ooxml import OoxmlTheme
-from presalytics.lib.plugins.reveal import RevealConfigPlugin
-from presalytics.lib.plugins.reveal_theme import RevealCustomTheme
-from presalytics.lib.plugins.scss import ScssPlugin
-from presalytics.lib.templates.base import (
-    JinjaTemplateBuilder,
-    BootstrapCustomTemplate
-)
-from presalytics.lib.widgets.matplotlib import MatplotlibFigure, MatplotlibResponsiveFigure
-from presalytics.lib.widgets.d3 import (
-    D3Widget
-)
-from presalytics.lib.widgets.chart import ChartWidget
-from presalytics.lib.widgets.data_table import DataTableWidget
-from presalytics.lib.widgets.url import UrlWidget
-from presalytics.lib.widgets.markdown import MarkdownWidget
-from presalytics.lib.widgets.ooxml import (
-    OoxmlWidgetBase,
-    OoxmlFileWidget, 
-    OoxmlEndpointMap,
-    ChartUpdaterWidget,
-    TableUpdaterWidget
-)
-from presalytics.story.outline import StoryOutline
-from presalytics.story.revealer import Revealer
-from presalytics.story.components import WidgetBase, PageTemplateBase, Renderer, ThemeBase
-from presalytics.lib.tools.ooxml_tools import (
-    create_story_from_ooxml_file
-)
-from presalytics.lib.tools.story_tools import story_post_file_bytes
-from presalytics.lib.tools.component_tools import (
-    create_outline_from_page,
-    create_outline_from_widget
-)
-from presalytics.lib.widgets.ooxml_editors import (
-    OoxmlEditorWidget,
-    XmlTransformBase,
-    ChangeShapeColor,
-    TextReplace,
-    MultiXmlTransform
-)
+_INIT_LOCK = threading.RLock()
+_INIT_STAGES: typing.Set[str] = set()
+_INIT_RUNNING: typing.Set[str] = set()
+
+
+def init(force: bool = False):
+    """
+    Initializes the library.  Importing `presalytics` has no side effects, so scripts, command-line tools
+    and servers that want the library's logging call this function once at startup.  `init` runs
+    each step below once per process, and later calls return immediately:
+
+    1. Reads environment variables, including a `.env` file in the current working directory, into `presalytics.env`
+    2. Loads `presalytics.CONFIG` from the first config.py found in the current working directory or `AUTODISCOVER_PATHS`
+    3. Configures the "presalytics" logger, including a file logger in the "log" subfolder of the current
+    working directory if `["USE_LOGGER"]` is True, and installs an exception hook that logs unhandled exceptions
+    4. Builds the `presalytics.PLUGINS` and `presalytics.COMPONENTS` registries
+
+    Steps 1, 2 and 4 also run, without logging, the first time `presalytics.CONFIG`, `presalytics.PLUGINS` or
+    `presalytics.COMPONENTS` is accessed.  Values assigned to these attributes before `init` runs are kept.
+
+    Parameters
+    ----------
+    force : bool, optional
+        Defaults to False.  Runs every step again, replacing any values already loaded.
+    """
+    with _INIT_LOCK:
+        _init_config(force=force)
+        _init_logging(force=force)
+        _init_registries(force=force)
+
+
+def _run_init_stage(stage: str, force: bool) -> bool:
+    """ Caller must hold `_INIT_LOCK`.  Returns True if `stage` should run. """
+    if stage in _INIT_RUNNING:
+        # Re-entered while the stage is running (e.g., a module imported by registry discovery
+        # reads `presalytics.COMPONENTS`), which raises AttributeError as a partial import would
+        return False
+    return force or stage not in _INIT_STAGES
+
+
+def _set_default(name: str, value, force: bool):
+    if force or name not in globals():
+        globals()[name] = value
+
+
+def _init_config(force: bool = False):
+    with _INIT_LOCK:
+        if not _run_init_stage("config", force):
+            return
+        _INIT_RUNNING.add("config")
+        try:
+            import environs
+            import presalytics.lib.config_loader
+            _env = environs.Env()
+            _env.read_env()
+            _set_default("env", _env, force)
+            # A comma-separated list of paths to search of config.py, plugin classes, and component classes
+            _set_default("autodiscover_paths", _env.list('AUTODISCOVER_PATHS', []), force)
+            if force or "CONFIG" not in globals():
+                globals()["CONFIG"] = presalytics.lib.config_loader.load_config(additional_paths=globals()["autodiscover_paths"])
+            _INIT_STAGES.add("config")
+        finally:
+            _INIT_RUNNING.discard("config")
+
+
+def _init_logging(force: bool = False):
+    with _INIT_LOCK:
+        if not _run_init_stage("logging", force):
+            return
+        _init_config()
+        import presalytics.lib.logger
+        file_logger = CONFIG.get("USE_LOGGER", True)
+        log_level = CONFIG.get("LOG_LEVEL", logging.DEBUG)
+        presalytics.lib.logger.configure_logger(log_level=log_level, file_logger=file_logger)
+        presalytics.lib.logger.install_exception_hook()
+        _INIT_STAGES.add("logging")
+
+
+def _init_registries(force: bool = False):
+    with _INIT_LOCK:
+        if not _run_init_stage("registries", force):
+            return
+        _init_config()
+        _INIT_RUNNING.add("registries")
+        try:
+            import presalytics.lib.plugins.base
+            import presalytics.story.components
+            registry_kwargs = {
+                'show_errors': False,
+                'autodiscover_paths': autodiscover_paths,
+                'reserved_names': CONFIG.get("RESERVED_NAMES", []),
+                'ignore_paths': CONFIG.get("IGNORE_PATHS", [])
+            }
+            if force or "PLUGINS" not in globals():
+                globals()["PLUGINS"] = presalytics.lib.plugins.base.PluginRegistry(**registry_kwargs)
+            if force or "COMPONENTS" not in globals():
+                globals()["COMPONENTS"] = presalytics.story.components.ComponentRegistry(**registry_kwargs)
+            _INIT_STAGES.add("registries")
+        finally:
+            _INIT_RUNNING.discard("registries")
+
+
+def _get_version() -> str:
+    try:
+        import importlib.metadata
+        return importlib.metadata.version(__name__)
+    except Exception:
+        return "build"
+
+
+_INIT_ATTRIBUTES = {
+    "env": _init_config,
+    "autodiscover_paths": _init_config,
+    "CONFIG": _init_config,
+    "PLUGINS": _init_registries,
+    "COMPONENTS": _init_registries
+}
+
+# Library classes and functions are imported when they are first accessed, so that
+# `import presalytics` does not load the api clients or heavy dependencies (e.g., pandas, matplotlib)
+_LAZY_IMPORTS = {
+    "Client": "presalytics.client.api",
+    "PluginBase": "presalytics.lib.plugins.base",
+    "ApprovedExternalLinks": "presalytics.lib.plugins.external",
+    "ApprovedExternalScripts": "presalytics.lib.plugins.external",
+    "JinjaPluginMakerMixin": "presalytics.lib.plugins.jinja",
+    "LocalStylesPlugin": "presalytics.lib.plugins.local",
+    "Mpld3Plugin": "presalytics.lib.plugins.matplotlib",
+    "OoxmlTheme": "presalytics.lib.plugins.ooxml",
+    "RevealConfigPlugin": "presalytics.lib.plugins.reveal",
+    "RevealCustomTheme": "presalytics.lib.plugins.reveal_theme",
+    "ScssPlugin": "presalytics.lib.plugins.scss",
+    "JinjaTemplateBuilder": "presalytics.lib.templates.base",
+    "BootstrapCustomTemplate": "presalytics.lib.templates.base",
+    "MatplotlibFigure": "presalytics.lib.widgets.matplotlib",
+    "MatplotlibResponsiveFigure": "presalytics.lib.widgets.matplotlib",
+    "D3Widget": "presalytics.lib.widgets.d3",
+    "ChartWidget": "presalytics.lib.widgets.chart",
+    "DataTableWidget": "presalytics.lib.widgets.data_table",
+    "UrlWidget": "presalytics.lib.widgets.url",
+    "MarkdownWidget": "presalytics.lib.widgets.markdown",
+    "OoxmlWidgetBase": "presalytics.lib.widgets.ooxml",
+    "OoxmlFileWidget": "presalytics.lib.widgets.ooxml",
+    "OoxmlEndpointMap": "presalytics.lib.widgets.ooxml",
+    "ChartUpdaterWidget": "presalytics.lib.widgets.ooxml",
+    "TableUpdaterWidget": "presalytics.lib.widgets.ooxml",
+    "StoryOutline": "presalytics.story.outline",
+    "Revealer": "presalytics.story.revealer",
+    "WidgetBase": "presalytics.story.components",
+    "PageTemplateBase": "presalytics.story.components",
+    "Renderer": "presalytics.story.components",
+    "ThemeBase": "presalytics.story.components",
+    "create_story_from_ooxml_file": "presalytics.lib.tools.ooxml_tools",
+    "story_post_file_bytes": "presalytics.lib.tools.story_tools",
+    "create_outline_from_page": "presalytics.lib.tools.component_tools",
+    "create_outline_from_widget": "presalytics.lib.tools.component_tools",
+    "OoxmlEditorWidget": "presalytics.lib.widgets.ooxml_editors",
+    "XmlTransformBase": "presalytics.lib.widgets.ooxml_editors",
+    "ChangeShapeColor": "presalytics.lib.widgets.ooxml_editors",
+    "TextReplace": "presalytics.lib.widgets.ooxml_editors",
+    "MultiXmlTransform": "presalytics.lib.widgets.ooxml_editors"
+}
+
+_lazy_getattr, _lazy_dir = presalytics.lib.util.lazy_module_attributes(__name__, _LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    if name in _INIT_ATTRIBUTES:
+        _INIT_ATTRIBUTES[name]()
+        try:
+            return globals()[name]
+        except KeyError:
+            raise AttributeError("module '{0}' has no attribute '{1}'".format(__name__, name))
+    if name == "__version__":
+        globals()["__version__"] = _get_version()
+        return globals()["__version__"]
+    return _lazy_getattr(name)
+
 
+def __dir__():
+    return sorted(set(_lazy_dir()) | set(_INIT_ATTRIBUTES.keys()))
 
 
 __all__ = [
     'CONFIG',
     'COMPONENTS',
     'PLUGINS',
+    'init',
     'Client',
     'StoryOutline',
     'Renderer',
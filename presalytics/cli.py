@@ -9,11 +9,13 @@ import argparse
 import presalytics
 import urllib.parse
 import webbrowser
-import yaml
 import json
 import ast
 import datetime
 import presalytics.lib.constants
+import presalytics.lib.exceptions
+import presalytics.lib.yaml_codec
+import presalytics.story.outline
 import presalytics.lib.tools.story_tools
 import presalytics.lib.tools.ooxml_tools
 import presalytics.lib.tools.workflows
@@ -240,6 +242,9 @@ def parse_vars(items):
     return d
 
 def _load_file(filename):
+    if filename.endswith('.zip'):
+        # read into memory rather than memory-mapped, since commands can overwrite the file
+        outline = presalytics.StoryOutline.import_container(filename, mmap_mode=None)
     if filename.endswith('yaml') or filename.endswith('yml'):
         outline = presalytics.StoryOutline.import_yaml(filename)
     if filename.endswith('json'):
@@ -262,7 +267,9 @@ def _open_page(story_id, url_type):
     webbrowser.open_new_tab(url)
 
 def _write(outline, filename, json=False):
-    if json:
+    if filename.endswith('.zip'):
+        outline.export_container(filename)
+    elif json:
         with open(filename, 'w') as f:
             f.write(outline.dump())
     else:
@@ -293,12 +300,13 @@ def main():
     """
     try:
         args = parser.parse_args()
+        presalytics.init()
         filename = args.file
         file_extension = filename.split(".")[-1]
         if file_extension == "yaml" or file_extension == "yml":
             original_file_is_yaml = True
         else:
-            original_file_is_yaml - False
+            original_file_is_yaml = False
         lgs = [logging.getLogger(n) for n in logging.root.manager.loggerDict]
         if args.verbose or args.quiet:
             for lg in lgs:
@@ -494,7 +502,7 @@ def main():
         else:
             logger.error("This outline does not yet have a story_id.  Please run 'presalytics push'.")
             return
-        logger.info("\n\nStory Outline\n-------------\n\n{0}".format(yaml.dump(outline.to_dict())))
+        logger.info("\n\nStory Outline\n-------------\n\n{0}".format(presalytics.lib.yaml_codec.dump(outline.to_dict())))
         if args.cron:
             presalytics.lib.tools.workflows.create_cron_target()
     except Exception as ex:
@@ -10,16 +10,22 @@ import json
 import environs
 import wsgi_microservice_middleware
 import functools
+import hashlib
 import six
 import mimetypes
 import typing
+import threading
 import io
-import time
 import presalytics
 import presalytics.lib.exceptions
 import presalytics.lib.constants as cnst
 import presalytics.client.auth
 import presalytics.client.oidc
+import presalytics.client.transport
+import presalytics.client.polling
+import presalytics.client.token_store
+import presalytics.client.cache
+import presalytics.lib.util
 import presalytics.client.presalytics_ooxml_automation.api_client
 import presalytics.client.presalytics_story.api_client
 import presalytics.client.presalytics_doc_converter.api_client
@@ -28,6 +34,11 @@ from werkzeug.datastructures import FileStorage
 
 logger = logging.getLogger(__name__)
 
+# Imported on first use, because importing the generated ooxml automation api is slow
+__getattr__, __dir__ = presalytics.lib.util.lazy_module_attributes(__name__, {
+    "OoxmlAutomationApi": "presalytics.client.ooxml_automation_api"
+})
+
 env = environs.Env()
 
 
@@ -99,9 +110,20 @@ class Client(object):
         raise an `presalytics.lib.exceptions.InvalidTokenException`.
 
     cache_tokens : bool, optional
-        Defaults to False.  Toggles whether or the client should cache its acquired tokens in file called "token.json"
-        in the current working directory.  Minimizes the number of times a user is required to login.  Set to False
-        in multi-user environments.
+        Defaults to False.  Toggles whether or the client should cache its acquired tokens in a token store (by default,
+        a file called "token.json" in the current working directory).  Minimizes the number of times a user is required to login.
+        Tokens are stored under a key built from the `username` and `client_id`, so a file or sqlite store can be
+        shared by multiple users, worker processes and cron jobs.  Clients that are passed a token without a
+        username do not cache tokens.
+
+    lazy_models : bool, optional
+        Defaults to False.  If True, api responses are returned as lazy, dict-backed models that decode each attribute
+        when it is first read (see `presalytics.client.deserializer.LazyModelMixIn`).  The `to_dict` method of a lazy model
+        returns the response's json `dict`, with the api's json keys and undecoded values, until the model is modified.
+
+    token_store : presalytics.client.token_store.TokenStoreBase, optional
+        Defaults to None.  The store used to cache tokens when `cache_tokens` is True.  If None, the store is set from
+        `presalytics.CONFIG` keywords `["TOKEN_STORE"]` ("memory", "file" or "sqlite") and `["TOKEN_STORE_PATH"]`.
 
     Attributes
     ----------
@@ -133,7 +155,7 @@ class Client(object):
         an authentication and request processing middleware layer to the default sub package 
         built via code generatation.
 
-    ooxml_automation : presalytics.client.presalytics_ooxml_automation.api.default_api.DefaultApi
+    ooxml_automation : presalytics.client.api.OoxmlAutomationApi
         Interface to the Presalytics API Ooxml Automation service.  The object contains methods that enable
         the client to make api calls that return deserialized objects from the Presalytics API,
         simplying user and developer interaction with the Presaltytics API.  API calls can be generated
@@ -206,12 +228,30 @@ class Client(object):
         The duration (in seconds) between attempts to acquire a token after browser-based authentication. Defaults
         to 5 seconds.        
 
+    session : presalytics.client.transport.ClientSession
+        A keep-alive, connection-pooled `requests.Session` that attaches this client's authorization
+        and request id headers to each request.  Use for raw calls to Presalytics API endpoints
+        that are not covered by the generated service interfaces (e.g., svg and xml endpoints).
+
+    token_refresh_skew : int
+        Defaults to 30 seconds.  When the client can refresh tokens without user interaction, access tokens
+        are refreshed this many seconds before they expire. Set from `presalytics.CONFIG` with keyword `["TOKEN_REFRESH_SKEW"]`.
+
+    token_background_refresh : int
+        Defaults to 120 seconds.  When an access token will expire within this many seconds, the client refreshes 
+        it on a background thread while api calls continue with the current token.  Set to 0 to disable.  Set from
+        `presalytics.CONFIG` with keyword `["TOKEN_BACKGROUND_REFRESH"]`.
+
     login_timeout : int
         Defaults to 60 seconds.  The amount of time the client will attempt to acquire a token after the 
         https://presalytics.io authenicates a user. Raises a `presalytics.lib.exceptions.LoginTimeout`
         if the user has not authenticated by the time the interval has expired.
 
     """
+    DEFAULT_TOKEN_REFRESH_SKEW = 30
+
+    DEFAULT_TOKEN_BACKGROUND_REFRESH = 120
+
     def __init__(
             self,
             username=None,
@@ -221,6 +261,7 @@ class Client(object):
             cache_tokens=False,
             client_id=None,
             client_secret=None,
+            token_store=None,
             **kwargs):
     
         if username:
@@ -274,13 +315,19 @@ class Client(object):
             self._delegate_login = True
         else:
             self._delegate_login = False
+        self.token_refresh_skew = presalytics.CONFIG.get("TOKEN_REFRESH_SKEW", self.DEFAULT_TOKEN_REFRESH_SKEW)
+        self.token_background_refresh = presalytics.CONFIG.get("TOKEN_BACKGROUND_REFRESH", self.DEFAULT_TOKEN_BACKGROUND_REFRESH)
+        self._refresh_lock = threading.Lock()
         self.oidc = presalytics.client.oidc.OidcClient(
             client_id=self.client_id,
             client_secret=self.client_secret
         )
         if presalytics.CONFIG.get("CACHE_TOKENS", None):
             cache_tokens = presalytics.CONFIG.get("CACHE_TOKENS")
-        self.token_util = presalytics.client.auth.TokenUtil(token_cache=cache_tokens)
+        store_key = self.get_token_store_key()
+        if store_key is None:
+            cache_tokens = False
+        self.token_util = presalytics.client.auth.TokenUtil(token_cache=cache_tokens, token_store=token_store, store_key=store_key)
         if token:
             #  Assume if token is passed as string, then it's an access token
             if isinstance(token, str):
@@ -299,14 +346,32 @@ class Client(object):
                 self.token_util._put_token_file()
         if not self._delegate_login:
             self.token_util.token = self.refresh_token()
+        self.session = presalytics.client.transport.ClientSession(self)
+        self.init_api_clients(**kwargs)
 
+    def init_api_clients(self, **kwargs):
+        """
+        Builds the `doc_converter`, `ooxml_automation` and `story` service interfaces.  Subclasses
+        (e.g., `presalytics.client.async_api.AsyncClient`) override this method to swap in
+        api clients with a different transport.
+        """
         doc_converter_api_client = DocConverterApiClientWithAuth(self, **kwargs)
         self.doc_converter = presalytics.client.presalytics_doc_converter.DefaultApi(api_client=doc_converter_api_client)
         ooxml_automation_api_client = OoxmlAutomationApiClientWithAuth(self, **kwargs)
-        self.ooxml_automation = presalytics.client.presalytics_ooxml_automation.DefaultApi(api_client=ooxml_automation_api_client)
+        self.ooxml_automation = presalytics.client.api.OoxmlAutomationApi(api_client=ooxml_automation_api_client)
         story_api_client = StoryApiClientWithAuth(self, **kwargs)
         self.story = presalytics.client.presalytics_story.DefaultApi(api_client=story_api_client)
 
+    def get_token_store_key(self) -> typing.Optional[str]:
+        """
+        Returns the key for this client's tokens in the token store, or None if the client
+        cannot be tied to a single user (i.e., it was passed a token without a username)
+        """
+        username = getattr(self, 'username', None)
+        if not username and not self.confidential_client:
+            return None
+        return presalytics.client.token_store.get_token_store_key(username, self.client_id)
+
     def login(self):
         """
         Triggers a an attempt to acquire an API token based on the the client configuration
@@ -318,33 +383,91 @@ class Client(object):
         self.token_util.process_token(token)
         return self.token_util.token
 
+    def can_refresh_silently(self) -> bool:
+        """
+        Indicates whether this client can acquire a new access token without user interaction
+        """
+        if self.token_util.token.get('refresh_token', None) and self.client_secret:
+            return True
+        return self.direct_grant or self.confidential_client
+
+    def is_token_expired(self) -> bool:
+        """
+        Indicates whether the access token needs to be replaced before the next api call.  When the
+        client can refresh tokens silently, tokens are treated as expired `token_refresh_skew` seconds early.
+        """
+        skew = self.token_refresh_skew if self.can_refresh_silently() else 0
+        return self.token_util.is_api_access_token_expired(skew)
 
     def refresh_token(self):
         """
         Obtains a new access token if the access token is expired. if refresh token is expired, 
         this method prompt user to re-authenticate when `delegate_login` is `False` or raise
         an `presalytics.lib.exceptions.InvalidTokenException` when `deletegate_login` is True.
+
+        Only one refresh runs at a time: concurrent callers wait for the refresh in flight and
+        then use its token.  If the access token will expire within `token_background_refresh`
+        seconds, a refresh is started on a background thread and the current token is returned.
         """
-        if self.token_util.is_api_access_token_expired():
-            if self.token_util.token.get('refresh_token', None) and self.client_secret:
-                refresh_token = self.token_util.token["refresh_token"]
-                token = self.oidc.refresh_token(refresh_token)
-                self.token_util.process_token(token)
-                logger.debug("Refresh token granted successfully.")
-            else:
-                if self.direct_grant:
-                    token = self.oidc.token(username=self.username, password=self.password)
-                elif self.confidential_client:
-                    token = self.oidc.client_credentials_token()
-                elif self._delegate_login:
-                    raise presalytics.lib.exceptions.ApiError("Unauthorized. Token has expired", status_code=401)
-                else:
-                    token = self.oidc.token(username=self.username)
-                self.token_util.process_token(token)
-            if self.token_util.token_cache:
-                self.token_util._put_token_file()
+        if self.is_token_expired():
+            with self._refresh_lock:
+                if self.is_token_expired():
+                    self._acquire_token()
+        elif self.token_background_refresh and self.can_refresh_silently():
+            if self.token_util.is_api_access_token_expired(self.token_background_refresh):
+                self._start_background_refresh()
         return self.token_util.token
 
+    def _start_background_refresh(self):
+        if not self._refresh_lock.acquire(blocking=False):
+            return  # a refresh is already in flight
+
+        def refresh():
+            try:
+                if self.token_util.is_api_access_token_expired(self.token_background_refresh):
+                    self._acquire_token()
+            except Exception as ex:
+                logger.exception(ex)
+            finally:
+                self._refresh_lock.release()
+
+        thread = threading.Thread(target=refresh, name="presalytics-token-refresh", daemon=True)
+        thread.start()
+
+    def force_refresh_token(self, rejected_token: str = None):
+        """
+        Obtains a new access token even if the current one has not expired (e.g., after an api call
+        was rejected with a 401 status).  If `rejected_token` is passed and another caller has already
+        replaced it, the current token is kept.
+        """
+        with self._refresh_lock:
+            if rejected_token is None or self.token_util.token.get("access_token", None) == rejected_token:
+                self._acquire_token(rejected_token=self.token_util.token.get("access_token", None))
+        return self.token_util.token
+
+    def _acquire_token(self, rejected_token: str = None):
+        # Another process sharing the token store may already have refreshed this user's token
+        if self.token_util.reload() and not self.is_token_expired() and self.token_util.token.get("access_token", None) != rejected_token:
+            logger.debug("Valid token loaded from token store.")
+            return
+        if self.token_util.token.get('refresh_token', None) and self.client_secret:
+            refresh_token = self.token_util.token["refresh_token"]
+            token = self.oidc.refresh_token(refresh_token)
+            self.token_util.process_token(token)
+            logger.debug("Refresh token granted successfully.")
+        else:
+            if self.direct_grant:
+                token = self.oidc.token(username=self.username, password=self.password)
+            elif self.confidential_client:
+                token = self.oidc.client_credentials_token()
+            elif self._delegate_login:
+                raise presalytics.lib.exceptions.ApiError("Unauthorized. Token has expired", status_code=401)
+            else:
+                token = self.oidc.token(username=self.username)
+            self.token_util.process_token(token)
+        if self.token_util.token_cache:
+            self.token_util._put_token_file()
+
     def get_auth_header(self):
         """
         Creates a JWT Bearer Authorization token header
@@ -359,6 +482,44 @@ class Client(object):
         }
         return auth_header
 
+    def get_token_claims(self) -> typing.Dict:
+        """
+        Returns the validated claims of the current access token.  Claims are memoized by
+        `presalytics.client.oidc.OidcClient.validate_token` until the token expires, so repeated
+        calls (e.g., once per widget during a render) do not decode the token again.
+
+        Returns
+        ----------
+        A `dict` of the access token's claims
+        """
+        self.refresh_token()
+        return self.oidc.validate_token(self.token_util.token["access_token"])
+
+    def get_user_id(self) -> typing.Optional[str]:
+        """
+        Returns the Presalytics API user id from the current access token's claims
+        """
+        return self.get_token_claims().get(self.oidc.USER_ID_CLAIM, None)
+
+    def get_cache_user_key(self) -> str:
+        """
+        Returns a stable key for the user whose responses this client caches (e.g., the validators and
+        stories cached by `presalytics.client.api.StoryApiClientWithAuth`).  Uses the token store key
+        when the client is tied to a username.  Otherwise (e.g., the client was passed a token), uses a hash
+        of the access token's `sub` claim, or of the access token itself if its claims cannot be validated.
+        """
+        key = self.get_token_store_key()
+        if key:
+            return key
+        try:
+            subject = self.get_token_claims().get("sub", None)
+        except Exception as ex:
+            logger.debug("Could not read access token claims for the response cache key: {0}".format(ex))
+            subject = None
+        if subject:
+            return "sub:" + hashlib.sha256(str(subject).encode('utf-8')).hexdigest()
+        return "token:" + hashlib.sha256(self.token_util.token["access_token"].encode('utf-8')).hexdigest()
+
     def get_request_id_header(self):
         """
         Creates an 'X-Request-Id' token header for tracing requests through Presalytics API
@@ -378,10 +539,29 @@ class Client(object):
         }
         return header
 
-    def download_file(self, story_id, ooxml_automation_id, download_folder=None, filename=None, **kwargs):
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024
+    DOWNLOAD_MAX_RESUMES = 5
+    PARTIAL_DOWNLOAD_SUFFIX = ".part"
+
+    def download_file(self,
+                      story_id,
+                      ooxml_automation_id,
+                      download_folder=None,
+                      filename=None,
+                      checksum: str = None,
+                      checksum_algorithm: str = "sha256",
+                      chunk_size: int = None,
+                      max_resumes: int = None,
+                      **kwargs) -> str:
         """
         Downloads an updated Ooxml Automation file and places the file in a designated folder
 
+        The file is streamed to disk in chunks of `chunk_size` bytes, so memory use does not grow with
+        the size of the file.  Bytes are written to a ".part" file that is renamed when the download
+        completes.  If the connection drops, the download resumes from the last byte received with
+        an HTTP Range request.  If `filename` is passed, a ".part" file left by an earlier, interrupted
+        call is resumed as well.
+
         Parameters
         ---------
         story : str
@@ -397,17 +577,103 @@ class Client(object):
         filename: str, optional
             The name of the downloaded file. Defaults to the original filename the the object was created.
 
+        checksum : str, optional
+            Defaults to None.  The expected hex digest of the file.  If the digest of the downloaded file does
+            not match, the file is deleted and a `presalytics.lib.exceptions.ChecksumMismatch` is raised.
+
+        checksum_algorithm : str, optional
+            Defaults to "sha256".  Any algorithm name accepted by `hashlib.new`.
+
+        chunk_size : int, optional
+            Defaults to 64 KB.  The number of bytes read from the connection at a time.
+
+        max_resumes : int, optional
+            Defaults to 5.  The number of times the download is resumed after a dropped connection.
+
+        Returns
+        ----------
+        The path to the downloaded file
         """
-        response, status, headers = self.story.story_id_file_ooxmlautomationid_get_with_http_info(story_id, ooxml_automation_id, _preload_content=False)
+        chunk_size = chunk_size or self.DOWNLOAD_CHUNK_SIZE
+        max_resumes = self.DOWNLOAD_MAX_RESUMES if max_resumes is None else max_resumes
         if download_folder is None:
             download_folder = os.getcwd()
-        if filename is None:
-            cd_header = headers.get('Content-Disposition')
-            _, params = cgi.parse_header(cd_header)
-            filename = params["filename"]
-        filepath = os.path.join(download_folder, filename)
-        with open(filepath, 'wb') as f:
-            f.write(response.data)
+        api_client = self.story.api_client
+        url = api_client.configuration.host + '/{0}/file/{1}'.format(
+            urllib.parse.quote(str(story_id), safe=''),
+            urllib.parse.quote(str(ooxml_automation_id), safe='')
+        )
+        hasher = hashlib.new(checksum_algorithm) if checksum else None
+        filepath = os.path.join(download_folder, filename) if filename else None
+        received = 0
+        if filepath and os.path.exists(filepath + self.PARTIAL_DOWNLOAD_SUFFIX):
+            received = self._hash_file(filepath + self.PARTIAL_DOWNLOAD_SUFFIX, hasher, chunk_size)
+        validator = None
+        total = None
+        resumes = 0
+        while True:
+            headers = dict(api_client.default_headers)
+            if received:
+                headers["Range"] = "bytes={0}-".format(received)
+                if validator:
+                    headers["If-Range"] = validator
+            try:
+                with self.session.get(url, headers=headers, stream=True) as response:
+                    if response.status_code == 416 and received:
+                        break  # the partial file is already complete
+                    if not 200 <= response.status_code <= 299:
+                        raise presalytics.lib.exceptions.ApiError(message=response.content, status_code=response.status_code)
+                    if filepath is None:
+                        _, params = cgi.parse_header(response.headers.get('Content-Disposition'))
+                        filepath = os.path.join(download_folder, params["filename"])
+                    if response.status_code != 206 and received:
+                        logger.debug("Server ignored range request.  Restarting download of {0}".format(filepath))
+                        received = 0
+                        hasher = hashlib.new(checksum_algorithm) if checksum else None
+                    validator = validator or response.headers.get("ETag", None) or response.headers.get("Last-Modified", None)
+                    content_length = response.headers.get("Content-Length", None)
+                    if content_length is not None:
+                        total = received + int(content_length)
+                    mode = 'ab' if received else 'wb'
+                    with open(filepath + self.PARTIAL_DOWNLOAD_SUFFIX, mode) as f:
+                        for chunk in response.iter_content(chunk_size=chunk_size):
+                            f.write(chunk)
+                            if hasher:
+                                hasher.update(chunk)
+                            received += len(chunk)
+                if total is None or received >= total:
+                    break
+                raise requests.exceptions.ChunkedEncodingError("Connection closed after {0} of {1} bytes".format(received, total))
+            except (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError, requests.exceptions.Timeout) as ex:
+                resumes += 1
+                if resumes > max_resumes:
+                    raise
+                logger.warning("Download interrupted after {0} bytes ({1}).  Resuming.".format(received, ex))
+        if hasher and hasher.hexdigest().lower() != checksum.lower():  # type: ignore
+            os.remove(filepath + self.PARTIAL_DOWNLOAD_SUFFIX)  # type: ignore
+            message = "Checksum mismatch for {0}: expected {1}, received {2}".format(filepath, checksum, hasher.hexdigest())
+            raise presalytics.lib.exceptions.ChecksumMismatch(message=message)
+        os.replace(filepath + self.PARTIAL_DOWNLOAD_SUFFIX, filepath)  # type: ignore
+        return filepath  # type: ignore
+
+    @staticmethod
+    def _hash_file(path, hasher, chunk_size) -> int:
+        size = 0
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                if hasher:
+                    hasher.update(chunk)
+                size += len(chunk)
+        return size
+
+    def close(self):
+        """
+        Releases the connections held by this client's api clients.  Called by
+        `presalytics.client.pool.ClientPool` when a pooled client is evicted.
+        """
+        for api in [self.doc_converter, self.ooxml_automation, self.story]:
+            api.api_client.rest_client.pool_manager.clear()
+        self.session.close()
 
     def get_client_info(self):
         """
@@ -429,62 +695,83 @@ class Client(object):
             "delegate_login": self._delegate_login
         }
 
-    STATUS_REPOLL_SECONDS = 2
-    STATUS_REPOLL_MAX_CYCLES = 20
+    STATUS_POLL_DEADLINE = 600
+
+    def get_poller(self, status_repoll_seconds: float = None, repoll_max_cycles: int = None, deadline: float = None):
+        """
+        Builds a `presalytics.client.polling.Poller` for waiting on story processing tasks
+
+        Parameters
+        ----------
+        status_repoll_seconds : float, optional
+            The wait before the first status recheck.  Subsequent waits back off exponentially.
+
+        repoll_max_cycles : int, optional
+            Retained for backwards compatibility.  If passed without a `deadline`, the deadline is set to
+            `status_repoll_seconds` multiplied by `repoll_max_cycles`.
+
+        deadline : float, optional
+            Defaults to 600.  The number of seconds to wait before raising a `presalytics.lib.exceptions.PollingTimeout`.
+        """
+        if deadline is None:
+            if repoll_max_cycles:
+                deadline = (status_repoll_seconds or presalytics.client.polling.Poller.DEFAULT_MAX_INTERVAL) * repoll_max_cycles
+            else:
+                deadline = self.STATUS_POLL_DEADLINE
+        return presalytics.client.polling.Poller(initial_interval=status_repoll_seconds, deadline=deadline)
 
     def upload_file_and_await_outline(self, 
-                                      file: typing.Union[FileStorage, str],
+                                      file: typing.Union[FileStorage, str, 'presalytics.client.multipart.FilePart'],
                                       include_relationships=True,
-                                      status_repoll_seconds: int = None, 
-                                      repoll_max_cycles: int = None):
-        """ Useful for testing """
-        if type(file) is str:
-            content_type = mimetypes.guess_type(file, False)[0] # type: ignore
-            with open(file, 'rb') as f:  # type: ignore
-                stream = io.BytesIO(f.read())
-            file = FileStorage(
-                stream=stream,  # type: ignore
-                filename=file,  # type: ignore
-                content_type=content_type,
-                content_length=stream.__sizeof__()             
-            )
-        if not status_repoll_seconds:
-            status_repoll_seconds = self.STATUS_REPOLL_SECONDS
-        if not repoll_max_cycles:
-            repoll_max_cycles = self.STATUS_REPOLL_MAX_CYCLES
+                                      status_repoll_seconds: float = None, 
+                                      repoll_max_cycles: int = None,
+                                      deadline: float = None):
+        """
+        Uploads a file, waits for its outline to be processed and returns the new story.  Files are
+        streamed from disk (or from the `werkzeug.datastructures.FileStorage` stream) in chunks rather
+        than read into memory.  Pass a `presalytics.client.multipart.FilePart` to track upload progress.
+        """
         story = self.story.story_post_file(file=file)
-        self.await_outline(story.id)
+        self.await_outline(story.id, status_repoll_seconds, repoll_max_cycles, deadline)
         return self.story.story_id_get(story.id, include_outline=True, include_relationships=include_relationships)
 
     def await_outline(self,
                       story_id,
-                      status_repoll_seconds: int = None, 
-                      repoll_max_cycles: int = None):
-        task_running = True
-        repoll_cycle_count = 0
-        if not status_repoll_seconds:
-            status_repoll_seconds = self.STATUS_REPOLL_SECONDS
-        if not repoll_max_cycles:
-            repoll_max_cycles = self.STATUS_REPOLL_MAX_CYCLES
-        while task_running:
-            status, status_code, _ = self.story.story_id_status_get_with_http_info(story_id)
-            if status_code == 204:
-                task_running = False
-            elif status_code == 200:
-                if status.status == "SUCCESS":
-                    task_running = False
-                elif repoll_cycle_count >= repoll_max_cycles:
-                    raise presalytics.lib.exceptions.ApiError(message="Error occured while uploading file", status_code=500)
-                else:
-                    logger.info("Story creation task still running.  Rechecking status in {0} seconds".format(status_repoll_seconds))
-                    time.sleep(status_repoll_seconds)
-                    repoll_cycle_count += 1
-        return self.story.story_id_outline_get(story_id)
+                      status_repoll_seconds: float = None, 
+                      repoll_max_cycles: int = None,
+                      deadline: float = None):
+        """
+        Waits for the Story API to finish processing a story's outline and returns the outline.
+        See `presalytics.client.api.Client.get_poller` for the polling parameters.
+        """
+        poller = self.get_poller(status_repoll_seconds, repoll_max_cycles, deadline)
+        return poller.wait(story_id, self._check_outline)
 
+    def await_outlines(self, story_ids: typing.Iterable[str], deadline: float = None):
+        """
+        Waits on many stories at once.  Pending stories are rechecked together with exponential backoff,
+        so batch uploads can be tracked with far fewer requests than awaiting each story in turn.
 
+        Parameters
+        ----------
+        story_ids : iterable of str
+            The ids of the stories to wait on
+
+        deadline : float, optional
+            Defaults to 600.  The number of seconds to wait before raising a `presalytics.lib.exceptions.PollingTimeout`.
+
+        Returns
+        ----------
+        An iterator of (story_id, outline) `tuple` objects, in order of completion
+        """
+        return self.get_poller(deadline=deadline).poll(story_ids, self._check_outline)
+
+    def _check_outline(self, story_id):
+        status, status_code, _ = self.story.story_id_status_get_with_http_info(story_id)
+        if status_code == 204 or (status_code == 200 and status.status == "SUCCESS"):
+            return True, self.story.story_id_outline_get(story_id)
+        return False, None
 
-                
-        
 
 class DocConverterApiClientWithAuth(presalytics.client.auth.AuthenticationMixIn, presalytics.client.presalytics_doc_converter.api_client.ApiClient):
     """
@@ -505,31 +792,165 @@ class OoxmlAutomationApiClientWithAuth(presalytics.client.auth.AuthenticationMix
     """
     Wraps `presalytics.client.presalytics_ooxml_automation.api_client.ApiClient` with
     `presalytics.client.auth.AuthenticationMixIn` middleware
+
+    The responses of "type table" operations (e.g., `shared_colortypes_get`, `chart_axisdatatypes_get`,
+    `documents_documenttype_get_id`) are static reference data, so they are served from a
+    `presalytics.client.cache.ResponseCache` shared by all clients in the process.  The cache's
+    lifetime, size and location are set from `presalytics.CONFIG` with keywords `["RESPONSE_CACHE_TTL"]`,
+    `["RESPONSE_CACHE_MAX_SIZE"]` and `["RESPONSE_CACHE_DIR"]`.  Set `RESPONSE_CACHE_TTL` to 0 to turn caching off.
     """
-    def __init__(self, parent: Client, **kwargs):
+    CACHEABLE_RESOURCES = frozenset([
+        '/Charts/AxisDataTypes',
+        '/Charts/PlotType',
+        '/Charts/RowNameFormatTypes',
+        '/Documents/DocumentType',
+        '/Shared/ColorTypes',
+        '/Shared/DashTypes',
+        '/Shared/EffectTypes',
+        '/Shared/FillTypes',
+        '/Shared/LineEndSizes',
+        '/Shared/LineEndTypes',
+        '/Slides/GraphicTypes',
+        '/Slides/GroupElementTypes',
+        '/Themes/Intensity'
+    ])
+
+    CACHEABLE_PATHS = frozenset(
+        [r + suffix for r in CACHEABLE_RESOURCES for suffix in ['', '/{id}', '/TypeId/{type_id}']]
+    )
+
+    def __init__(self, parent: Client, response_cache=None, **kwargs):
         presalytics.client.auth.AuthenticationMixIn.__init__(self, parent, **kwargs)
         presalytics.client.presalytics_ooxml_automation.api_client.ApiClient.__init__(self)
         self.update_configuration()
+        self.response_cache = response_cache or presalytics.client.cache.get_response_cache(self.api_name)
 
     @property
     def api_name(self):
         return 'ooxml-automation'
 
+    def is_cacheable(self, resource_path, method, async_req=None, _preload_content=None) -> bool:
+        """
+        Indicates whether the response to a call can be served from the response cache
+        """
+        if method != 'GET' or resource_path not in self.CACHEABLE_PATHS:
+            return False
+        if async_req or _preload_content is False:
+            return False
+        return bool(self.response_cache.ttl != 0)
+
+    def call_api(
+            self, resource_path, method,
+            path_params=None, query_params=None, header_params=None,
+            body=None, post_params=None, files=None,
+            response_type=None, auth_settings=None, async_req=None,
+            _return_http_data_only=None, collection_formats=None,
+            _preload_content=None, _request_timeout=None, _host=None):
+        call_args = (
+            resource_path, method, path_params, query_params, header_params, body, post_params, files,
+            response_type, auth_settings, async_req, _return_http_data_only, collection_formats,
+            _preload_content, _request_timeout, _host
+        )
+        if not self.is_cacheable(resource_path, method, async_req, _preload_content):
+            return super(OoxmlAutomationApiClientWithAuth, self).call_api(*call_args)
+        key = self.response_cache.make_key(
+            _host or self.configuration.host,
+            resource_path,
+            sorted((path_params or {}).items()),
+            sorted(query_params or []),
+            response_type,
+            bool(_return_http_data_only),
+            self.lazy_models
+        )
+        response = self.response_cache.get(key, None)
+        if response is None:
+            response = super(OoxmlAutomationApiClientWithAuth, self).call_api(*call_args)
+            if not self.is_error_response(response):
+                self.response_cache.set(key, response)
+        else:
+            logger.debug("Serving {0} {1} from response cache".format(method, resource_path))
+        return response
+
 
 class StoryApiClientWithAuth(presalytics.client.auth.AuthenticationMixIn, presalytics.client.presalytics_story.api_client.ApiClient):
     """
     Wraps `presalytics.client.presalytics_story.api_client.ApiClient` with
     `presalytics.client.auth.AuthenticationMixIn` middleware
+
+    GET requests are conditional: the `ETag` and `Last-Modified` validators of each response are stored
+    with the deserialized model in a `presalytics.client.cache.ResponseCache`, and sent back as `If-None-Match`
+    and `If-Modified-Since` headers on the next request for the same resource.  When the service responds
+    with 304 (Not Modified), a copy of the cached model is returned without downloading or decoding the resource.
+    Validators are persisted to disk when `presalytics.CONFIG` has a `["RESPONSE_CACHE_DIR"]` keyword.
     """
-    def __init__(self, parent: Client, **kwargs):
+    def __init__(self, parent: Client, validator_cache=None, **kwargs):
         presalytics.client.auth.AuthenticationMixIn.__init__(self, parent, **kwargs)
         presalytics.client.presalytics_story.api_client.ApiClient.__init__(self)
         self.update_configuration()
+        self.validator_cache = validator_cache or presalytics.client.cache.get_response_cache(self.api_name, ttl=None)
 
     @property
     def api_name(self):
         return 'story'
 
+    def call_api(
+            self, resource_path, method,
+            path_params=None, query_params=None, header_params=None,
+            body=None, post_params=None, files=None,
+            response_type=None, auth_settings=None, async_req=None,
+            _return_http_data_only=None, collection_formats=None,
+            _preload_content=None, _request_timeout=None, _host=None):
+        base_call_api = super(StoryApiClientWithAuth, self).call_api
+        if method != 'GET' or async_req or _preload_content is False:
+            return base_call_api(
+                resource_path, method, path_params, query_params, header_params, body, post_params, files,
+                response_type, auth_settings, async_req, _return_http_data_only, collection_formats,
+                _preload_content, _request_timeout, _host
+            )
+        key = self.validator_cache.make_key(
+            _host or self.configuration.host,
+            self.get_parent().get_cache_user_key(),
+            resource_path,
+            sorted((path_params or {}).items()),
+            sorted(query_params or []),
+            response_type,
+            self.lazy_models
+        )
+        entry = self.validator_cache.get(key, None)
+        header_params = dict(header_params or {})
+        if entry:
+            if entry["etag"]:
+                header_params["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                header_params["If-Modified-Since"] = entry["last_modified"]
+        try:
+            response = base_call_api(
+                resource_path, method, path_params, query_params, header_params, body, post_params, files,
+                response_type, auth_settings, async_req, False, collection_formats,
+                _preload_content, _request_timeout, _host
+            )
+        except presalytics.lib.exceptions.ApiException as ex:
+            if entry and getattr(ex, "status", None) == 304:
+                response = (None, 304, getattr(ex, "headers", None))
+            else:
+                raise
+        data, status, headers = response
+        if status == 304 and entry:
+            logger.debug("{0} not modified.  Returning cached response.".format(resource_path))
+            data = entry["data"]
+        elif status == 304 or self.is_error_response(response):
+            return response
+        else:
+            etag = headers.get("ETag", None) if headers else None
+            last_modified = headers.get("Last-Modified", None) if headers else None
+            if etag or last_modified:
+                self.validator_cache.set(key, {"etag": etag, "last_modified": last_modified, "data": data})
+            elif entry:
+                self.validator_cache.delete(key)
+        if _return_http_data_only:
+            return data
+        return data, status, headers
+
 
 @functools.lru_cache(maxsize=None)
 def get_client():
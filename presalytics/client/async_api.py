@@ -0,0 +1,484 @@
+import asyncio
+import cgi
+import json
+import logging
+import os
+import re
+import ssl
+import typing
+import certifi
+from six.moves.urllib.parse import quote, urlencode
+import presalytics
+import presalytics.lib.exceptions
+import presalytics.client.api
+import presalytics.client.auth
+import presalytics.client.multipart
+import presalytics.client.presalytics_doc_converter
+import presalytics.client.presalytics_doc_converter.api_client
+import presalytics.client.presalytics_doc_converter.rest
+import presalytics.client.presalytics_ooxml_automation
+import presalytics.client.presalytics_ooxml_automation.api_client
+import presalytics.client.presalytics_ooxml_automation.rest
+import presalytics.client.presalytics_story
+import presalytics.client.presalytics_story.api_client
+import presalytics.client.presalytics_story.rest
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncRESTResponse(object):
+    """
+    Response container with the same interface as the generated `rest.RESTResponse`, so
+    responses received via `aiohttp` can be passed to `ApiClient.deserialize` and `ApiException`
+    """
+    def __init__(self, status, reason, data, headers):
+        self.status = status
+        self.reason = reason
+        self.data = data
+        self.headers = headers
+
+    def getheaders(self):
+        """Returns a dictionary of the response headers."""
+        return self.headers
+
+    def getheader(self, name, default=None):
+        """Returns a given response header."""
+        return self.headers.get(name, default)
+
+
+class AsyncAuthenticationMixIn(presalytics.client.auth.AuthenticationMixIn):
+    """
+    Extends `presalytics.client.auth.AuthenticationMixIn` so that `call_api` is a coroutine
+    that sends requests over the `aiohttp.ClientSession` shared by the parent
+    `presalytics.client.async_api.AsyncClient`.  Because the generated `DefaultApi` methods
+    return the result of `call_api`, every generated operation becomes awaitable.
+
+    Request preparation mirrors the generated `ApiClient.__call_api`, and responses are
+    deserialized by the generated `ApiClient.deserialize`.
+    """
+    rest_module: typing.Any = None
+
+    async def call_api(
+            self, resource_path, method,
+            path_params=None, query_params=None, header_params=None,
+            body=None, post_params=None, files=None,
+            response_type=None, auth_settings=None, async_req=None,
+            _return_http_data_only=None, collection_formats=None,
+            _preload_content=True, _request_timeout=None, _host=None):
+        """
+        Coroutine version of `presalytics.client.auth.AuthenticationMixIn.call_api`. `async_req` is ignored.
+        """
+        parent = self.get_parent()
+        auth_header = await parent.get_auth_header_async()
+        if header_params is not None:
+            header_params.update(auth_header)
+        else:
+            header_params = auth_header
+        if not header_params.get("X-Request-Id"):
+            header_params.update(parent.get_request_id_header())
+        request_id = header_params.get("X-Request-Id")
+        call_args = (
+            resource_path,
+            method,
+            path_params,
+            query_params,
+            header_params,
+            body,
+            post_params,
+            files,
+            response_type,
+            auth_settings,
+            _return_http_data_only,
+            collection_formats,
+            _preload_content,
+            _request_timeout,
+            _host
+        )
+        endpoint = self.configuration.host + resource_path
+        try:
+            logger.info("Sending {0} message to {1}. Request Id: {2}".format(method, endpoint, request_id))
+            response = await self._call_api_async(*call_args)
+            logger.info("{0} response received from {1}".format(method, endpoint))
+            return response
+        except self.rest_module.ApiException as e:
+            try:
+                d = self.annotate_api_exception(e, resource_path, method, request_id)
+                if d["status"] == 401:
+                    logger.debug("Refeshing token from unauathorized call and retrying")
+                    rejected_token = auth_header["Authorization"][len("Bearer "):]
+                    header_params.update(await parent.get_auth_header_async(rejected_token=rejected_token))
+                    return await self._call_api_async(*call_args)
+            except Exception:
+                pass
+            return self.handle_api_exception(e)
+
+    async def _call_api_async(
+            self, resource_path, method, path_params=None,
+            query_params=None, header_params=None, body=None, post_params=None,
+            files=None, response_type=None, auth_settings=None,
+            _return_http_data_only=None, collection_formats=None,
+            _preload_content=True, _request_timeout=None, _host=None):
+        config = self.configuration
+
+        # header parameters
+        header_params = header_params or {}
+        header_params.update(self.default_headers)
+        if self.cookie:
+            header_params['Cookie'] = self.cookie
+        if header_params:
+            header_params = self.sanitize_for_serialization(header_params)
+            header_params = dict(self.parameters_to_tuples(header_params, collection_formats))
+
+        # path parameters
+        if path_params:
+            path_params = self.sanitize_for_serialization(path_params)
+            path_params = self.parameters_to_tuples(path_params, collection_formats)
+            for k, v in path_params:
+                resource_path = resource_path.replace(
+                    '{%s}' % k,
+                    quote(str(v), safe=config.safe_chars_for_path_param)
+                )
+
+        # query parameters
+        if query_params:
+            query_params = self.sanitize_for_serialization(query_params)
+            query_params = self.parameters_to_tuples(query_params, collection_formats)
+
+        # post parameters
+        if post_params or files:
+            post_params = post_params if post_params else []
+            post_params = self.sanitize_for_serialization(post_params)
+            post_params = self.parameters_to_tuples(post_params, collection_formats)
+            post_params.extend(self.files_parameters(files))
+
+        self.update_params_for_auth(header_params, query_params, auth_settings)
+
+        if body:
+            body = self.sanitize_for_serialization(body)
+
+        if _host is None:
+            url = self.configuration.host + resource_path
+        else:
+            url = _host + resource_path
+
+        response_data = await self.request_async(
+            method, url, query_params=query_params, headers=header_params,
+            post_params=post_params, body=body,
+            _preload_content=_preload_content,
+            _request_timeout=_request_timeout)
+
+        self.last_response = response_data
+
+        return_data = response_data
+        if _preload_content:
+            if response_type:
+                return_data = self.deserialize(response_data, response_type)
+            else:
+                return_data = None
+
+        if _return_http_data_only:
+            return return_data
+        else:
+            return return_data, response_data.status, response_data.getheaders()
+
+    async def request_async(self, method, url, query_params=None, headers=None,
+                            post_params=None, body=None, _preload_content=True,
+                            _request_timeout=None) -> AsyncRESTResponse:
+        """
+        Sends the request over the parent client's `aiohttp.ClientSession`.  Follows the
+        body encoding rules of the generated `rest.RESTClientObject.request`.  When `_preload_content`
+        is False, the response data is returned as undecoded `bytes`.
+        """
+        method = method.upper()
+        if method not in ['GET', 'HEAD', 'DELETE', 'POST', 'PUT', 'PATCH', 'OPTIONS']:
+            raise self.rest_module.ApiValueError(
+                "http method must be `GET`, `HEAD`, `OPTIONS`,"
+                " `POST`, `PATCH`, `PUT` or `DELETE`."
+            )
+        if post_params and body:
+            raise self.rest_module.ApiValueError(
+                "body parameter cannot be used with post_params parameter."
+            )
+        headers = dict(headers or {})
+        request_kwargs = {}
+        if query_params:
+            url += '?' + urlencode(query_params)
+        if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
+            if 'Content-Type' not in headers:
+                headers['Content-Type'] = 'application/json'
+            if re.search('json', headers['Content-Type'], re.IGNORECASE):
+                if body is not None:
+                    request_kwargs['data'] = json.dumps(body)
+            elif headers['Content-Type'] == 'application/x-www-form-urlencoded':
+                request_kwargs['data'] = urlencode(post_params or [])
+            elif headers['Content-Type'] == 'multipart/form-data':
+                # aiohttp sets the Content-Type with the multipart boundary
+                del headers['Content-Type']
+                request_kwargs['data'] = self._get_form_data(post_params or [])
+            elif isinstance(body, str) or isinstance(body, bytes):
+                request_kwargs['data'] = body
+            else:
+                msg = """Cannot prepare a request message for provided
+                         arguments. Please check that your arguments match
+                         declared content type."""
+                raise self.rest_module.ApiException(status=0, reason=msg)
+        session = await self.get_parent().get_session()
+        async with session.request(
+                method,
+                url,
+                headers=headers,
+                timeout=self._get_timeout(_request_timeout),
+                ssl=self._get_ssl_context(),
+                **request_kwargs) as resp:
+            data = await resp.read()
+        if _preload_content:
+            data = data.decode('utf8')
+            logger.debug("response body: %s", data)
+        response = AsyncRESTResponse(resp.status, resp.reason, data, resp.headers)
+        if not 200 <= response.status <= 299:
+            raise self.rest_module.ApiException(http_resp=response)
+        return response
+
+    @staticmethod
+    def _get_form_data(post_params):
+        form = aiohttp.FormData()
+        for key, value in post_params:
+            if isinstance(value, presalytics.client.multipart.FilePart):
+                form.add_field(key, value.open(), filename=value.filename, content_type=value.content_type)
+            elif isinstance(value, tuple):
+                filename, filedata, mimetype = value
+                form.add_field(key, filedata, filename=filename, content_type=mimetype)
+            else:
+                form.add_field(key, str(value))
+        return form
+
+    @staticmethod
+    def _get_timeout(_request_timeout):
+        if _request_timeout is None:
+            return None
+        if isinstance(_request_timeout, (int, float)):
+            return aiohttp.ClientTimeout(total=_request_timeout)
+        connect, read = _request_timeout
+        return aiohttp.ClientTimeout(connect=connect, sock_read=read)
+
+    def _get_ssl_context(self):
+        if not self.configuration.verify_ssl:
+            return False
+        if getattr(self, '_ssl_context', None) is None:
+            ca_certs = self.configuration.ssl_ca_cert or certifi.where()
+            context = ssl.create_default_context(cafile=ca_certs)
+            if self.configuration.cert_file:
+                context.load_cert_chain(self.configuration.cert_file, self.configuration.key_file)
+            self._ssl_context = context
+        return self._ssl_context
+
+
+class AsyncDocConverterApiClientWithAuth(AsyncAuthenticationMixIn, presalytics.client.presalytics_doc_converter.api_client.ApiClient):
+    """
+    Wraps `presalytics.client.presalytics_doc_converter.api_client.ApiClient` with
+    `presalytics.client.async_api.AsyncAuthenticationMixIn` middleware
+    """
+    rest_module = presalytics.client.presalytics_doc_converter.rest
+
+    def __init__(self, parent: 'AsyncClient', **kwargs):
+        AsyncAuthenticationMixIn.__init__(self, parent, **kwargs)
+        presalytics.client.presalytics_doc_converter.api_client.ApiClient.__init__(self)
+        self.update_configuration()
+
+    @property
+    def api_name(self):
+        return 'doc-converter'
+
+
+class AsyncOoxmlAutomationApiClientWithAuth(AsyncAuthenticationMixIn, presalytics.client.presalytics_ooxml_automation.api_client.ApiClient):
+    """
+    Wraps `presalytics.client.presalytics_ooxml_automation.api_client.ApiClient` with
+    `presalytics.client.async_api.AsyncAuthenticationMixIn` middleware
+    """
+    rest_module = presalytics.client.presalytics_ooxml_automation.rest
+
+    def __init__(self, parent: 'AsyncClient', **kwargs):
+        AsyncAuthenticationMixIn.__init__(self, parent, **kwargs)
+        presalytics.client.presalytics_ooxml_automation.api_client.ApiClient.__init__(self)
+        self.update_configuration()
+
+    @property
+    def api_name(self):
+        return 'ooxml-automation'
+
+
+class AsyncStoryApiClientWithAuth(AsyncAuthenticationMixIn, presalytics.client.presalytics_story.api_client.ApiClient):
+    """
+    Wraps `presalytics.client.presalytics_story.api_client.ApiClient` with
+    `presalytics.client.async_api.AsyncAuthenticationMixIn` middleware
+    """
+    rest_module = presalytics.client.presalytics_story.rest
+
+    def __init__(self, parent: 'AsyncClient', **kwargs):
+        AsyncAuthenticationMixIn.__init__(self, parent, **kwargs)
+        presalytics.client.presalytics_story.api_client.ApiClient.__init__(self)
+        self.update_configuration()
+
+    @property
+    def api_name(self):
+        return 'story'
+
+
+class AsyncClient(presalytics.client.api.Client):
+    """
+    An asyncio version of `presalytics.client.api.Client`
+
+    The `story`, `ooxml_automation` and `doc_converter` attributes expose the same operations as
+    `presalytics.client.api.Client`, but each operation returns a coroutine.  All requests share
+    one `aiohttp.ClientSession`, so many concurrent requests can run on a single event loop:
+
+        async with presalytics.client.async_api.AsyncClient(token=token, delegate_login=True) as client:
+            stories = await asyncio.gather(*[client.story.story_id_get(id) for id in story_ids])
+
+    Token handling is inherited from `presalytics.client.api.Client`.  Tokens are checked before
+    each request, and refreshes run in the event loop's default executor so that only one refresh is
+    in flight at a time.  Initialization takes the same keyword arguments as `presalytics.client.api.Client`,
+    and checks tokens synchronously unless `delegate_login` is True.
+
+    Requires the [aiohttp](https://docs.aiohttp.org) package (`pip install presalytics[async]`).
+
+    Parameters
+    ----------
+    max_connections : int, optional
+        Defaults to 100.  The maximum number of simultaneous connections held by the shared session.
+    """
+    DEFAULT_MAX_CONNECTIONS = 100
+
+    def __init__(self, *args, max_connections: int = None, **kwargs):
+        if aiohttp is None:
+            message = "The AsyncClient requires the 'aiohttp' package.  Please install it via `pip install presalytics[async]`."
+            raise presalytics.lib.exceptions.MissingConfigException(message)
+        self.max_connections = max_connections or self.DEFAULT_MAX_CONNECTIONS
+        self._session: typing.Optional['aiohttp.ClientSession'] = None
+        self._async_refresh_lock: typing.Optional[asyncio.Lock] = None
+        super(AsyncClient, self).__init__(*args, **kwargs)
+
+    def init_api_clients(self, **kwargs):
+        doc_converter_api_client = AsyncDocConverterApiClientWithAuth(self, **kwargs)
+        self.doc_converter = presalytics.client.presalytics_doc_converter.DefaultApi(api_client=doc_converter_api_client)
+        ooxml_automation_api_client = AsyncOoxmlAutomationApiClientWithAuth(self, **kwargs)
+        self.ooxml_automation = presalytics.client.presalytics_ooxml_automation.DefaultApi(api_client=ooxml_automation_api_client)
+        story_api_client = AsyncStoryApiClientWithAuth(self, **kwargs)
+        self.story = presalytics.client.presalytics_story.DefaultApi(api_client=story_api_client)
+
+    async def __aenter__(self):
+        await self.get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def get_session(self) -> 'aiohttp.ClientSession':
+        """
+        Returns the `aiohttp.ClientSession` shared by this client's api clients.  The session is
+        created on first use, so it is bound to the running event loop.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_connections)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def aclose(self):
+        """
+        Closes the shared session and its connections
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def get_auth_header_async(self, rejected_token: str = None) -> typing.Dict[str, str]:
+        """
+        Coroutine version of `presalytics.client.api.Client.get_auth_header`.  Blocking token
+        refreshes run in the default executor behind a lock, so concurrent coroutines wait on a single refresh.
+
+        Parameters
+        ----------
+        rejected_token : str, optional
+            An access token rejected by the api (i.e., with a 401 status).  Forces a refresh if it is still
+            the current access token (see `presalytics.client.api.Client.force_refresh_token`).
+        """
+        if rejected_token or self.is_token_expired():
+            if self._async_refresh_lock is None:
+                self._async_refresh_lock = asyncio.Lock()
+            async with self._async_refresh_lock:
+                loop = asyncio.get_event_loop()
+                if rejected_token and self.token_util.token.get("access_token", None) == rejected_token:
+                    await loop.run_in_executor(None, self.force_refresh_token, rejected_token)
+                elif self.is_token_expired():
+                    await loop.run_in_executor(None, self.refresh_token)
+        return {
+            "Authorization": "Bearer " + self.token_util.token["access_token"]
+        }
+
+    async def download_file(self, story_id, ooxml_automation_id, download_folder=None, filename=None, chunk_size=65536, **kwargs):
+        """
+        Coroutine version of `presalytics.client.api.Client.download_file`.  The response body is written
+        to disk in chunks of `chunk_size` bytes.
+        """
+        api_client = self.story.api_client
+        path = '/{0}/file/{1}'.format(quote(str(story_id), safe=''), quote(str(ooxml_automation_id), safe=''))
+        headers = await self.get_auth_header_async()
+        headers.update(self.get_request_id_header())
+        headers.update(api_client.default_headers)
+        session = await self.get_session()
+        async with session.get(api_client.configuration.host + path, headers=headers, ssl=api_client._get_ssl_context()) as resp:
+            if not 200 <= resp.status <= 299:
+                data = await resp.read()
+                raise presalytics.lib.exceptions.ApiError(message=data, status_code=resp.status)
+            if download_folder is None:
+                download_folder = os.getcwd()
+            if filename is None:
+                _, params = cgi.parse_header(resp.headers.get('Content-Disposition'))
+                filename = params["filename"]
+            filepath = os.path.join(download_folder, filename)
+            with open(filepath, 'wb') as f:
+                async for chunk in resp.content.iter_chunked(chunk_size):
+                    f.write(chunk)
+        return filepath
+
+    async def upload_file_and_await_outline(self, file, include_relationships=True, status_repoll_seconds: float = None, repoll_max_cycles: int = None, deadline: float = None):  # type: ignore
+        """
+        Coroutine version of `presalytics.client.api.Client.upload_file_and_await_outline`
+        """
+        story = await self.story.story_post_file(file=file)
+        await self.await_outline(story.id, status_repoll_seconds, repoll_max_cycles, deadline)
+        return await self.story.story_id_get(story.id, include_outline=True, include_relationships=include_relationships)
+
+    async def await_outline(self, story_id, status_repoll_seconds: float = None, repoll_max_cycles: int = None, deadline: float = None):  # type: ignore
+        """
+        Coroutine version of `presalytics.client.api.Client.await_outline`.  Waits on `asyncio.sleep`
+        using the backoff schedule of `presalytics.client.polling.Poller`, so other coroutines keep running
+        while the outline is processed.
+        """
+        poller = self.get_poller(status_repoll_seconds, repoll_max_cycles, deadline)
+        loop = asyncio.get_event_loop()
+        start = loop.time()
+        for interval in poller.intervals():
+            status, status_code, _ = await self.story.story_id_status_get_with_http_info(story_id)
+            if status_code == 204 or (status_code == 200 and status.status == "SUCCESS"):
+                break
+            remaining = poller.deadline - (loop.time() - start)
+            if remaining <= 0:
+                message = "Timed out after {0} seconds waiting on story {1}".format(poller.deadline, story_id)
+                raise presalytics.lib.exceptions.PollingTimeout(message=message)
+            logger.info("Story creation task still running.  Rechecking status in {0:.2f} seconds".format(interval))
+            await asyncio.sleep(min(interval, remaining))
+        return await self.story.story_id_outline_get(story_id)
+
+    def close(self):
+        """
+        Releases synchronous resources.  Use `aclose` to close the shared session.
+        """
+        super(AsyncClient, self).close()
+        if self._session is not None and not self._session.closed:
+            logger.warning("AsyncClient closed without awaiting `aclose()`; the aiohttp session may leak connections.")
@@ -2,6 +2,7 @@ import json
 import logging
 import pkg_resources
 import sys
+import time
 import os
 import weakref
 import dateutil
@@ -9,10 +10,16 @@ import dateutil.parser
 import datetime
 import six
 import posixpath
+import urllib.parse
+import urllib3
 import presalytics
 import presalytics.lib.exceptions
 import presalytics.lib.constants
+import presalytics.lib.json_codec
 import presalytics.story.outline
+import presalytics.client.token_store
+import presalytics.client.multipart
+import presalytics.client.deserializer
 import typing
 import mimetypes
 import abc
@@ -25,12 +32,47 @@ logger = logging.getLogger(__name__)
 
 
 class TokenUtil(object):
-    def __init__(self, token=None, token_file=None, token_cache=False):
+    """
+    A handler for managing and caching tokens acquired from auth.presalytics.io.  The access
+    token's expiry is parsed once per token and cached as a POSIX timestamp, so expiry checks
+    on each api call do not re-parse the expiry string.
+
+    When `token_cache` is True, tokens are cached in a `presalytics.client.token_store.TokenStoreBase`
+    under `store_key`, so that clients in other threads and processes can reuse them.
+
+    Parameters
+    ----------
+    token : dict, optional
+        Defaults to None.  A token to process and cache on initialization
+
+    token_file : str, optional
+        Defaults to "token.json".  The file used when no `token_store` is passed and
+        `presalytics.CONFIG` does not configure a token store.
+
+    token_cache : bool, optional
+        Defaults to False.  Toggles whether tokens are loaded from and saved to the token store
+
+    token_store : presalytics.client.token_store.TokenStoreBase, optional
+        Defaults to the store returned by `presalytics.client.token_store.get_token_store`
+
+    store_key : str, optional
+        Defaults to None.  The key for this user's tokens in the token store.  Build with
+        `presalytics.client.token_store.get_token_store_key`.
+    """
+    DEFAULT_STORE_KEY = "default"
+
+    def __init__(self, token=None, token_file=None, token_cache=False, token_store=None, store_key=None):
+        self._token = {}
+        self._expiry_source = None
+        self._expires_at = None
         self.token_cache = token_cache
         if token_file is None:
             self.token_file = presalytics.lib.constants.TOKEN_FILE
         else:
             self.token_file = token_file
+        self.store_key = store_key or self.DEFAULT_STORE_KEY
+        self._token_store = token_store
+        self._explicit_token_file = token_file is not None
         try:
             self._load_token_file()
         except Exception:
@@ -42,83 +84,129 @@ class TokenUtil(object):
                     self._put_token_file()
             except Exception:
                 raise presalytics.lib.exceptions.MisConfiguredTokenException()
-        else:
-            if not hasattr(self, 'token'):
-                self.token = {}
 
-    def is_api_access_token_expired(self):
+    @property
+    def token(self) -> typing.Dict:
+        return self._token
+
+    @token.setter
+    def token(self, value):
+        self._token = value if value is not None else {}
+
+    @staticmethod
+    def _to_timestamp(token_expiry) -> typing.Optional[float]:
+        if isinstance(token_expiry, datetime.datetime):
+            return token_expiry.astimezone(datetime.timezone.utc).timestamp()
+        elif isinstance(token_expiry, str):
+            return dateutil.parser.parse(token_expiry).astimezone(datetime.timezone.utc).timestamp()
+        return None
+
+    def get_access_token_expiry(self) -> typing.Optional[float]:
+        """
+        Returns the access token's expiry as a POSIX timestamp, or None if the expiry is unknown.
+        The parsed value is cached until the token's `access_token_expire_time` changes.
+        """
+        token_expiry = self._token.get('access_token_expire_time', None)
+        if token_expiry is not self._expiry_source:
+            self._expires_at = self._to_timestamp(token_expiry)
+            self._expiry_source = token_expiry
+        return self._expires_at
+
+    def is_api_access_token_expired(self, skew: float = 0):
+        """
+        Checks whether the access token has expired, or will expire within `skew` seconds
+        """
         try:
-            if not self.token.get('access_token_expire_time', None):
-                if self.token.get('access_token', None):
+            if not self._token.get('access_token_expire_time', None):
+                if self._token.get('access_token', None):
                     return False  # If expire time unknown, instruct client to call endpoint
                 else:
                     return True  # If no token, instruct client to acquire token
-            token_expiry = self.token['access_token_expire_time']
-            if isinstance(token_expiry, datetime.datetime):
-                expire_datetime = token_expiry.astimezone(datetime.timezone.utc)
-            elif isinstance(token_expiry, str):
-                expire_datetime = dateutil.parser.parse(self.token['access_token_expire_time']).astimezone(datetime.timezone.utc)
-            else:
+            expires_at = self.get_access_token_expiry()
+            if expires_at is None:
                 logger.error("Token expire time not of type str (isoformat) or datetime.datetime")
                 return True  # Get a new token on type error
-            if expire_datetime < datetime.datetime.utcnow().astimezone(datetime.timezone.utc):
-                return True
-            else:
-                return False
+            return expires_at <= time.time() + skew
         except Exception as ex:
             logger.exception(ex)
             return True # Get a new token on unknown errors
 
-    def _load_token_file(self):
+    @property
+    def token_store(self) -> 'presalytics.client.token_store.TokenStoreBase':
+        if self._token_store is None:
+            if self._explicit_token_file:
+                self._token_store = presalytics.client.token_store.get_token_store("file", self.token_file)
+            else:
+                self._token_store = presalytics.client.token_store.get_token_store()
+        return self._token_store
+
+    def reload(self) -> bool:
+        """
+        Replaces the token with the token held in the token store, if caching is on and the store
+        holds a token for `store_key`.  Returns True if a token was loaded.
+        """
+        if not self.token_cache:
+            return False
         try:
-            if self.token_cache:
-                self.token = self.load_token_from_file(self.token_file)
+            token = self.token_store.get(self.store_key)
         except Exception:
             logger.error("Unable to load token from cache.  If you do intend to cache tokens, use configuration CACHE_TOKENS=False")
+            return False
+        if token and token.get('access_token', None):
+            self.token = token
+            return True
+        return False
+
+    def _load_token_file(self):
+        self.reload()
 
     def _put_token_file(self):
         try:
             if self.token_cache:
-                self.put_token_file(self.token, self.token_file)
+                self.token_store.put(self.store_key, self.token)
         except Exception:
             logger.error("Failed to cache token.  Likely a write permissions error for the filesystem.")
 
     def process_token(self, token):
-        self.token = {
+        # Build the new token before assignment, so concurrent readers never see a partial token
+        new_token = {
             'access_token': token['access_token']
         }
+        access_token_expire_time = None
         if not token.get('access_token_expire_time', None):
             if token.get('expires_in', None):
-                access_token_expire_time = datetime.datetime.utcnow().astimezone(datetime.timezone.utc) + datetime.timedelta(seconds=token['expires_in'])
+                access_token_expire_time = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=token['expires_in'])
             else:
                 pass    # TODO: add logic to introspect token for expire time 
         else:
             access_token_expire_time = token["access_token_expire_time"]
         if access_token_expire_time:
-            self.token.update({
+            new_token.update({
                 "access_token_expire_time": access_token_expire_time
             })
         if token.get('refresh_token', None):
-            self.token.update({
+            new_token.update({
                 "refresh_token": token["refresh_token"]
             })
+        self.token = new_token
         return self.token
 
     @staticmethod
     def put_token_file(token, token_filepath):
-        with open(token_filepath, mode='w+') as newtoken:
-            json.dump(token, newtoken, cls=presalytics.story.outline.OutlineEncoder)
+        with open(token_filepath, mode='wb') as newtoken:
+            newtoken.write(presalytics.lib.json_codec.dumpb(token, default=presalytics.story.outline.outline_default))
 
     @staticmethod
     def load_token_from_file(token_filepath):
-        with open(token_filepath, 'r') as token_file:
-            token = json.load(token_file)
+        with open(token_filepath, 'rb') as token_file:
+            token = presalytics.lib.json_codec.loads(token_file.read())
         return token
 
 
 class AuthenticationMixIn(abc.ABC):
-    def __init__(self, parent: 'Client', ignore_api_exceptions=False, **kwargs):
+    def __init__(self, parent: 'Client', ignore_api_exceptions=False, lazy_models=False, **kwargs):
         self._ignore_api_exceptions = ignore_api_exceptions
+        self.lazy_models = lazy_models
         self.parent = weakref.ref(parent)
         super(AuthenticationMixIn, self).__init__()
         self.update_configuration()
@@ -139,21 +227,14 @@ class AuthenticationMixIn(abc.ABC):
         Overriding call_api to force token check, refresh on each api call,
         rather than at class initialized (good for ipython notebooks)
         """
-        if self.parent() is None:
-            message = """
-            Missing reference to Client class.  Client was like garbage collected by the intepreter.\n  
-            Please initialize the Client class on its own line to avoid this error.  For example:\n\n
-            client = presalytics.Client()\n
-            story = client.story.story_id_get(story_id)
-            """
-            raise presalytics.lib.exceptions.InvalidConfigurationError(message=message)
-        auth_header = self.parent().get_auth_header()
+        parent = self.get_parent()
+        auth_header = parent.get_auth_header()
         if header_params is not None:
             header_params.update(auth_header)
         else:
             header_params = auth_header
         if not header_params.get("X-Request_Id"):
-            req_id = self.parent().get_request_id_header()
+            req_id = parent.get_request_id_header()
             header_params.update(req_id)
         request_id = header_params.get("X-Request-Id")
         try:
@@ -184,28 +265,68 @@ class AuthenticationMixIn(abc.ABC):
         except Exception as e:
             if type(e).__name__ == "ApiException":
                 try:
-                    d = json.loads(e.body)
-                    addendum = " Host: {0}; Path: {1}; Method: {2}; Request Id: {3}".format(self.configuration.host, resource_path, method, request_id)
-                    try:
-                        d["detail"] = d["detail"] + addendum
-                    except TypeError:
-                        d = e.body + addendum
-                    e.body = json.dumps(d)
-                    logging.error(d)
+                    d = self.annotate_api_exception(e, resource_path, method, request_id)
                     if d["status"] == 401:
                         logging.debug("Refeshing token from unauathorized call and retrying")
-                        self.parent().refresh_token()
+                        parent.force_refresh_token(rejected_token=auth_header["Authorization"][len("Bearer "):])
+                        header_params = dict(header_params, **parent.get_auth_header())
+                        call_args = call_args[:4] + (header_params,) + call_args[5:]
                         return super(AuthenticationMixIn, self).call_api(*call_args)
                 except Exception:
                     pass
-                if self._ignore_api_exceptions:
-                    return e.body, e.status, e.headers
-                else:
-                    raise presalytics.lib.exceptions.ApiException(default_exception=e)
+                return self.handle_api_exception(e)
             else:
                 t, v, tb = sys.exc_info()
                 six.reraise(t, v, tb)
 
+    def get_parent(self) -> 'Client':
+        """
+        Dereferences the `presalytics.client.api.Client` that owns this api client
+        """
+        parent = self.parent()
+        if parent is None:
+            message = """
+            Missing reference to Client class.  Client was like garbage collected by the intepreter.\n  
+            Please initialize the Client class on its own line to avoid this error.  For example:\n\n
+            client = presalytics.Client()\n
+            story = client.story.story_id_get(story_id)
+            """
+            raise presalytics.lib.exceptions.InvalidConfigurationError(message=message)
+        return parent
+
+    def annotate_api_exception(self, e, resource_path, method, request_id):
+        """
+        Appends host, path, method and request id information to the body of an `ApiException`
+        raised by the generated client and returns the parsed error body
+        """
+        d = json.loads(e.body)
+        addendum = " Host: {0}; Path: {1}; Method: {2}; Request Id: {3}".format(self.configuration.host, resource_path, method, request_id)
+        try:
+            d["detail"] = d["detail"] + addendum
+        except TypeError:
+            d = e.body + addendum
+        e.body = json.dumps(d)
+        logging.error(d)
+        return d
+
+    @staticmethod
+    def is_error_response(response) -> bool:
+        """
+        Indicates whether `response` is the (body, status, headers) `tuple` returned in place
+        of an error when `ignore_api_exceptions` is set
+        """
+        return isinstance(response, tuple) and len(response) == 3 and isinstance(response[1], int) and response[1] >= 400
+
+    def handle_api_exception(self, e):
+        """
+        Returns the body, status and headers of the `ApiException` when `ignore_api_exceptions` is set,
+        otherwise raises a `presalytics.lib.exceptions.ApiException`
+        """
+        if self._ignore_api_exceptions:
+            return e.body, e.status, e.headers
+        else:
+            raise presalytics.lib.exceptions.ApiException(default_exception=e)
+
     def update_configuration(self):
         """
         updates the configuration from the base api client to parameters contained in the config file.
@@ -241,6 +362,40 @@ class AuthenticationMixIn(abc.ABC):
         except (KeyError, UnboundLocalError):
             pass
 
+    def get_deserializer_plans(self) -> presalytics.client.deserializer.DeserializerPlans:
+        """
+        Returns the compiled decoders for the generated api package that this api client wraps.  The
+        decoders are shared by all api clients for the same package.
+        """
+        plans = getattr(self, '_deserializer_plans', None)
+        if plans is None:
+            package = next(c.__module__ for c in type(self).__mro__ if c.__name__ == 'ApiClient').rsplit('.', 1)[0]
+            plans = self._deserializer_plans = presalytics.client.deserializer.get_deserializer_plans(package)
+        return plans
+
+    def deserialize(self, response, response_type):
+        """
+        Overwrites the generated function to parse response bodies with `presalytics.lib.json_codec`
+        """
+        if response_type == "file":
+            return super(AuthenticationMixIn, self).deserialize(response, response_type)  # type: ignore
+        try:
+            data = presalytics.lib.json_codec.loads(response.data)
+        except (ValueError, TypeError):
+            data = response.data
+        return self._ApiClient__deserialize(data, response_type)
+
+    def _ApiClient__deserialize(self, data, klass):
+        """
+        Overwrites the generated function to decode with a compiled, cached decoder per model class and type string
+        (see `presalytics.client.deserializer.DeserializerPlans`), rather than re-parsing `klass` for every value.
+        When `lazy_models` is set, models are returned as `presalytics.client.deserializer.LazyModelMixIn` instances.
+        Needs to account for name-mangling in parent class.
+        """
+        if self.lazy_models:
+            return self.get_deserializer_plans().decode_lazy(data, klass)
+        return self.get_deserializer_plans().decode(data, klass)
+
     def _ApiClient__deserialize_datetime(self, string):
         """Overwrites generated function to include UTC timezone on datetime object
         needs to account for name-mangling in parent class
@@ -266,9 +421,12 @@ class AuthenticationMixIn(abc.ABC):
         """Builds form parameters.
 
         This override method expands the capabilites of codegen filehandler to
-        accept a `werkzeug.datastructures.FileStorage` object.
+        accept a `werkzeug.datastructures.FileStorage` object or a `presalytics.client.multipart.FilePart`.
+        Files are not read into memory: they are wrapped in `presalytics.client.multipart.FilePart`
+        objects that are streamed by `request`.
 
-        :param files: File parameters. Either a string file path or a `werkzeug.datastructures.FileStorage` object
+        :param files: File parameters. Either a string file path, a `werkzeug.datastructures.FileStorage` object
+            or a `presalytics.client.multipart.FilePart`
         :return: Form parameters with files.
         """
         params = []
@@ -280,18 +438,62 @@ class AuthenticationMixIn(abc.ABC):
                 if type(v) is str or type(v) is list:
                     file_names = v if type(v) is list else [v]
                     for n in file_names:
-                        with open(n, 'rb') as f:
-                            filename = os.path.basename(f.name)
-                            filedata = f.read()
-
+                        params.append(tuple([k, presalytics.client.multipart.FilePart(n)]))
+                elif isinstance(v, FileStorage):
+                    v.stream.seek(0)
+                    params.append(tuple([k, presalytics.client.multipart.FilePart(v)]))
+                elif isinstance(v, presalytics.client.multipart.FilePart):
+                    params.append(tuple([k, v]))
                 else:
-                    if type(v) is FileStorage:
-                        filename = v.filename
-                        v.stream.seek(0)
-                        filedata = v.stream.read()
-                    else:
-                        raise AttributeError("Invalid File Object")
-                mimetype = (mimetypes.guess_type(filename)[0] or 'application/octet-stream')
-                params.append(tuple([k, tuple([filename, filedata, mimetype])]))
-
-        return params
\ No newline at end of file
+                    raise AttributeError("Invalid File Object")
+
+        return params
+
+    def request(self, method, url, query_params=None, headers=None,
+                post_params=None, body=None, _preload_content=True,
+                _request_timeout=None):
+        """
+        Overrides the generated request method to stream multipart bodies that contain
+        `presalytics.client.multipart.FilePart` objects, rather than encoding them in memory
+        """
+        if post_params and any(isinstance(v, presalytics.client.multipart.FilePart) for _, v in post_params):
+            return self.stream_multipart(method, url, query_params, headers, post_params, _preload_content, _request_timeout)
+        return super(AuthenticationMixIn, self).request(
+            method, url, query_params=query_params, headers=headers, post_params=post_params,
+            body=body, _preload_content=_preload_content, _request_timeout=_request_timeout)
+
+    def stream_multipart(self, method, url, query_params, headers, post_params, _preload_content=True, _request_timeout=None):
+        """
+        Sends a multipart/form-data request whose body is read from a
+        `presalytics.client.multipart.MultipartEncoder`, so files are sent in chunks
+        """
+        rest = sys.modules[type(self.rest_client).__module__]
+        encoder = presalytics.client.multipart.MultipartEncoder(post_params)
+        headers = dict(headers or {})
+        headers['Content-Type'] = encoder.content_type
+        if encoder.len is not None:
+            headers['Content-Length'] = str(encoder.len)
+        if query_params:
+            url += '?' + urllib.parse.urlencode(query_params)
+        timeout = None
+        if isinstance(_request_timeout, int):
+            timeout = urllib3.Timeout(total=_request_timeout)
+        elif isinstance(_request_timeout, tuple) and len(_request_timeout) == 2:
+            timeout = urllib3.Timeout(connect=_request_timeout[0], read=_request_timeout[1])
+        try:
+            r = self.rest_client.pool_manager.request(
+                method, url,
+                body=encoder,
+                preload_content=_preload_content,
+                timeout=timeout,
+                headers=headers)
+        except urllib3.exceptions.SSLError as e:
+            msg = "{0}\n{1}".format(type(e).__name__, str(e))
+            raise rest.ApiException(status=0, reason=msg)
+        if _preload_content:
+            r = rest.RESTResponse(r)
+            r.data = r.data.decode('utf8')
+            logger.debug("response body: %s", r.data)
+        if not 200 <= r.status <= 299:
+            raise rest.ApiException(http_resp=r)
+        return r
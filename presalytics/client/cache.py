@@ -0,0 +1,193 @@
+import copy
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import threading
+import time
+import typing
+import cachetools
+import presalytics
+
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache(object):
+    """
+    A thread-safe cache of deserialized api responses with a time-to-live and a size limit.
+
+    Entries are held in memory, evicting the least recently used entry when the cache is full.
+    If a `directory` is given, entries are also pickled to disk so they survive across processes
+    (e.g., for scripts run by cron).  Values are deep-copied on the way in and out, so callers
+    can safely modify the models they receive.
+
+    Parameters
+    ----------
+    ttl : float, optional
+        Defaults to 3600.  The number of seconds an entry stays valid.  Pass None for entries that
+        do not expire.
+
+    max_size : int, optional
+        Defaults to 256.  The maximum number of entries held in memory and on disk.
+
+    directory : str, optional
+        Defaults to None.  A directory where entries are persisted.  Created if it does not exist.
+    """
+    DEFAULT_TTL = 3600
+    DEFAULT_MAX_SIZE = 256
+    FILE_SUFFIX = ".pickle"
+
+    _MISSING = object()
+
+    def __init__(self, ttl: typing.Optional[float] = DEFAULT_TTL, max_size: int = None, directory: str = None):
+        self.ttl = ttl
+        self.max_size = max_size or self.DEFAULT_MAX_SIZE
+        self.directory = directory
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+        self._entries = cachetools.LRUCache(maxsize=self.max_size)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        """
+        Builds a cache key from hashable parts (e.g., host, method, path and parameters)
+        """
+        return hashlib.sha256(repr(parts).encode('utf-8')).hexdigest()
+
+    def get(self, key: str, default=None):
+        """
+        Returns a copy of the value cached under `key`, or `default` if there is no live entry
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key, None)
+        if entry is None and self.directory:
+            entry = self._read(key)
+            if entry is not None:
+                with self._lock:
+                    self._entries[key] = entry
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= now:
+            self.delete(key)
+            return default
+        return copy.deepcopy(value)
+
+    def set(self, key: str, value, ttl: float = _MISSING):  # type: ignore
+        """
+        Caches a copy of `value` under `key`.  Optionally overrides the cache's `ttl` for this entry.
+        """
+        if ttl is self._MISSING:
+            ttl = self.ttl
+        expires_at = time.time() + ttl if ttl is not None else None
+        entry = (expires_at, copy.deepcopy(value))
+        with self._lock:
+            self._entries[key] = entry
+        if self.directory:
+            self._write(key, entry)
+
+    def delete(self, key: str):
+        """
+        Removes the entry cached under `key`, if any
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+        if self.directory:
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+    def clear(self):
+        """
+        Removes all entries from memory and disk
+        """
+        with self._lock:
+            self._entries.clear()
+        if self.directory:
+            for path in self._list_files():
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + self.FILE_SUFFIX)  # type: ignore
+
+    def _list_files(self) -> typing.List[str]:
+        try:
+            names = os.listdir(self.directory)  # type: ignore
+        except OSError:
+            return []
+        return [os.path.join(self.directory, n) for n in names if n.endswith(self.FILE_SUFFIX)]  # type: ignore
+
+    def _read(self, key: str):
+        try:
+            with open(self._path(key), 'rb') as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as ex:
+            logger.debug("Discarding unreadable cache entry: {0}".format(ex))
+            return None
+
+    def _write(self, key: str, entry):
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".cache-")
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+            self._prune()
+        except Exception as ex:
+            logger.error("Unable to write response cache entry to disk: {0}".format(ex))
+
+    def _prune(self):
+        paths = self._list_files()
+        if len(paths) <= self.max_size:
+            return
+        paths.sort(key=lambda p: os.path.getmtime(p) if os.path.exists(p) else 0)
+        for path in paths[:len(paths) - self.max_size]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+_CACHES: typing.Dict[str, ResponseCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def get_response_cache(name: str = "ooxml-automation", ttl: typing.Optional[float] = ResponseCache._MISSING) -> ResponseCache:  # type: ignore
+    """
+    Returns the process-wide `presalytics.client.cache.ResponseCache` for `name`.  Set from
+    `presalytics.CONFIG` with keywords `["RESPONSE_CACHE_TTL"]`, `["RESPONSE_CACHE_MAX_SIZE"]`
+    and `["RESPONSE_CACHE_DIR"]`.  When a directory is configured, each named cache is persisted
+    in a subdirectory of the same name.
+
+    Parameters
+    ----------
+    name : str, optional
+        Defaults to "ooxml-automation".  The name of the cache
+
+    ttl : float, optional
+        Overrides `["RESPONSE_CACHE_TTL"]` when the cache is created.  Pass None for entries that do not expire
+        (e.g., entries that are revalidated with the server on each use).
+    """
+    with _CACHES_LOCK:
+        if name not in _CACHES:
+            if ttl is ResponseCache._MISSING:
+                ttl = presalytics.CONFIG.get("RESPONSE_CACHE_TTL", ResponseCache.DEFAULT_TTL)
+            max_size = presalytics.CONFIG.get("RESPONSE_CACHE_MAX_SIZE", ResponseCache.DEFAULT_MAX_SIZE)
+            directory = presalytics.CONFIG.get("RESPONSE_CACHE_DIR", None)
+            if directory:
+                directory = os.path.join(directory, name)
+            _CACHES[name] = ResponseCache(ttl=ttl, max_size=max_size, directory=directory)
+        return _CACHES[name]
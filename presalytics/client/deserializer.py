@@ -0,0 +1,368 @@
+import datetime
+import importlib
+import re
+import threading
+import typing
+import dateutil.parser
+import six
+
+
+Decoder = typing.Callable[[typing.Any], typing.Any]
+
+LIST_PATTERN = re.compile(r'list\[(.*)\]')
+DICT_PATTERN = re.compile(r'dict\(([^,]*), (.*)\)')
+
+NATIVE_TYPES_MAPPING = {
+    'int': int,
+    'long': int,
+    'float': float,
+    'str': str,
+    'bool': bool,
+    'date': datetime.date,
+    'datetime': datetime.datetime,
+    'object': object,
+}
+
+PRIMITIVE_TYPES = (float, bool, bytes, six.text_type) + six.integer_types
+
+LAZY = "lazy"
+
+
+class DeserializerPlans(object):
+    """
+    Compiles and caches one decoder function per type string (e.g., "list[Story]") or model class
+    for a generated api package (e.g., `presalytics.client.presalytics_story`).
+
+    The generated `ApiClient.__deserialize` parses the type string with regular expressions, looks up the
+    model class and walks the model's `openapi_types` for every value it decodes.  A decoder plan resolves
+    all of that once, so decoding a large response only runs the per-value work.  Decoded objects are the
+    same as those built by the generated client: models are constructed with keyword arguments,
+    so the models' setters and validation still run.
+
+    Parameters
+    ----------
+    package : str
+        The name of the generated api package, e.g., "presalytics.client.presalytics_story"
+    """
+    def __init__(self, package: str):
+        self.package = package
+        self.models = importlib.import_module(package + ".models")
+        self.rest = importlib.import_module(package + ".rest")
+        self._decoders: typing.Dict[typing.Any, Decoder] = {}
+        self._staged: typing.Dict[typing.Any, Decoder] = {}
+        self._lazy_classes: typing.Dict[typing.Type, typing.Type] = {}
+        self._depth = 0
+        self._lock = threading.RLock()
+
+    def decode(self, data, klass):
+        """
+        Decodes `data` (a `dict`, `list` or primitive from a json response) into `klass`
+
+        Parameters
+        ----------
+        data : object
+            The decoded json value
+
+        klass : str or class
+            A type string from the generated models' `openapi_types` (e.g., "list[Story]"), or a class
+        """
+        return self.get_decoder(klass)(data)
+
+    def decode_lazy(self, data, klass):
+        """
+        Decodes `data` into lazy models (see `presalytics.client.deserializer.LazyModelMixIn`), whose attributes
+        are decoded from `data` when they are first read
+        """
+        return self.get_decoder(klass, lazy=True)(data)
+
+    def get_decoder(self, klass, lazy: bool = False) -> Decoder:
+        """
+        Returns the compiled decoder for `klass`, compiling it on first use
+        """
+        key = (LAZY, klass) if lazy else klass
+        try:
+            return self._decoders[key]
+        except KeyError:
+            pass
+        with self._lock:
+            if key in self._decoders:
+                return self._decoders[key]
+            if key in self._staged:
+                return self._staged[key]
+            # Decoders are staged until the outermost compile finishes, so other threads
+            # never see a model decoder whose fields are still being compiled
+            self._depth += 1
+            try:
+                self._compile(klass, key, lazy)
+            except Exception:
+                if self._depth == 1:
+                    self._staged.clear()
+                raise
+            finally:
+                self._depth -= 1
+            if self._depth == 0:
+                self._decoders.update(self._staged)
+                self._staged.clear()
+                return self._decoders[key]
+            return self._staged[key]
+
+    def _compile(self, klass, key, lazy):
+        """ Caller must hold `self._lock`.  Stages the decoder for `klass` in `self._staged` under `key`. """
+        if isinstance(klass, str):
+            if klass.startswith('list['):
+                item_decoder = self.get_decoder(LIST_PATTERN.match(klass).group(1), lazy)  # type: ignore
+                self._staged[key] = self._list_decoder(item_decoder)
+                return
+            if klass.startswith('dict('):
+                value_decoder = self.get_decoder(DICT_PATTERN.match(klass).group(2), lazy)  # type: ignore
+                self._staged[key] = self._dict_decoder(value_decoder)
+                return
+            if klass in NATIVE_TYPES_MAPPING:
+                target = NATIVE_TYPES_MAPPING[klass]
+            else:
+                target = getattr(self.models, klass)
+            self._staged[key] = self.get_decoder(target, lazy)
+            return
+        if klass in PRIMITIVE_TYPES:
+            self._staged[key] = self._primitive_decoder(klass)
+        elif klass == object:
+            self._staged[key] = _identity
+        elif klass == datetime.date:
+            self._staged[key] = self._date_decoder
+        elif klass == datetime.datetime:
+            self._staged[key] = self._datetime_decoder
+        elif lazy and not hasattr(klass, 'get_real_child_model') and klass.openapi_types:
+            self._compile_lazy_model(klass, key)
+        else:
+            self._compile_model(klass, key)
+
+    @staticmethod
+    def _list_decoder(item_decoder: Decoder) -> Decoder:
+        def decode_list(data):
+            if data is None:
+                return None
+            return [item_decoder(item) for item in data]
+        return decode_list
+
+    @staticmethod
+    def _dict_decoder(value_decoder: Decoder) -> Decoder:
+        def decode_dict(data):
+            if data is None:
+                return None
+            return {k: value_decoder(v) for k, v in six.iteritems(data)}
+        return decode_dict
+
+    @staticmethod
+    def _primitive_decoder(klass) -> Decoder:
+        def decode_primitive(data):
+            if data is None:
+                return None
+            if type(data) is klass:
+                return data
+            try:
+                return klass(data)
+            except UnicodeEncodeError:
+                return six.text_type(data)
+            except TypeError:
+                return data
+        return decode_primitive
+
+    def _date_decoder(self, data):
+        if data is None:
+            return None
+        try:
+            return dateutil.parser.parse(data).date()
+        except ValueError:
+            raise self.rest.ApiException(
+                status=0,
+                reason="Failed to parse `{0}` as date object".format(data)
+            )
+
+    def _datetime_decoder(self, data):
+        if data is None:
+            return None
+        try:
+            return datetime.datetime.fromisoformat(data)
+        except (TypeError, ValueError):
+            pass
+        try:
+            return dateutil.parser.parse(data)
+        except ValueError:
+            raise self.rest.ApiException(
+                status=0,
+                reason="Failed to parse `{0}` as datetime object".format(data)
+            )
+
+    def _compile_model(self, klass, key):
+        has_child_model = hasattr(klass, 'get_real_child_model')
+        if not klass.openapi_types and not has_child_model:
+            self._staged[key] = _identity
+            return
+        fields: typing.List[typing.Tuple[str, str, Decoder]] = []
+
+        def decode_model(data):
+            if data is None:
+                return None
+            kwargs = {}
+            if isinstance(data, dict):
+                for attr, key, decoder in fields:
+                    if key in data:
+                        kwargs[attr] = decoder(data[key])
+            instance = klass(**kwargs)
+            if has_child_model:
+                klass_name = instance.get_real_child_model(data)
+                if klass_name:
+                    instance = self.decode(data, klass_name)
+            return instance
+
+        # Register before compiling fields, so self-referencing models resolve to this decoder
+        self._staged[key] = decode_model
+        for attr, attr_type in six.iteritems(klass.openapi_types or {}):
+            fields.append((attr, klass.attribute_map[attr], self.get_decoder(attr_type)))
+
+    def _compile_lazy_model(self, klass, key):
+        lazy_fields: typing.Dict[str, typing.Tuple[str, Decoder]] = {}
+        lazy_class = type(klass.__name__, (LazyModelMixIn, klass), {
+            '__module__': klass.__module__,
+            '__doc__': klass.__doc__,
+            '_lazy_fields': lazy_fields,
+            '_model_class': klass,
+            '_package': self.package
+        })
+
+        def decode_lazy_model(data):
+            if data is None:
+                return None
+            if not isinstance(data, dict):
+                return klass()
+            instance = lazy_class.__new__(lazy_class)
+            instance.__dict__['_raw'] = data
+            return instance
+
+        self._staged[key] = decode_lazy_model
+        self._lazy_classes[klass] = lazy_class
+        for attr, attr_type in six.iteritems(klass.openapi_types):
+            lazy_fields['_' + attr] = (klass.attribute_map[attr], self.get_decoder(attr_type, lazy=True))
+
+    def get_lazy_class(self, klass) -> typing.Type:
+        """
+        Returns the lazy subclass of a model class, compiling it on first use
+        """
+        self.get_decoder(klass, lazy=True)
+        return self._lazy_classes[klass]
+
+
+class LazyModelMixIn(object):
+    """
+    Base for lazy, dict-backed subclasses of generated models.  Created by `presalytics.client.deserializer.DeserializerPlans`
+    when an api client is initialized with `lazy_models=True`.
+
+    A lazy model wraps the decoded json `dict` of an api response.  Each attribute is decoded the first time it is read,
+    and the result is cached on the instance, so reading one field of a large response does not build the rest
+    of the model tree.  Lazy models are instances of their generated model class.
+
+    Until an attribute is set, or a field holding a model, `list` or `dict` is decoded (and so could be edited in
+    place), `to_dict` returns the wrapped json `dict` itself, without a rebuild.  Its keys are the api's json keys,
+    and its values are not decoded (e.g., datetimes are ISO 8601 strings).  Otherwise, `to_dict` returns the same
+    `dict` as the generated model.
+    """
+    _lazy_fields: typing.Dict[str, typing.Tuple[str, Decoder]] = {}
+    _model_class: typing.Type = object
+    _package: str = ""
+
+    def __getattr__(self, name):
+        # Only called when normal lookup fails, i.e., for fields that have not been decoded yet
+        field = type(self)._lazy_fields.get(name, None)
+        if field is None:
+            if name == 'discriminator':
+                return None
+            raise AttributeError(name)
+        try:
+            raw = self.__dict__['_raw']
+        except KeyError:
+            raise AttributeError(name)
+        key, decoder = field
+        value = decoder(raw[key]) if key in raw else None
+        self.__dict__[name] = value
+        return value
+
+    def __setattr__(self, name, value):
+        self.__dict__['_modified'] = True
+        object.__setattr__(self, name, value)
+
+    def materialize(self):
+        """
+        Decodes every attribute that has not been read yet
+        """
+        for name in type(self)._lazy_fields:
+            getattr(self, name)
+        return self
+
+    def has_mutable_fields(self) -> bool:
+        """
+        Returns True if a decoded attribute holds a model, `list` or `dict`, which could have been edited in place
+        """
+        fields = type(self)._lazy_fields
+        for name, value in self.__dict__.items():
+            if name in fields and (isinstance(value, (list, dict)) or hasattr(type(value), 'openapi_types')):
+                return True
+        return False
+
+    def to_dict(self):
+        if not self.__dict__.get('_modified', False) and not self.has_mutable_fields():
+            return self.__dict__['_raw']
+        return self._model_class.to_dict(self)
+
+    def __eq__(self, other):
+        if not isinstance(other, self._model_class):
+            return False
+        return _model_to_dict(self) == _model_to_dict(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __reduce__(self):
+        state = {k: v for k, v in self.__dict__.items()}
+        return (_restore_lazy_model, (self._package, self._model_class.__name__, state))
+
+
+def _model_to_dict(value):
+    """ Converts models to `dict` objects with the generated models' keys and decoded values, including lazy models """
+    if isinstance(value, list):
+        return [_model_to_dict(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _model_to_dict(v) for k, v in value.items()}
+    openapi_types = getattr(type(value), 'openapi_types', None)
+    if openapi_types is None:
+        return value
+    return {attr: _model_to_dict(getattr(value, attr)) for attr in openapi_types}
+
+
+def _restore_lazy_model(package, model_name, state):
+    plans = get_deserializer_plans(package)
+    lazy_class = plans.get_lazy_class(getattr(plans.models, model_name))
+    instance = lazy_class.__new__(lazy_class)
+    instance.__dict__.update(state)
+    return instance
+
+
+def _identity(data):
+    return data
+
+
+_PLANS: typing.Dict[str, DeserializerPlans] = {}
+_PLANS_LOCK = threading.Lock()
+
+
+def get_deserializer_plans(package: str) -> DeserializerPlans:
+    """
+    Returns the process-wide `presalytics.client.deserializer.DeserializerPlans` for a generated api package
+    """
+    try:
+        return _PLANS[package]
+    except KeyError:
+        pass
+    with _PLANS_LOCK:
+        if package not in _PLANS:
+            _PLANS[package] = DeserializerPlans(package)
+        return _PLANS[package]
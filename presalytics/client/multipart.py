@@ -0,0 +1,285 @@
+import io
+import mimetypes
+import os
+import typing
+import uuid
+from werkzeug.datastructures import FileStorage
+
+
+ProgressCallback = typing.Callable[[int, typing.Optional[int]], None]
+
+
+class FilePart(object):
+    """
+    A file to upload in a `presalytics.client.multipart.MultipartEncoder`.  The file's data is not read
+    until the request body is sent.
+
+    Parameters
+    ----------
+    source : str, os.PathLike, bytes, file-like object, `werkzeug.datastructures.FileStorage` or iterable of bytes
+        The file's data.  Paths are opened when the body is sent and closed when they have been read.  File-like
+        objects are read from their current position.  Iterables are read once, and their length is unknown, so
+        requests with iterable sources are sent with chunked transfer encoding.
+
+    filename : str, optional
+        Defaults to the basename of `source` if `source` is a path or has a name
+
+    content_type : str, optional
+        Defaults to a mimetype guessed from `filename`, or "application/octet-stream"
+
+    progress : callable, optional
+        Called with (bytes sent, total bytes) as the file is read.  Total bytes is None when the
+        length of the file is unknown.
+    """
+    def __init__(self,
+                 source,
+                 filename: str = None,
+                 content_type: str = None,
+                 progress: ProgressCallback = None):
+        if isinstance(source, FileStorage):
+            filename = filename or source.filename
+            content_type = content_type or source.content_type
+            source = source.stream
+        if isinstance(source, str):
+            source = os.fspath(source)
+            is_path = True
+        else:
+            is_path = isinstance(source, os.PathLike)
+        self.path = os.fspath(source) if is_path else None
+        self.source = source
+        if filename is None:
+            name = self.path or getattr(source, "name", None)
+            filename = os.path.basename(name) if isinstance(name, str) else "file"
+        self.filename = filename
+        self.content_type = content_type or mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+        self.progress = progress
+        self._start = None if is_path else self._tell(source)
+
+    @staticmethod
+    def _tell(source) -> typing.Optional[int]:
+        try:
+            return source.tell()
+        except (AttributeError, OSError, ValueError):
+            return None
+
+    @property
+    def len(self) -> typing.Optional[int]:
+        """
+        The number of bytes in the file, or None if the length cannot be known without reading it
+        """
+        if self.path is not None:
+            return os.path.getsize(self.path)
+        if isinstance(self.source, (bytes, bytearray, memoryview)):
+            return len(self.source)
+        try:
+            return os.fstat(self.source.fileno()).st_size - (self._start or 0)
+        except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+            pass
+        if self._start is not None and hasattr(self.source, "seek"):
+            try:
+                end = self.source.seek(0, io.SEEK_END)
+                self.source.seek(self._start)
+                return end - self._start
+            except (OSError, ValueError):
+                pass
+        return None
+
+    @property
+    def seekable(self) -> bool:
+        return self.path is not None or self._start is not None or isinstance(self.source, (bytes, bytearray, memoryview))
+
+    def open(self) -> typing.BinaryIO:
+        """
+        Returns a readable binary file-like object positioned at the start of the file's data.  Paths are
+        opened on each call, and the caller is responsible for closing the returned object.
+        """
+        if self.path is not None:
+            return open(self.path, 'rb')
+        if isinstance(self.source, (bytes, bytearray, memoryview)):
+            return io.BytesIO(self.source)
+        if hasattr(self.source, "read"):
+            if self._start is not None:
+                self.source.seek(self._start)
+            return self.source
+        return io.BufferedReader(_IterableReader(self.source))  # type: ignore
+
+    def iter_chunks(self, chunk_size: int) -> typing.Iterator[bytes]:
+        """
+        Yields the file's data in chunks of at most `chunk_size` bytes
+        """
+        total = self.len
+        sent = 0
+        f = self.open()
+        try:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                if isinstance(chunk, str):
+                    chunk = chunk.encode('utf-8')
+                sent += len(chunk)
+                if self.progress:
+                    self.progress(sent, total)
+                yield chunk
+        finally:
+            if f is not self.source:
+                f.close()
+
+
+class _IterableReader(io.RawIOBase):
+    """ Adapts an iterable of `bytes` to a raw binary stream """
+    def __init__(self, iterable):
+        self._iterator = iter(iterable)
+        self._leftover = b''
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while not self._leftover:
+            try:
+                chunk = next(self._iterator)
+            except StopIteration:
+                return 0
+            self._leftover = chunk.encode('utf-8') if isinstance(chunk, str) else bytes(chunk)
+        n = min(len(b), len(self._leftover))
+        b[:n] = self._leftover[:n]
+        self._leftover = self._leftover[n:]
+        return n
+
+
+class MultipartEncoder(object):
+    """
+    Encodes a multipart/form-data request body as a stream, so files are uploaded without reading them
+    into memory.  The encoder is a read-only file-like object that can be passed as the body of
+    a `urllib3` or `requests` request.
+
+    Parameters
+    ----------
+    fields : list or dict
+        The form fields, as (name, value) pairs or a `dict`.  Values are `str` or `bytes` form values, `presalytics.client.multipart.FilePart`
+        objects, or (filename, source, content_type) `tuple` objects, where `source` is any source accepted
+        by `presalytics.client.multipart.FilePart`.
+
+    boundary : str, optional
+        Defaults to a random boundary
+
+    chunk_size : int, optional
+        Defaults to 64 KB.  The number of bytes read from a file at a time.
+
+    progress : callable, optional
+        Called with (bytes sent, total bytes) as the body is read.  Total bytes is None when the
+        length of the body is unknown.
+    """
+    DEFAULT_CHUNK_SIZE = 64 * 1024
+
+    def __init__(self,
+                 fields: typing.Union[typing.Dict, typing.Sequence[typing.Tuple[str, typing.Any]]],
+                 boundary: str = None,
+                 chunk_size: int = None,
+                 progress: ProgressCallback = None):
+        if isinstance(fields, dict):
+            fields = list(fields.items())
+        self.boundary = boundary or uuid.uuid4().hex
+        self.chunk_size = chunk_size or self.DEFAULT_CHUNK_SIZE
+        self.progress = progress
+        self.parts: typing.List[typing.Tuple[bytes, typing.Union[bytes, FilePart]]] = []
+        for name, value in fields:
+            if isinstance(value, tuple):
+                value = FilePart(value[1], filename=value[0], content_type=value[2] if len(value) > 2 else None)
+            elif isinstance(value, FileStorage):
+                value = FilePart(value)
+            if isinstance(value, FilePart):
+                header = 'Content-Disposition: form-data; name="{0}"; filename="{1}"\r\nContent-Type: {2}\r\n\r\n'.format(
+                    name, value.filename.replace('"', '\\"'), value.content_type)
+            else:
+                if isinstance(value, str):
+                    value = value.encode('utf-8')
+                elif not isinstance(value, bytes):
+                    value = str(value).encode('utf-8')
+                header = 'Content-Disposition: form-data; name="{0}"\r\n\r\n'.format(name)
+            self.parts.append(('--{0}\r\n{1}'.format(self.boundary, header).encode('utf-8'), value))
+        self._closing = '--{0}--\r\n'.format(self.boundary).encode('utf-8')
+        self._length = self._compute_length()
+        self.seek(0)
+
+    @property
+    def content_type(self) -> str:
+        return 'multipart/form-data; boundary={0}'.format(self.boundary)
+
+    @property
+    def len(self) -> typing.Optional[int]:
+        """
+        The length of the encoded body in bytes, or None if a part's length is unknown
+        """
+        return self._length
+
+    def _compute_length(self) -> typing.Optional[int]:
+        total = len(self._closing)
+        for header, value in self.parts:
+            length = value.len if isinstance(value, FilePart) else len(value)
+            if length is None:
+                return None
+            total += len(header) + length + 2
+        return total
+
+    def _iter_body(self) -> typing.Iterator[bytes]:
+        for header, value in self.parts:
+            yield header
+            if isinstance(value, FilePart):
+                yield from value.iter_chunks(self.chunk_size)
+            else:
+                yield value
+            yield b'\r\n'
+        yield self._closing
+
+    def __iter__(self):
+        while True:
+            chunk = self.read(self.chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Reads up to `size` bytes of the encoded body, or the rest of the body if `size` is negative
+        """
+        while size is None or size < 0 or len(self._buffer) < size:
+            try:
+                self._buffer.extend(next(self._chunks))
+            except StopIteration:
+                break
+        if size is None or size < 0:
+            size = len(self._buffer)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        self._position += len(data)
+        if data and self.progress:
+            self.progress(self._position, self._length)
+        return data
+
+    def tell(self) -> int:
+        return self._position
+
+    def seekable(self) -> bool:
+        return all(value.seekable for _, value in self.parts if isinstance(value, FilePart))
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """
+        Rewinds the body (e.g., so a request can be retried).  Only seeking to the start of the
+        body or to the current position is supported.
+        """
+        if whence == io.SEEK_CUR and offset == 0:
+            return self._position
+        if whence != io.SEEK_SET or offset != 0:
+            raise io.UnsupportedOperation("MultipartEncoder can only seek to the start of the body")
+        if getattr(self, "_position", 0) and not self.seekable():
+            raise io.UnsupportedOperation("MultipartEncoder cannot rewind a part with an iterable source")
+        self._chunks = self._iter_body()
+        self._buffer = bytearray()
+        self._position = 0
+        return 0
+
+    def to_string(self) -> bytes:
+        """
+        Reads the whole body into memory.  Useful for testing.
+        """
+        self.seek(0)
+        return self.read()
@@ -1,12 +1,12 @@
 
 import urllib.parse
-import requests
 import posixpath
 import logging
 import typing
 import webbrowser
 import json
 import time
+import threading
 import jose
 import os
 import jose.jwt
@@ -14,6 +14,7 @@ import cachetools
 import presalytics.lib
 import presalytics.lib.exceptions
 import presalytics.lib.constants as cnst
+import presalytics.client.transport
 
 
 logger = logging.getLogger(__name__)
@@ -24,7 +25,7 @@ def get_jwks():
     auth_host = os.environ.get("OIDC_AUTH_HOST", cnst.OIDC_AUTH_HOST)
     jwks_path = os.environ.get("jwks_path", ".well-known/jwks.json")
     jwks_endpoint = posixpath.join(auth_host, jwks_path)
-    r = requests.get(jwks_endpoint)
+    r = presalytics.client.transport.get_session().get(jwks_endpoint)
     if r.status_code == 200:
         jwks = r.json()
         logger.debug('Updated Json Web Key Set from {}'.format(jwks_endpoint))
@@ -33,6 +34,36 @@ def get_jwks():
         raise presalytics.lib.exceptions.ApiError(message="Could not get jwks from Uri", status_code=r.status_code)
 
 
+_jwks_index_lock = threading.Lock()
+_jwks_index: typing.Tuple[typing.Optional[typing.Dict], typing.Dict[str, typing.Dict]] = (None, {})
+
+
+def get_jwks_index() -> typing.Dict[str, typing.Dict]:
+    """
+    Returns the keys from `get_jwks` indexed by key id ("kid").  The index is rebuilt
+    only when `get_jwks` returns a refreshed Json Web Key Set.
+    """
+    global _jwks_index
+    jwks = get_jwks()
+    cached_jwks, index = _jwks_index
+    if cached_jwks is not jwks:
+        index = {}
+        for key in jwks["keys"]:
+            index[key["kid"]] = {
+                "kty": key["kty"],
+                "kid": key["kid"],
+                "use": key["use"],
+                "n": key["n"],
+                "e": key["e"]
+            }
+        with _jwks_index_lock:
+            _jwks_index = (jwks, index)
+    return index
+
+
+_claims_cache_lock = threading.Lock()
+_claims_cache = cachetools.LRUCache(maxsize=1024)
+
 
 class OidcClient(object):
     """
@@ -124,7 +155,7 @@ class OidcClient(object):
             }
             repoll = True
             while repoll:
-                token_response = requests.post(self.token_endpoint, auth_data, headers=headers)
+                token_response = presalytics.client.transport.get_session().post(self.token_endpoint, auth_data, headers=headers)
                 if token_response.status_code != 200:
                     err_resp = token_response.json()
                     err_msg = err_resp["error"]
@@ -151,20 +182,20 @@ class OidcClient(object):
 
     def validate_token(self, token):
         """
-        Validate a token
+        Validate a token and return its claims.  Validated claims are memoized per token
+        (in a bounded, process-wide LRU cache) until the token's `exp` claim, so repeat 
+        validations of the same token do not decode it again.
         """
+        cache_key = (token, self.audience, self.auth_host)
+        with _claims_cache_lock:
+            claims = _claims_cache.get(cache_key, None)
+        if claims is not None:
+            if claims["exp"] > time.time():
+                return dict(claims)
+            with _claims_cache_lock:
+                _claims_cache.pop(cache_key, None)
         unverified_header = jose.jwt.get_unverified_header(token)
-        rsa_key = {}
-        jwks = get_jwks()
-        for key in jwks["keys"]:
-            if key["kid"] == unverified_header["kid"]:
-                rsa_key = {
-                    "kty": key["kty"],
-                    "kid": key["kid"],
-                    "use": key["use"],
-                    "n": key["n"],
-                    "e": key["e"]
-                }
+        rsa_key = get_jwks_index().get(unverified_header["kid"], None)
         if rsa_key:
             try:
                 payload = jose.jwt.decode(
@@ -181,11 +212,12 @@ class OidcClient(object):
             except Exception:
                 raise presalytics.lib.exceptions.ApiError(message="invalid token (likely malformed)", status_code=401)
             logger.debug("Access token validated.")
+            if isinstance(payload.get("exp", None), (int, float)):
+                with _claims_cache_lock:
+                    _claims_cache[cache_key] = dict(payload)
             return payload
         
         raise presalytics.lib.exceptions.ApiError(message="invalid_header: could not find key in jwks",status_code=401)
-        
-
 
     def refresh_token(self, refresh_token, scope=None):
         """
@@ -214,7 +246,7 @@ class OidcClient(object):
         try:
             if 'content-type' not in [x.lower() for x in headers.keys()]:
                 headers.update({'content-type': 'application/x-www-form-urlencoded'})
-            response = requests.post(endpoint, data, headers=headers)
+            response = presalytics.client.transport.get_session().post(endpoint, data, headers=headers)
         except Exception as ex:
             logger.exception(ex)
             raise ex
@@ -267,9 +299,11 @@ class OidcClient(object):
         }
         return self._post(self.token_endpoint, post_data)
 
+    USER_ID_CLAIM = 'https://api.presalytics.io/api_user_id'
+
     def get_user_id(self, token) -> str:
-        payload = presalytics.client.oidc.OidcClient().validate_token(token)
-        return payload.get('https://api.presalytics.io/api_user_id', None)
+        payload = self.validate_token(token)
+        return payload.get(self.USER_ID_CLAIM, None)
 
     
         
@@ -0,0 +1,82 @@
+import typing
+import presalytics.lib.exceptions
+import presalytics.client.polling
+import presalytics.client.presalytics_ooxml_automation.api.default_api
+
+
+class OoxmlAutomationApi(presalytics.client.presalytics_ooxml_automation.api.default_api.DefaultApi):
+    """
+    Extends `presalytics.client.presalytics_ooxml_automation.api.default_api.DefaultApi` with
+    bulk operations that are not part of the generated Ooxml Automation service interface
+    """
+    SVG_POLL_INITIAL_INTERVAL = 0.5
+    SVG_POLL_DEADLINE = 60
+
+    TEMP_DATA_PREFIX = "Temp data"
+
+    def fetch_svg(self, id, endpoint_map) -> typing.Optional[str]:
+        """
+        Requests the svg for a single Ooxml Automation object.  Returns None if the service is still
+        rendering the svg (i.e., the service responded with "Temp data").
+
+        Parameters
+        ----------
+        id : str
+            The Ooxml Automation service id of the object
+
+        endpoint_map : presalytics.lib.widgets.ooxml.OoxmlEndpointMap
+            The endpoint map for the object's type
+
+        Returns
+        ----------
+        A `str` containing the svg, or None if the svg is not ready
+        """
+        session = self.api_client.get_parent().session
+        response = session.get(endpoint_map.get_svg_url(id))
+        if response.status_code != 200:
+            raise presalytics.lib.exceptions.ApiError(message=response.text, status_code=response.status_code)
+        if response.text.startswith(self.TEMP_DATA_PREFIX):
+            return None
+        return response.text
+
+    def fetch_svgs(self,
+                   ids: typing.Iterable[str],
+                   endpoint_map,
+                   max_concurrency: int = None) -> typing.Iterator[typing.Tuple[str, str]]:
+        """
+        Fetches svgs for many Ooxml Automation objects in parallel over the client's pooled session.
+        Results are yielded as each request completes.  Objects that the service is still rendering
+        are re-requested together by a `presalytics.client.polling.Poller`, with exponential backoff.
+
+            for id, svg in client.ooxml_automation.fetch_svgs(slide_ids, OoxmlEndpointMap.slide()):
+                ...
+
+        Parameters
+        ----------
+        ids : iterable of str
+            The Ooxml Automation service ids of the objects
+
+        endpoint_map : presalytics.lib.widgets.ooxml.OoxmlEndpointMap or dict
+            The endpoint map for the objects' type, or a `dict` mapping each id to its endpoint map
+
+        max_concurrency : int, optional
+            Defaults to 8.  The maximum number of requests in flight at once
+
+        Raises a `presalytics.lib.exceptions.PollingTimeout` if svgs are still rendering after `SVG_POLL_DEADLINE` seconds.
+
+        Returns
+        ----------
+        An iterator of (id, svg) `tuple` objects, in order of completion
+        """
+        poller = presalytics.client.polling.Poller(
+            initial_interval=self.SVG_POLL_INITIAL_INTERVAL,
+            deadline=self.SVG_POLL_DEADLINE,
+            max_concurrency=max_concurrency
+        )
+
+        def check(id):
+            id_map = endpoint_map[id] if isinstance(endpoint_map, dict) else endpoint_map
+            svg = self.fetch_svg(id, id_map)
+            return svg is not None, svg
+
+        return poller.poll(ids, check)
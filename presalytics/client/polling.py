@@ -0,0 +1,138 @@
+import concurrent.futures
+import logging
+import random
+import time
+import typing
+import presalytics.lib.exceptions
+
+
+logger = logging.getLogger(__name__)
+
+
+K = typing.TypeVar('K')
+R = typing.TypeVar('R')
+
+
+class Poller(object):
+    """
+    Waits on many long-running server-side tasks at once (e.g., story outline processing or svg rendering)
+
+    Each polling cycle checks every pending key, yields the keys that have finished, and then sleeps
+    before checking the remaining keys together on the next cycle.  The sleep starts at `initial_interval`
+    and grows by `multiplier` each cycle up to `max_interval`, with random jitter so that many
+    clients do not poll in lockstep.  Polling stops with a `presalytics.lib.exceptions.PollingTimeout`
+    when `deadline` seconds have passed.
+
+    Parameters
+    ----------
+    initial_interval : float, optional
+        Defaults to 0.5.  The number of seconds to wait after the first polling cycle.
+
+    max_interval : float, optional
+        Defaults to 10.  The maximum number of seconds to wait between polling cycles.
+
+    multiplier : float, optional
+        Defaults to 2.  The factor that the wait grows by after each polling cycle.
+
+    jitter : float, optional
+        Defaults to 0.2.  Each wait is randomly scaled by up to +/- this fraction.
+
+    deadline : float, optional
+        Defaults to 600.  The number of seconds after which polling is abandoned.
+
+    max_concurrency : int, optional
+        Defaults to 8.  The maximum number of checks run in parallel during a polling cycle.
+    """
+    DEFAULT_INITIAL_INTERVAL = 0.5
+    DEFAULT_MAX_INTERVAL = 10
+    DEFAULT_MULTIPLIER = 2
+    DEFAULT_JITTER = 0.2
+    DEFAULT_DEADLINE = 600
+    DEFAULT_MAX_CONCURRENCY = 8
+
+    def __init__(self,
+                 initial_interval: float = None,
+                 max_interval: float = None,
+                 multiplier: float = None,
+                 jitter: float = None,
+                 deadline: float = None,
+                 max_concurrency: int = None):
+        self.initial_interval = initial_interval if initial_interval is not None else self.DEFAULT_INITIAL_INTERVAL
+        self.max_interval = max_interval if max_interval is not None else self.DEFAULT_MAX_INTERVAL
+        self.multiplier = multiplier if multiplier is not None else self.DEFAULT_MULTIPLIER
+        self.jitter = jitter if jitter is not None else self.DEFAULT_JITTER
+        self.deadline = deadline if deadline is not None else self.DEFAULT_DEADLINE
+        self.max_concurrency = max_concurrency or self.DEFAULT_MAX_CONCURRENCY
+
+    def intervals(self) -> typing.Iterator[float]:
+        """
+        Yields the wait, in seconds, before each successive polling cycle
+        """
+        interval = self.initial_interval
+        while True:
+            yield max(0.0, interval * (1 + random.uniform(-self.jitter, self.jitter)))
+            interval = min(interval * self.multiplier, self.max_interval)
+
+    def poll(self,
+             keys: typing.Iterable[K],
+             check: typing.Callable[[K], typing.Tuple[bool, R]]) -> typing.Iterator[typing.Tuple[K, R]]:
+        """
+        Polls `check` for each key until every key has finished
+
+        Parameters
+        ----------
+        keys : iterable
+            Identifiers of the tasks to wait on (e.g., story ids).  Duplicates are polled once.
+
+        check : callable
+            Called with a key, and returns a (done, result) `tuple`.  Exceptions raised by `check`
+            propagate to the caller.
+
+        Returns
+        ----------
+        An iterator of (key, result) `tuple` objects, in order of completion
+        """
+        pending = list(dict.fromkeys(keys))
+        start = time.monotonic()
+        intervals = self.intervals()
+        executor = None
+        if self.max_concurrency > 1 and len(pending) > 1:
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(pending)))
+        try:
+            while pending:
+                not_ready = []
+                for key, (done, result) in self._check_all(pending, check, executor):
+                    if done:
+                        yield key, result
+                    else:
+                        not_ready.append(key)
+                pending = not_ready
+                if pending:
+                    remaining = self.deadline - (time.monotonic() - start)
+                    if remaining <= 0:
+                        message = "Timed out after {0} seconds waiting on {1} task(s)".format(self.deadline, len(pending))
+                        raise presalytics.lib.exceptions.PollingTimeout(message=message)
+                    wait = min(next(intervals), remaining)
+                    logger.info("{0} task(s) still running.  Rechecking in {1:.2f} seconds".format(len(pending), wait))
+                    time.sleep(wait)
+        finally:
+            if executor:
+                executor.shutdown(wait=False)
+
+    @staticmethod
+    def _check_all(pending, check, executor):
+        if executor is None:
+            for key in pending:
+                yield key, check(key)
+        else:
+            futures = {executor.submit(check, key): key for key in pending}
+            for future in concurrent.futures.as_completed(futures):
+                yield futures[future], future.result()
+
+    def wait(self, key: K, check: typing.Callable[[K], typing.Tuple[bool, R]]) -> R:
+        """
+        Convenience method to poll a single key and return its result
+        """
+        for _, result in self.poll([key], check):
+            return result
+        raise presalytics.lib.exceptions.PollingTimeout()
@@ -0,0 +1,179 @@
+import collections
+import hashlib
+import logging
+import threading
+import time
+import typing
+import presalytics
+import presalytics.lib.constants as cnst
+import presalytics.client.api
+if typing.TYPE_CHECKING:
+    from presalytics.client.api import Client
+
+
+logger = logging.getLogger(__name__)
+
+
+class ClientPool(object):
+    """
+    A thread-safe, process-wide cache of `presalytics.client.api.Client` instances.
+
+    Building a `presalytics.client.api.Client` is expensive: each instance creates a new
+    `presalytics.client.oidc.OidcClient`, three api clients with their own connection pools and
+    checks its tokens on initialization.  Components call `presalytics.story.components.ComponentBase.get_client`
+    many times during a render, so the pool hands back the same warm client for the same `client_info`,
+    allowing connections and token state to be reused across widgets.
+
+    Clients are keyed by the identity of the user (the token or the username), the `client_id` and
+    `delegate_login`.  Entries that have not been used for `idle_timeout` seconds are evicted, and the
+    least recently used entry is evicted when the pool grows beyond `max_size`.
+
+    Parameters
+    ----------
+    max_size : int, optional
+        Defaults to 32.  The maximum number of clients held by the pool.  Set from `presalytics.CONFIG`
+        with keyword `["CLIENT_POOL_MAX_SIZE"]`.
+
+    idle_timeout : float, optional
+        Defaults to 600 seconds.  The time a client can sit unused in the pool before it is evicted.  Set from
+        `presalytics.CONFIG` with keyword `["CLIENT_POOL_IDLE_TIMEOUT"]`.
+    """
+    DEFAULT_MAX_SIZE = 32
+    DEFAULT_IDLE_TIMEOUT = 600
+
+    IDENTITY_KEYS = ['token', 'username', 'client_id', 'delegate_login']
+
+    def __init__(self, max_size: int = None, idle_timeout: float = None):
+        if max_size is None:
+            max_size = presalytics.CONFIG.get("CLIENT_POOL_MAX_SIZE", self.DEFAULT_MAX_SIZE)
+        if idle_timeout is None:
+            idle_timeout = presalytics.CONFIG.get("CLIENT_POOL_IDLE_TIMEOUT", self.DEFAULT_IDLE_TIMEOUT)
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self._entries: typing.MutableMapping[typing.Tuple, typing.List] = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._build_locks: typing.Dict[typing.Tuple, threading.Lock] = {}
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    @staticmethod
+    def _digest(value: str) -> str:
+        return hashlib.sha256(value.encode('utf-8')).hexdigest()
+
+    @classmethod
+    def get_pool_key(cls, **client_info) -> typing.Tuple:
+        """
+        Builds the key that identifies a client in the pool from the keyword arguments
+        that would be passed to `presalytics.client.api.Client`.  Secrets are hashed so
+        they are not held in the pool's keys.
+
+        Returns
+        ----------
+        A hashable `tuple` of (identity, client_id, delegate_login, extra arguments digest)
+        """
+        token = client_info.get('token', None)
+        if isinstance(token, dict):
+            token = token.get('refresh_token', None) or token.get('access_token', None)
+        if token:
+            identity = "token:" + cls._digest(str(token))
+        else:
+            username = client_info.get('username', None) or presalytics.CONFIG.get("USERNAME", None)
+            identity = "user:{0}".format(username)
+        client_id = client_info.get('client_id', None) or presalytics.CONFIG.get("CLIENT_ID", cnst.DEFAULT_CLIENT_ID)
+        delegate_login = bool(client_info.get('delegate_login', False) or presalytics.CONFIG.get("DELEGATE_LOGIN", False))
+        extras = sorted((k, repr(v)) for k, v in client_info.items() if k not in cls.IDENTITY_KEYS)
+        return (identity, client_id, delegate_login, cls._digest(repr(extras)))
+
+    def get_client(self, **client_info) -> 'Client':
+        """
+        Returns a pooled `presalytics.client.api.Client` for `client_info`, building a new one if
+        there is no live entry for its key.  Concurrent requests for the same key wait on a single
+        build rather than each building their own client.
+        """
+        key = self.get_pool_key(**client_info)
+        client = self._checkout(key)
+        if client is not None:
+            return client
+        with self._lock:
+            build_lock = self._build_locks.setdefault(key, threading.Lock())
+        with build_lock:
+            client = self._checkout(key)
+            if client is None:
+                client = presalytics.client.api.Client(**client_info)
+                with self._lock:
+                    self._entries[key] = [client, time.monotonic()]
+                    self._evict(time.monotonic())
+        with self._lock:
+            self._build_locks.pop(key, None)
+        return client
+
+    def _checkout(self, key) -> typing.Optional['Client']:
+        now = time.monotonic()
+        with self._lock:
+            self._evict(now)
+            entry = self._entries.get(key, None)
+            if entry is None:
+                return None
+            entry[1] = now
+            self._entries.move_to_end(key)  # type: ignore
+            return entry[0]
+
+    def _evict(self, now: float):
+        """ Caller must hold `self._lock`.  Entries are ordered from least to most recently used. """
+        while self._entries:
+            key, (client, last_used) = next(iter(self._entries.items()))
+            if len(self._entries) <= self.max_size and now - last_used < self.idle_timeout:
+                break
+            del self._entries[key]
+            logger.debug("Evicting idle client from client pool")
+            self._close(client)
+
+    @staticmethod
+    def _close(client: 'Client'):
+        try:
+            client.close()
+        except Exception as ex:
+            logger.exception(ex)
+
+    def evict_idle(self):
+        """
+        Removes clients that have been idle longer than `idle_timeout`
+        """
+        with self._lock:
+            self._evict(time.monotonic())
+
+    def clear(self):
+        """
+        Removes all clients from the pool and closes their connections
+        """
+        with self._lock:
+            clients = [entry[0] for entry in self._entries.values()]
+            self._entries.clear()
+        for client in clients:
+            self._close(client)
+
+
+_POOL: typing.Optional[ClientPool] = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_client_pool() -> ClientPool:
+    """
+    Returns the process-wide `presalytics.client.pool.ClientPool`
+    """
+    global _POOL
+    if _POOL is None:
+        with _POOL_LOCK:
+            if _POOL is None:
+                _POOL = ClientPool()
+    return _POOL
+
+
+def get_pooled_client(**client_info) -> 'Client':
+    """
+    Convenience method for fetching a `presalytics.client.api.Client` from the process-wide pool.  Takes
+    the same keyword arguments as `presalytics.client.api.Client`.
+    """
+    return get_client_pool().get_client(**client_info)
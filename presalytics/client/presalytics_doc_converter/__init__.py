@@ -17,18 +17,22 @@ from __future__ import absolute_import
 
 __version__ = "1.0.0"
 
-# import apis into sdk package
-from presalytics.client.presalytics_doc_converter.api.default_api import DefaultApi
-
-# import ApiClient
-from presalytics.client.presalytics_doc_converter.api_client import ApiClient
-from presalytics.client.presalytics_doc_converter.configuration import Configuration
-from presalytics.client.presalytics_doc_converter.exceptions import OpenApiException
-from presalytics.client.presalytics_doc_converter.exceptions import ApiTypeError
-from presalytics.client.presalytics_doc_converter.exceptions import ApiValueError
-from presalytics.client.presalytics_doc_converter.exceptions import ApiKeyError
-from presalytics.client.presalytics_doc_converter.exceptions import ApiException
-# import models into sdk package
-from presalytics.client.presalytics_doc_converter.models.file_to_convert import FileToConvert
-from presalytics.client.presalytics_doc_converter.models.file_url import FileUrl
-
+import presalytics.lib.util
+
+# apis, models and the api client are imported when they are first accessed
+_LAZY_IMPORTS = {
+    "DefaultApi": "presalytics.client.presalytics_doc_converter.api.default_api",
+    "ApiClient": "presalytics.client.presalytics_doc_converter.api_client",
+    "Configuration": "presalytics.client.presalytics_doc_converter.configuration",
+    "OpenApiException": "presalytics.client.presalytics_doc_converter.exceptions",
+    "ApiTypeError": "presalytics.client.presalytics_doc_converter.exceptions",
+    "ApiValueError": "presalytics.client.presalytics_doc_converter.exceptions",
+    "ApiKeyError": "presalytics.client.presalytics_doc_converter.exceptions",
+    "ApiException": "presalytics.client.presalytics_doc_converter.exceptions",
+    "FileToConvert": "presalytics.client.presalytics_doc_converter.models.file_to_convert",
+    "FileUrl": "presalytics.client.presalytics_doc_converter.models.file_url"
+}
+
+__all__ = list(_LAZY_IMPORTS.keys())
+
+__getattr__, __dir__ = presalytics.lib.util.lazy_module_attributes(__name__, _LAZY_IMPORTS)
@@ -2,5 +2,13 @@ from __future__ import absolute_import
 
 # flake8: noqa
 
-# import apis into api package
-from presalytics.client.presalytics_doc_converter.api.default_api import DefaultApi
+import presalytics.lib.util
+
+# apis are imported when they are first accessed
+_LAZY_IMPORTS = {
+    "DefaultApi": "presalytics.client.presalytics_doc_converter.api.default_api"
+}
+
+__all__ = list(_LAZY_IMPORTS.keys())
+
+__getattr__, __dir__ = presalytics.lib.util.lazy_module_attributes(__name__, _LAZY_IMPORTS)
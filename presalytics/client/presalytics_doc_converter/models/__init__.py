@@ -14,6 +14,14 @@
 
 from __future__ import absolute_import
 
-# import models into model package
-from presalytics.client.presalytics_doc_converter.models.file_to_convert import FileToConvert
-from presalytics.client.presalytics_doc_converter.models.file_url import FileUrl
+import presalytics.lib.util
+
+# models are imported when they are first accessed
+_LAZY_IMPORTS = {
+    "FileToConvert": "presalytics.client.presalytics_doc_converter.models.file_to_convert",
+    "FileUrl": "presalytics.client.presalytics_doc_converter.models.file_url"
+}
+
+__all__ = list(_LAZY_IMPORTS.keys())
+
+__getattr__, __dir__ = presalytics.lib.util.lazy_module_attributes(__name__, _LAZY_IMPORTS)
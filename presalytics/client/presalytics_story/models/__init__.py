@@ -13,33 +13,41 @@
 
 from __future__ import absolute_import
 
-# import models into model package
-from presalytics.client.presalytics_story.models.add_new_collaborator_request import AddNewCollaboratorRequest
-from presalytics.client.presalytics_story.models.base_model import BaseModel
-from presalytics.client.presalytics_story.models.cache_post_request import CachePostRequest
-from presalytics.client.presalytics_story.models.collaborator_bulk_update_request import CollaboratorBulkUpdateRequest
-from presalytics.client.presalytics_story.models.create_session_request import CreateSessionRequest
-from presalytics.client.presalytics_story.models.event import Event
-from presalytics.client.presalytics_story.models.event_all_of import EventAllOf
-from presalytics.client.presalytics_story.models.file_upload import FileUpload
-from presalytics.client.presalytics_story.models.manage_event import ManageEvent
-from presalytics.client.presalytics_story.models.message import Message
-from presalytics.client.presalytics_story.models.modify_inactive_collaborator import ModifyInactiveCollaborator
-from presalytics.client.presalytics_story.models.ooxml_document import OoxmlDocument
-from presalytics.client.presalytics_story.models.ooxml_document_all_of import OoxmlDocumentAllOf
-from presalytics.client.presalytics_story.models.outline import Outline
-from presalytics.client.presalytics_story.models.permission_type import PermissionType
-from presalytics.client.presalytics_story.models.permission_type_all_of import PermissionTypeAllOf
-from presalytics.client.presalytics_story.models.problem_detail import ProblemDetail
-from presalytics.client.presalytics_story.models.required_parameters_to_create_a_view import RequiredParametersToCreateAView
-from presalytics.client.presalytics_story.models.session import Session
-from presalytics.client.presalytics_story.models.session_all_of import SessionAllOf
-from presalytics.client.presalytics_story.models.status import Status
-from presalytics.client.presalytics_story.models.story import Story
-from presalytics.client.presalytics_story.models.story_all_of import StoryAllOf
-from presalytics.client.presalytics_story.models.story_collaborator import StoryCollaborator
-from presalytics.client.presalytics_story.models.story_collaborator_all_of import StoryCollaboratorAllOf
-from presalytics.client.presalytics_story.models.story_outline_history import StoryOutlineHistory
-from presalytics.client.presalytics_story.models.story_outline_history_all_of import StoryOutlineHistoryAllOf
-from presalytics.client.presalytics_story.models.view import View
-from presalytics.client.presalytics_story.models.view_all_of import ViewAllOf
+import presalytics.lib.util
+
+# models are imported when they are first accessed
+_LAZY_IMPORTS = {
+    "AddNewCollaboratorRequest": "presalytics.client.presalytics_story.models.add_new_collaborator_request",
+    "BaseModel": "presalytics.client.presalytics_story.models.base_model",
+    "CachePostRequest": "presalytics.client.presalytics_story.models.cache_post_request",
+    "CollaboratorBulkUpdateRequest": "presalytics.client.presalytics_story.models.collaborator_bulk_update_request",
+    "CreateSessionRequest": "presalytics.client.presalytics_story.models.create_session_request",
+    "Event": "presalytics.client.presalytics_story.models.event",
+    "EventAllOf": "presalytics.client.presalytics_story.models.event_all_of",
+    "FileUpload": "presalytics.client.presalytics_story.models.file_upload",
+    "ManageEvent": "presalytics.client.presalytics_story.models.manage_event",
+    "Message": "presalytics.client.presalytics_story.models.message",
+    "ModifyInactiveCollaborator": "presalytics.client.presalytics_story.models.modify_inactive_collaborator",
+    "OoxmlDocument": "presalytics.client.presalytics_story.models.ooxml_document",
+    "OoxmlDocumentAllOf": "presalytics.client.presalytics_story.models.ooxml_document_all_of",
+    "Outline": "presalytics.client.presalytics_story.models.outline",
+    "PermissionType": "presalytics.client.presalytics_story.models.permission_type",
+    "PermissionTypeAllOf": "presalytics.client.presalytics_story.models.permission_type_all_of",
+    "ProblemDetail": "presalytics.client.presalytics_story.models.problem_detail",
+    "RequiredParametersToCreateAView": "presalytics.client.presalytics_story.models.required_parameters_to_create_a_view",
+    "Session": "presalytics.client.presalytics_story.models.session",
+    "SessionAllOf": "presalytics.client.presalytics_story.models.session_all_of",
+    "Status": "presalytics.client.presalytics_story.models.status",
+    "Story": "presalytics.client.presalytics_story.models.story",
+    "StoryAllOf": "presalytics.client.presalytics_story.models.story_all_of",
+    "StoryCollaborator": "presalytics.client.presalytics_story.models.story_collaborator",
+    "StoryCollaboratorAllOf": "presalytics.client.presalytics_story.models.story_collaborator_all_of",
+    "StoryOutlineHistory": "presalytics.client.presalytics_story.models.story_outline_history",
+    "StoryOutlineHistoryAllOf": "presalytics.client.presalytics_story.models.story_outline_history_all_of",
+    "View": "presalytics.client.presalytics_story.models.view",
+    "ViewAllOf": "presalytics.client.presalytics_story.models.view_all_of"
+}
+
+__all__ = list(_LAZY_IMPORTS.keys())
+
+__getattr__, __dir__ = presalytics.lib.util.lazy_module_attributes(__name__, _LAZY_IMPORTS)
@@ -0,0 +1,274 @@
+import abc
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import typing
+import cachetools
+import presalytics
+import presalytics.lib.constants
+import presalytics.lib.exceptions
+import presalytics.lib.json_codec
+import presalytics.story.outline
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore
+    import msvcrt
+
+
+logger = logging.getLogger(__name__)
+
+
+def get_token_store_key(username: typing.Optional[str], client_id: str) -> str:
+    """
+    Builds the key that a `presalytics.client.api.Client` uses to find its tokens in a token store
+    """
+    return "{0}:{1}".format(client_id, username or "")
+
+
+class TokenStoreBase(abc.ABC):
+    """
+    Interface for token caches shared across `presalytics.client.api.Client` instances.  Tokens are
+    stored under a key built from the user and the client_id (see `get_token_store_key`),
+    so one store can safely hold tokens for many users.
+    """
+    @abc.abstractmethod
+    def get(self, key: str) -> typing.Optional[typing.Dict]:
+        """
+        Returns the token stored under `key`, or None
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def put(self, key: str, token: typing.Dict):
+        """
+        Stores `token` under `key`
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def delete(self, key: str):
+        """
+        Removes the token stored under `key`, if any
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def dumps(token: typing.Dict) -> str:
+        return presalytics.lib.json_codec.dumps(token, default=presalytics.story.outline.outline_default)
+
+    @staticmethod
+    def loads(data: str) -> typing.Dict:
+        return presalytics.lib.json_codec.loads(data)
+
+
+class MemoryTokenStore(TokenStoreBase):
+    """
+    A thread-safe, in-process token store.  Holds up to `maxsize` tokens, evicting the least
+    recently used.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Defaults to 1024.  The maximum number of tokens held by the store.
+    """
+    def __init__(self, maxsize=1024):
+        self._cache = cachetools.LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            token = self._cache.get(key, None)
+        return dict(token) if token is not None else None
+
+    def put(self, key, token):
+        with self._lock:
+            self._cache[key] = dict(token)
+
+    def delete(self, key):
+        with self._lock:
+            self._cache.pop(key, None)
+
+
+class FileTokenStore(TokenStoreBase):
+    """
+    Stores tokens in a json file, keyed by user and client_id.  Reads and writes hold an exclusive
+    lock on a companion ".lock" file, and writes replace the file atomically, so the store can be
+    shared by multiple processes (e.g., gunicorn workers and cron jobs) on the same host.
+
+    Files written by earlier versions of this package contain a single token, and are ignored.
+
+    Parameters
+    ----------
+    path : str, optional
+        Defaults to "token.json" in the current working directory.
+    """
+    def __init__(self, path=None):
+        self.path = path or presalytics.lib.constants.TOKEN_FILE
+        self.lock_path = self.path + ".lock"
+        self._thread_lock = threading.Lock()
+
+    def _lock(self):
+        store = self
+
+        class _FileLock(object):
+            def __enter__(self):
+                store._thread_lock.acquire()
+                try:
+                    self.handle = open(store.lock_path, 'a+')
+                    if fcntl:
+                        fcntl.flock(self.handle.fileno(), fcntl.LOCK_EX)
+                    else:
+                        self.handle.seek(0)
+                        msvcrt.locking(self.handle.fileno(), msvcrt.LK_LOCK, 1)
+                except Exception:
+                    store._thread_lock.release()
+                    raise
+                return self
+
+            def __exit__(self, *args):
+                try:
+                    if fcntl:
+                        fcntl.flock(self.handle.fileno(), fcntl.LOCK_UN)
+                    else:
+                        self.handle.seek(0)
+                        msvcrt.locking(self.handle.fileno(), msvcrt.LK_UNLCK, 1)
+                    self.handle.close()
+                finally:
+                    store._thread_lock.release()
+
+        return _FileLock()
+
+    def _read(self) -> typing.Dict[str, typing.Dict]:
+        try:
+            with open(self.path, 'r') as f:
+                data = self.loads(f.read())
+        except (IOError, OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or "access_token" in data:
+            return {}  # legacy single-token file
+        return data
+
+    def _write(self, data: typing.Dict[str, typing.Dict]):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".token-")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(self.dumps(data))
+            os.replace(tmp_path, self.path)
+        except Exception:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def get(self, key):
+        with self._lock():
+            return self._read().get(key, None)
+
+    def put(self, key, token):
+        with self._lock():
+            data = self._read()
+            data[key] = token
+            self._write(data)
+
+    def delete(self, key):
+        with self._lock():
+            data = self._read()
+            if data.pop(key, None) is not None:
+                self._write(data)
+
+
+class SqliteTokenStore(TokenStoreBase):
+    """
+    Stores tokens in a SQLite database, keyed by user and client_id.  SQLite's locking makes the store
+    safe to share between processes, and the database can hold tokens for many users.
+
+    Parameters
+    ----------
+    path : str, optional
+        Defaults to "token.sqlite3" in the current working directory.
+    """
+    DEFAULT_PATH = "token.sqlite3"
+
+    def __init__(self, path=None):
+        self.path = path or self.DEFAULT_PATH
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("CREATE TABLE IF NOT EXISTS tokens (key TEXT PRIMARY KEY, token TEXT NOT NULL, updated REAL NOT NULL)")
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def get(self, key):
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT token FROM tokens WHERE key = ?", (key,)).fetchone()
+        finally:
+            conn.close()
+        return self.loads(row[0]) if row else None
+
+    def put(self, key, token):
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO tokens (key, token, updated) VALUES (?, ?, ?)",
+                    (key, self.dumps(token), time.time())
+                )
+        finally:
+            conn.close()
+
+    def delete(self, key):
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM tokens WHERE key = ?", (key,))
+        finally:
+            conn.close()
+
+
+TOKEN_STORE_BACKENDS = {
+    "memory": MemoryTokenStore,
+    "file": FileTokenStore,
+    "sqlite": SqliteTokenStore
+}
+
+_stores: typing.Dict[typing.Tuple, TokenStoreBase] = {}
+_stores_lock = threading.Lock()
+
+
+def get_token_store(backend: str = None, path: str = None) -> TokenStoreBase:
+    """
+    Returns the process-wide token store for a backend.  Set from `presalytics.CONFIG` with keywords
+    `["TOKEN_STORE"]` ("memory", "file" or "sqlite", defaults to "file") and `["TOKEN_STORE_PATH"]`.
+
+    Parameters
+    ----------
+    backend : str, optional
+        The token store backend. One of "memory", "file" or "sqlite".
+
+    path : str, optional
+        The location of the "file" or "sqlite" store
+    """
+    if backend is None:
+        backend = presalytics.CONFIG.get("TOKEN_STORE", "file")
+    if path is None:
+        path = presalytics.CONFIG.get("TOKEN_STORE_PATH", None)
+    try:
+        store_class = TOKEN_STORE_BACKENDS[backend.lower()]
+    except KeyError:
+        message = "Unknown token store '{0}'.  Choose from: {1}".format(backend, ", ".join(TOKEN_STORE_BACKENDS.keys()))
+        raise presalytics.lib.exceptions.InvalidConfigurationError(message=message)
+    key = (backend.lower(), os.path.abspath(path) if path else None)
+    with _stores_lock:
+        if key not in _stores:
+            _stores[key] = store_class() if store_class is MemoryTokenStore else store_class(path)
+        return _stores[key]
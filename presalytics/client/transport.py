@@ -0,0 +1,92 @@
+import logging
+import threading
+import typing
+import weakref
+import requests
+import requests.adapters
+import urllib3.util.retry
+import presalytics
+import presalytics.client.auth
+if typing.TYPE_CHECKING:
+    from presalytics.client.api import Client
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_POOL_MAXSIZE = 20
+DEFAULT_MAX_RETRIES = 3
+
+
+def mount_adapters(session: requests.Session) -> requests.Session:
+    """
+    Mounts keep-alive, connection-pooled adapters on a `requests.Session`.  Idempotent requests are
+    retried on connection errors and on 502, 503 and 504 responses.
+
+    The maximum number of pooled connections per host is set from `presalytics.CONFIG` with
+    keyword `["HTTP_POOL_MAXSIZE"]`, and defaults to 20.
+    """
+    pool_maxsize = presalytics.CONFIG.get("HTTP_POOL_MAXSIZE", DEFAULT_POOL_MAXSIZE)
+    retries = urllib3.util.retry.Retry(
+        total=DEFAULT_MAX_RETRIES,
+        read=False,
+        backoff_factor=0.3,
+        status_forcelist=[502, 503, 504],
+        raise_on_status=False
+    )
+    adapter = requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=pool_maxsize, max_retries=retries)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+class ClientSession(requests.Session):
+    """
+    A keep-alive, connection-pooled `requests.Session` bound to a `presalytics.client.api.Client`.
+
+    Each request carries the client's authorization, request id and user agent headers, so
+    raw calls to the Presalytics API (e.g., svg and xml endpoints) share connections
+    instead of opening a new connection per call.
+
+    Parameters
+    ----------
+    client : presalytics.client.api.Client
+        The client that supplies authorization and request id headers.  Held as a weak reference.
+    """
+    def __init__(self, client: 'Client'):
+        super(ClientSession, self).__init__()
+        self._client = weakref.ref(client)
+        mount_adapters(self)
+        self.headers.update({
+            'User-Agent': presalytics.client.auth.AuthenticationMixIn.get_user_agent()
+        })
+
+    def request(self, method, url, *args, **kwargs):  # type: ignore
+        headers = dict(kwargs.pop('headers', None) or {})
+        client = self._client()
+        if client is not None:
+            headers.update(client.get_auth_header())
+            if not headers.get("X-Request-Id"):
+                headers.update(client.get_request_id_header())
+        logger.info("Sending {0} message to {1}. Request Id: {2}".format(method, url, headers.get("X-Request-Id")))
+        response = super(ClientSession, self).request(method, url, *args, headers=headers, **kwargs)
+        logger.info("{0} response received from {1}".format(method, url))
+        return response
+
+
+_SESSION: typing.Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Returns a process-wide, unauthenticated `requests.Session` with pooled connections.  Used for
+    calls that are not bound to a `presalytics.client.api.Client` (e.g., fetching json web keys and static files).
+    """
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                _SESSION = mount_adapters(requests.Session())
+    return _SESSION
+
@@ -16,8 +16,8 @@ def load_config(additional_paths: typing.List[str] = []) -> typing.Dict:
     'PRESALYTICS', the dictionary contained in the 'PRESALYTICS' is returned.
 
     *Note*: A environment variable called `autodiscover_paths` is automatically
-    loaded into the `additional_paths` keyword argument the the `presalytics` module
-    is imported.
+    loaded into the `additional_paths` keyword argument when `presalytics.init` runs
+    (or `presalytics.CONFIG` is first accessed).
 
     Parameters
     ----------
@@ -72,6 +72,20 @@ class ApiError(PresalyticsBaseException):
         super().__init__(message)
 
 
+class PollingTimeout(ApiError):
+    def __init__(self, message=None):
+        if not message:
+            message = "Timed out while waiting on the Presalytics API to finish processing."
+        super().__init__(message=message, status_code=None)
+
+
+class ChecksumMismatch(ApiError):
+    def __init__(self, message=None):
+        if not message:
+            message = "The checksum of the downloaded file does not match the expected checksum."
+        super().__init__(message=message, status_code=None)
+
+
 class InvalidConfigurationError(PresalyticsBaseException):
     def __init__(self, message=None):
         if not message:
@@ -0,0 +1,300 @@
+"""
+Pluggable json encoding and decoding for story outlines, api responses and tokens.
+
+Uses [orjson](https://github.com/ijl/orjson) when it is installed (`pip install presalytics[fast]`),
+and the standard library's `json` module otherwise.  Both backends produce the same compact json:
+
+* `datetime.datetime` objects are encoded as ISO 8601 strings.  Naive datetimes are treated as UTC.
+* `datetime.date` objects are encoded as ISO 8601 strings
+* `uuid.UUID` objects are encoded as strings
+* numpy arrays are encoded as `dict` objects holding their base64-encoded data, dtype and
+shape (see `presalytics.story.outline.json_numpy_obj_hook`), or as nested lists when `numpy=NUMPY_LIST`.
+* numpy scalars are encoded as python numbers
+
+The orjson backend encodes `dict`, `list`, `datetime`, `UUID` and numpy objects (in `NUMPY_LIST` mode) natively,
+so the `default` callback only runs for other objects (e.g., `presalytics.story.outline.OutlineBase` instances).
+
+The backend can be set in `presalytics.CONFIG` with the keyword `["JSON_BACKEND"]` ("orjson" or "json").
+"""
+import abc
+import base64
+import datetime
+import io
+import json
+import sys
+import threading
+import typing
+import uuid
+import presalytics
+from presalytics.lib.exceptions import InvalidConfigurationError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+
+NUMPY_BASE64 = "base64"
+"""
+Encodes numpy arrays as `{"__ndarray__": <base64 data>, "dtype": <dtype>, "shape": <shape>}` objects
+that are decoded back into arrays by `presalytics.story.outline.json_numpy_obj_hook`
+"""
+
+NUMPY_LIST = "list"
+"""
+Encodes numpy arrays as nested lists (e.g., for javascript libraries such as mpld3)
+"""
+
+Default = typing.Optional[typing.Callable[[typing.Any], typing.Any]]
+ObjectHook = typing.Optional[typing.Callable[[typing.Dict], typing.Any]]
+
+
+def encode_datetime(obj: datetime.datetime) -> str:
+    if obj.tzinfo is None:
+        obj = obj.replace(tzinfo=datetime.timezone.utc)
+    return obj.isoformat()
+
+
+def encode_ndarray(obj) -> typing.Dict:
+    """
+    Encodes a numpy array as a `dict` holding its dtype, shape and base64-encoded data
+    """
+    np = sys.modules["numpy"]
+    if not obj.flags['C_CONTIGUOUS']:
+        obj = np.ascontiguousarray(obj)
+    return dict(__ndarray__=base64.b64encode(obj.data).decode('utf-8'),
+                dtype=str(obj.dtype),
+                shape=obj.shape)
+
+
+def encode_default(obj, numpy: str = NUMPY_BASE64, default: Default = None):
+    """
+    Encodes objects that json does not support natively.  Raises a `TypeError` if
+    `obj` cannot be encoded.
+
+    Parameters
+    ----------
+    obj : object
+        The object to encode
+
+    numpy : str, optional
+        Defaults to `NUMPY_BASE64`. How numpy arrays are encoded, `NUMPY_BASE64` or `NUMPY_LIST`.
+
+    default : callable, optional
+        Called for objects that are not encoded by this function
+    """
+    if isinstance(obj, datetime.datetime):
+        return encode_datetime(obj)
+    if isinstance(obj, datetime.date):
+        return obj.isoformat()
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    # numpy can only be the type of `obj` if it has already been imported
+    np = sys.modules.get("numpy", None)
+    if np is not None:
+        if isinstance(obj, np.ndarray):
+            return obj.tolist() if numpy == NUMPY_LIST else encode_ndarray(obj)
+        if isinstance(obj, np.generic):
+            return obj.item()
+    if default is not None:
+        return default(obj)
+    raise TypeError("Object of type {0} is not JSON serializable".format(obj.__class__.__name__))
+
+
+def apply_object_hook(obj, object_hook: typing.Callable[[typing.Dict], typing.Any]):
+    """
+    Applies `object_hook` to every `dict` in a decoded json value, innermost first,
+    like the `object_hook` argument of `json.loads`
+    """
+    if isinstance(obj, dict):
+        return object_hook({k: apply_object_hook(v, object_hook) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return [apply_object_hook(v, object_hook) for v in obj]
+    return obj
+
+
+class JsonCodecBase(abc.ABC):
+    """
+    Base class for json backends
+    """
+    name: str
+
+    @abc.abstractmethod
+    def dumpb(self, obj, default: Default = None, numpy: str = NUMPY_BASE64, sort_keys: bool = False) -> bytes:
+        """
+        Encodes `obj` to utf-8 encoded json
+
+        Parameters
+        ----------
+        obj : object
+            The object to encode
+
+        default : callable, optional
+            Called with objects that cannot be encoded natively or by `presalytics.lib.json_codec.encode_default`.
+            Returns a json-serializable object or raises a `TypeError`.
+
+        numpy : str, optional
+            Defaults to `NUMPY_BASE64`. How numpy arrays are encoded, `NUMPY_BASE64` or `NUMPY_LIST`.
+
+        sort_keys : bool, optional
+            Defaults to False.  Sorts the keys of `dict` objects.
+
+        Returns
+        ----------
+        A `bytes` object
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def loads(self, data: typing.Union[str, bytes, bytearray, memoryview], object_hook: ObjectHook = None):
+        """
+        Decodes a json document.  Raises a `ValueError` if `data` is not valid json.
+
+        Parameters
+        ----------
+        data : str or bytes
+            The json document
+
+        object_hook : callable, optional
+            Called with each decoded `dict`, innermost first.  Its return value is used in place of the `dict`.
+        """
+        raise NotImplementedError
+
+    def dumps(self, obj, default: Default = None, numpy: str = NUMPY_BASE64, sort_keys: bool = False) -> str:
+        """
+        Encodes `obj` to a json `str`.  Takes the same arguments as `dumpb`.
+        """
+        return self.dumpb(obj, default=default, numpy=numpy, sort_keys=sort_keys).decode('utf-8')
+
+
+class StdlibJsonCodec(JsonCodecBase):
+    """
+    Json backend using the standard library's `json` module
+    """
+    name = "json"
+
+    def dumpb(self, obj, default: Default = None, numpy: str = NUMPY_BASE64, sort_keys: bool = False) -> bytes:
+        def _default(o):
+            return encode_default(o, numpy=numpy, default=default)
+        return json.dumps(
+            obj,
+            default=_default,
+            ensure_ascii=False,
+            separators=(',', ':'),
+            sort_keys=sort_keys
+        ).encode('utf-8')
+
+    def loads(self, data, object_hook: ObjectHook = None):
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data, object_hook=object_hook)
+
+
+class OrjsonJsonCodec(JsonCodecBase):
+    """
+    Json backend using `orjson`.  Falls back to the standard library for documents that
+    orjson does not support (e.g., integers larger than 64 bits or `NaN` literals).
+    """
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise InvalidConfigurationError('The "orjson" json backend requires the orjson package.  Run "pip install orjson".')
+        self._fallback = StdlibJsonCodec()
+
+    def dumpb(self, obj, default: Default = None, numpy: str = NUMPY_BASE64, sort_keys: bool = False) -> bytes:
+        option = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+        if numpy == NUMPY_LIST:
+            option |= orjson.OPT_SERIALIZE_NUMPY
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+
+        def _default(o):
+            return encode_default(o, numpy=numpy, default=default)
+        try:
+            return orjson.dumps(obj, default=_default, option=option)
+        except orjson.JSONEncodeError:
+            return self._fallback.dumpb(obj, default=default, numpy=numpy, sort_keys=sort_keys)
+
+    def loads(self, data, object_hook: ObjectHook = None):
+        try:
+            obj = orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return self._fallback.loads(data, object_hook=object_hook)
+        if object_hook is not None:
+            obj = apply_object_hook(obj, object_hook)
+        return obj
+
+
+JSON_CODECS: typing.Dict[str, typing.Type[JsonCodecBase]] = {
+    StdlibJsonCodec.name: StdlibJsonCodec,
+    OrjsonJsonCodec.name: OrjsonJsonCodec
+}
+
+_CODECS: typing.Dict[str, JsonCodecBase] = {}
+_CODECS_LOCK = threading.Lock()
+
+
+def get_json_codec(backend: str = None) -> JsonCodecBase:
+    """
+    Returns the json backend named `backend`.  Defaults to `presalytics.CONFIG["JSON_BACKEND"]`, or
+    "orjson" if orjson is installed and "json" if it is not.
+
+    Parameters
+    ----------
+    backend : str, optional
+        "orjson" or "json"
+    """
+    if backend is None:
+        backend = presalytics.CONFIG.get("JSON_BACKEND", None) or (OrjsonJsonCodec.name if orjson else StdlibJsonCodec.name)
+    try:
+        return _CODECS[backend]  # type: ignore
+    except KeyError:
+        pass
+    with _CODECS_LOCK:
+        if backend not in _CODECS:
+            try:
+                codec_class = JSON_CODECS[backend]  # type: ignore
+            except KeyError:
+                message = 'Unknown json backend "{0}". Choose from: {1}'.format(backend, ", ".join(JSON_CODECS.keys()))
+                raise InvalidConfigurationError(message)
+            _CODECS[backend] = codec_class()  # type: ignore
+        return _CODECS[backend]  # type: ignore
+
+
+def dumps(obj, default: Default = None, numpy: str = NUMPY_BASE64, sort_keys: bool = False) -> str:
+    """
+    Encodes `obj` to a json `str` with the configured backend. See `presalytics.lib.json_codec.JsonCodecBase.dumpb`.
+    """
+    return get_json_codec().dumps(obj, default=default, numpy=numpy, sort_keys=sort_keys)
+
+
+def dumpb(obj, default: Default = None, numpy: str = NUMPY_BASE64, sort_keys: bool = False) -> bytes:
+    """
+    Encodes `obj` to utf-8 encoded json with the configured backend. See `presalytics.lib.json_codec.JsonCodecBase.dumpb`.
+    """
+    return get_json_codec().dumpb(obj, default=default, numpy=numpy, sort_keys=sort_keys)
+
+
+def loads(data, object_hook: ObjectHook = None):
+    """
+    Decodes a json document with the configured backend. See `presalytics.lib.json_codec.JsonCodecBase.loads`.
+    """
+    return get_json_codec().loads(data, object_hook=object_hook)
+
+
+def dump(obj, fp: typing.IO, default: Default = None, numpy: str = NUMPY_BASE64, sort_keys: bool = False):
+    """
+    Encodes `obj` as json to a text or binary file
+    """
+    if isinstance(fp, io.TextIOBase):
+        fp.write(dumps(obj, default=default, numpy=numpy, sort_keys=sort_keys))
+    else:
+        fp.write(dumpb(obj, default=default, numpy=numpy, sort_keys=sort_keys))
+
+
+def load(fp: typing.IO, object_hook: ObjectHook = None):
+    """
+    Decodes a json document from a text or binary file
+    """
+    return loads(fp.read(), object_hook=object_hook)
@@ -60,6 +60,8 @@ def handle_exception(exc_type, exc_value, exc_traceback):
     return
 
 
-# users can override the except hook, but most analysts aren't that skilled yet.
-# Makes their scripts more verbose without having to think about it
-sys.excepthook = handle_exception
+def install_exception_hook():
+    """ Logs unhandled exceptions with `handle_exception`.  Called by `presalytics.init`. """
+    # users can override the except hook, but most analysts aren't that skilled yet.
+    # Makes their scripts more verbose without having to think about it
+    sys.excepthook = handle_exception
@@ -1,4 +1,5 @@
 import json
+import presalytics.lib.json_codec
 import presalytics.lib.plugins.base as ext
 import presalytics.lib.plugins.jinja as jinja
 
@@ -7,10 +8,10 @@ class Mpld3NumpyToJson(json.JSONEncoder):
     Simplified Numpy encoder that returns json that mpld3 will understand 
     """
     def default(self, obj):
-        import numpy as np
-        if isinstance(obj, np.ndarray):
-            return obj.tolist()
-        return json.JSONEncoder.default(self, obj)
+        try:
+            return presalytics.lib.json_codec.encode_default(obj, numpy=presalytics.lib.json_codec.NUMPY_LIST)
+        except TypeError:
+            return json.JSONEncoder.default(self, obj)
 
 
 class Mpld3Plugin(ext.ScriptPlugin, jinja.JinjaPluginMakerMixin):
@@ -36,7 +37,7 @@ class Mpld3Plugin(ext.ScriptPlugin, jinja.JinjaPluginMakerMixin):
     template = '<script type="text/javascript">mpld3.draw_figure("{{ id|safe }}",{{ fig_json }});</script>'
 
     def to_script(self, config, **kwargs):
-        fig_json = json.dumps(config["figure_dict"], cls=Mpld3NumpyToJson)
+        fig_json = presalytics.lib.json_codec.dumps(config["figure_dict"], numpy=presalytics.lib.json_codec.NUMPY_LIST)
         render_config = {
             'id': config["id"],
             'fig_json': fig_json
@@ -2,7 +2,7 @@ import os
 import posixpath
 import sass
 import typing
-import requests
+import presalytics.client.transport
 import presalytics.lib.plugins.base
 
 
@@ -54,7 +54,7 @@ class RevealCustomTheme(presalytics.lib.plugins.base.StylePlugin):
         the link tag if available
         """
         test_url = self.fonts_base_url.format(font_name)
-        r = requests.get(test_url)
+        r = presalytics.client.transport.get_session().get(test_url)
         if r.status_code == 200:
             return '<link href="{0}" rel="stylesheet">'.format(test_url)
         else:
@@ -1,5 +1,6 @@
 import pkgutil
 import importlib
+import importlib.metadata
 import traceback
 import sys
 import os
@@ -7,9 +8,16 @@ import inspect
 import logging
 import typing
 import abc
+import bisect
+import functools
 import re
 import types
 import ast
+import hashlib
+import json
+import tempfile
+import threading
+import presalytics
 import presalytics.lib.exceptions
 
 
@@ -24,11 +32,35 @@ class RegistryBase(abc.ABC):
     The `discover` method searches the current working directory, directories at
     in the `autodiscover_paths` attribute, and packages in the current python environment
     prefixed with "presalytics" (i.e., extensions).
+
+    Packages are searched once per process for all registries by `presalytics.lib.registry.get_registry_index`,
+    and the results are cached on disk.  Keys found in packages are listed in `registry` right away, but their classes
+    are not imported until the key is read.  Keys are computed by calling `get_type` and `get_name` with an
+    object that carries the class's string-valued dunder attributes (e.g., `__component_kind__`), so subclasses
+    should read those attributes with `getattr`.
+
+    Python files in the workspace (i.e., `autodiscover_paths`) are not imported by `discover`.  They are scanned
+    with `ast` for classes that declare string-valued dunder attributes (e.g., `__component_kind__`,
+    `__plugin_name__` or `__xml_transform_name__`), and a module is only executed when one of its keys is read.
+    Modules whose keys cannot be read statically (e.g., a class attribute set from a variable) are executed
+    when a lookup misses.
     """
     registry: typing.Dict[str, typing.Type]
     deferred_modules: typing.List[typing.Dict[str, typing.Any]]
     show_errors = False
 
+    skip_modules = [
+        'presalytics.client.async_api',
+        'presalytics.client.ooxml_automation_api',
+        'presalytics.client.presalytics_doc_converter',
+        'presalytics.client.presalytics_ooxml_automation',
+        'presalytics.client.presalytics_story'
+    ]
+    """
+    Modules and packages that are not searched by `discover`.  The api clients hold no registry
+    classes, and importing them would load every generated api and model module (and aiohttp).
+    """
+
     def __init__(self, 
                  show_errors=False, 
                  autodiscover_paths=[], 
@@ -39,7 +71,7 @@ class RegistryBase(abc.ABC):
         self.error_class = presalytics.lib.exceptions.RegistryError
         self.autodiscover_paths = autodiscover_paths
         self.ignore_paths = ignore_paths if ignore_paths else []
-        self.registry = {}
+        self.registry = LazyRegistryDict()
         self.reserved_names = ["config.py", "setup.py"]
         self.deferred_modules = []  # modules to load at at runtime, if theres a ciruclat dependency at import-time
         try:
@@ -76,16 +108,20 @@ class RegistryBase(abc.ABC):
             traceback.print_tb(tb)
 
     def get(self, key):
-        self.load_deferred_modules()
-        return self.registry.get(key, None)
+        value = self.registry.get(key, None)
+        if value is None and self.load_deferred_modules(is_dynamic_module):
+            value = self.registry.get(key, None)
+        return value
 
     def get_classes_from_module(self, module):
         self.get_classes(module)
         if getattr(module, "__path__", None):
             for loader, name, is_pkg in pkgutil.walk_packages(module.__path__, onerror=RegistryBase.onerror):
                 full_name = module.__name__ + '.' + name
+                if self.is_skipped_module(full_name):
+                    continue
                 try:
-                    if not self.module_is_in_stackframe(full_name):
+                    if not module_is_importing(full_name, self.module_is_in_stackframe):
                         sub_module = importlib.import_module(full_name)
                         if sub_module.__name__.startswith('presalytics'):
                             if is_pkg:
@@ -95,6 +131,9 @@ class RegistryBase(abc.ABC):
                 except Exception:
                     pass
 
+    def is_skipped_module(self, module_name: str) -> bool:
+        return any(module_name == m or module_name.startswith(m + '.') for m in self.skip_modules)
+
     def get_registry_key(self, klass):
         key = None
         klass_type = self.get_type(klass)
@@ -131,28 +170,47 @@ class RegistryBase(abc.ABC):
                 self.load_class(val)
 
 
-    def load_deferred_modules(self):
-        if len(self.deferred_modules) > 0:
-            new_deferred = []
-            for mod in self.deferred_modules:
-                try:
-                    name = mod.get("name") 
-                    if name in sys.modules: 
-                        module = sys.modules[name] 
-                    else: 
-                        spec = mod.get("spec")
-                        module = mod.get("module")
-                        sys.modules[name] = module
-                        spec.loader.exec_module(module) 
-                    self.get_classes(module)
-                except Exception as ex:
-                    logger.exception(ex)
-                    message = "Failure to execute deferred load on module '{}'.  Please check exception message and review for errors.".format(mod.get("name", None))
-                    logger.error(message)
-                    new_deferred.append(mod)
-            self.deferred_modules = new_deferred # removes modules successfully loaded from the list
-                 
-                
+    def load_deferred_module(self, mod: typing.Dict[str, typing.Any]) -> types.ModuleType:
+        """
+        Executes a deferred workspace module, loads its classes and instances into the registry, and
+        removes it from `deferred_modules`.  Modules are only executed once per process.
+        """
+        name = mod.get("name")
+        if name in sys.modules:
+            module = sys.modules[name]
+        else:
+            spec = mod.get("spec")
+            module = mod.get("module")
+            sys.modules[name] = module
+            try:
+                spec.loader.exec_module(module)
+            except Exception:
+                sys.modules.pop(name, None)
+                raise
+        self.get_classes(module)
+        if mod in self.deferred_modules:
+            self.deferred_modules.remove(mod)
+        return module
+
+    def load_deferred_modules(self, predicate: typing.Callable[[typing.Dict[str, typing.Any]], bool] = None) -> bool:
+        """
+        Executes the deferred workspace modules, or those for which `predicate` returns True.
+        Returns True if any module was loaded.
+        """
+        loaded = False
+        for mod in list(self.deferred_modules):
+            if predicate is not None and not predicate(mod):
+                continue
+            try:
+                self.load_deferred_module(mod)
+                loaded = True
+            except Exception as ex:
+                mod["failed"] = True
+                logger.exception(ex)
+                message = "Failure to execute deferred load on module '{}'.  Please check exception message and review for errors.".format(mod.get("name", None))
+                logger.error(message)
+        return loaded
+
     def discover(self):
         current_path = os.getcwd()
         if current_path not in self.autodiscover_paths:
@@ -176,7 +234,8 @@ class RegistryBase(abc.ABC):
                             self.deferred_modules.append({
                                 "name": module_name,
                                 "module": mod,
-                                "spec": mod_spec
+                                "spec": mod_spec,
+                                "path": mod_path
                             })
                     except (AttributeError, ImportError) as circ:
                         # Checks for targets of circular imports, and defer those imports to runtime
@@ -185,25 +244,132 @@ class RegistryBase(abc.ABC):
                         self.deferred_modules.append({
                             "name": mod.__name__,
                             "module": mod,
-                            "spec": mod_spec
+                            "spec": mod_spec,
+                            "path": mod_path
                         })
                     except Exception as ex:
                         if self.show_errors:
                             logger.exception(ex)
                             message = "Could not load classes from file {0}".format(name)
                             logger.error(message)
-        for finder, name, ispkg in pkgutil.iter_modules():
-            if name.startswith('presalytics'):
-                mod = importlib.import_module(name)
-                self.get_classes_from_module(mod)
+        index = get_registry_index(skip_modules=self.skip_modules)
+        self.load_index(index)
+        self.load_workspace_index(index)
+
+    def get_index_keys(self, entry: 'IndexEntry') -> typing.List[typing.Tuple[str, str]]:
+        """
+        Returns (attribute, key) pairs for a `presalytics.lib.registry.IndexEntry`, where attribute is the
+        name of the `presalytics.lib.registry.LazyRegistryDict` on this registry that holds the key
+        """
+        if entry.is_class:
+            key = self.get_registry_key(entry.stub())
+            if key:
+                return [("registry", key)]
+        return []
+
+    def load_index(self, index: 'RegistryIndex'):
+        """
+        Adds the keys of the classes in a `presalytics.lib.registry.RegistryIndex` to the registry,
+        without importing the classes
+        """
+        for entry in index.entries:
+            try:
+                for attribute, key in self.get_index_keys(entry):
+                    target = getattr(self, attribute)
+                    if key not in target:
+                        target[key] = entry
+            except Exception as ex:
+                if self.show_errors:
+                    logger.exception(ex)
+
+    def load_workspace_index(self, index: 'RegistryIndex'):
+        """
+        Scans the deferred workspace modules with `presalytics.lib.registry.scan_workspace_module` and adds the keys of
+        their classes to the registry.  Each key's module is executed when the key is first read.  Base classes are
+        resolved against other workspace modules and `index`.
+        """
+        scans = {}
+        for mod in self.deferred_modules:
+            path = mod.get("path", None)
+            scans[mod["name"]] = scan_workspace_module(mod["name"], path) if path else None
+        resolved = resolve_workspace_modules([scan for scan in scans.values() if scan], index)
+        for mod in self.deferred_modules:
+            entries, dynamic = resolved.get(mod["name"], ([], True))
+            scan = scans.get(mod["name"], None)
+            mod["dynamic"] = dynamic
+            mod["instances"] = scan.has_instances if scan else True
+            for entry in entries:
+                entry.loader = functools.partial(self.load_deferred_module, mod)
+                try:
+                    for attribute, key in self.get_index_keys(entry):
+                        target = getattr(self, attribute)
+                        if key not in target:
+                            target[key] = entry
+                except Exception as ex:
+                    if self.show_errors:
+                        logger.exception(ex)
 
     def module_is_in_stackframe(self, module_name, frame=None) -> bool:
         """Prevent cycles by skipping modules already loaded in the stack frame
         """
-        in_stack = False
-        try:
-            if not frame:
-                frame = inspect.currentframe()
+        return module_is_in_stackframe(module_name, frame=frame)
+
+
+    def register(self, klass):
+        self.load_class(klass)
+    
+    def unregister(self, klass):
+        key = self.get_registry_key(klass)
+        if key:
+            self.registry.pop(key)
+
+    def find_class(self, string_with_key_or_name) -> typing.List[str]:
+        is_key = self.key_regex.match(string_with_key_or_name)
+        if is_key:
+            return [self.get(string_with_key_or_name)]
+        else:
+            self.load_deferred_modules(lambda mod: is_dynamic_module(mod) and not has_failed(mod))
+            return self.registry.find(string_with_key_or_name)
+
+
+def is_dynamic_module(mod: typing.Dict[str, typing.Any]) -> bool:
+    """
+    Returns True for deferred workspace modules whose registry keys could not be read statically
+    """
+    return mod.get("dynamic", True)
+
+
+def has_failed(mod: typing.Dict[str, typing.Any]) -> bool:
+    """
+    Returns True for deferred workspace modules that raised an exception when they were executed.  These
+    modules are retried when a key lookup misses, but not by searches (e.g., `find_class`).
+    """
+    return mod.get("failed", False)
+
+
+def module_is_importing(module_name: str, in_stackframe: typing.Callable[[str], bool] = None) -> bool:
+    """
+    Returns True if `module_name` is still being imported further up the stack, so it cannot be indexed yet.
+    Modules that have finished importing are read from `sys.modules`, even if they are on the stack
+    (e.g., a library function that is the first to access `presalytics.COMPONENTS`).  Modules that are not in
+    `sys.modules` are checked with `in_stackframe` (defaults to `presalytics.lib.registry.module_is_in_stackframe`),
+    which catches a module run as `__main__`.
+    """
+    module = sys.modules.get(module_name, None)
+    if module is not None:
+        return bool(getattr(getattr(module, "__spec__", None), "_initializing", False))
+    return (in_stackframe or module_is_in_stackframe)(module_name)
+
+
+def module_is_in_stackframe(module_name, frame=None) -> bool:
+    """
+    Prevent cycles by skipping modules already loaded in the stack frame.  Walks
+    the frame chain from `frame` (defaults to the caller's frame) to the outermost frame.
+    """
+    try:
+        if not frame:
+            frame = inspect.currentframe()
+        while frame is not None:
             frame_module = frame.f_globals['__name__']
             if frame_module == '__main__':
                 try:
@@ -214,12 +380,9 @@ class RegistryBase(abc.ABC):
                         try:
                             fname = inspect.getmodule(frame).__dict__['__file__']
                             frame_module = os.path.basename(fname).replace(".py", "")
-                            if module_name == frame_module:
-                                return True
-                            else: 
-                                return False
+                            return module_name == frame_module
                         except AttributeError:
-                            return in_stack
+                            return False
                         except Exception:
                             return True
                     else:
@@ -227,35 +390,787 @@ class RegistryBase(abc.ABC):
                 except Exception:
                     return True
             if module_name == frame_module:
-                in_stack = True
-            else:
-                if frame.f_back:
-                    in_stack = self.module_is_in_stackframe(module_name, frame=frame.f_back)
-        except Exception:
-            # if something wonky happens, don't load this module
-            # if loaded in IronPython or Jython, this will probably fire (untested)
-            in_stack = True
-        finally:
-            del frame
-        return in_stack
+                return True
+            frame = frame.f_back
+        return False
+    except Exception:
+        # if something wonky happens, don't load this module
+        # if loaded in IronPython or Jython, this will probably fire (untested)
+        return True
+    finally:
+        del frame
 
 
-    def register(self, klass):
-        self.load_class(klass)
-    
-    def unregister(self, klass):
-        key = self.get_registry_key(klass)
-        if key:
-            self.registry.pop(key)
+class IndexEntry(object):
+    """
+    A class or instance found in a module by `presalytics.lib.registry.RegistryIndex`
 
-    def find_class(self, string_with_key_or_name) -> typing.List[str]:
-        is_key = self.key_regex.match(string_with_key_or_name)
-        if is_key:
-            return [self.get(string_with_key_or_name)]
+    Parameters
+    ----------
+    module : str
+        The name of the module the object was found in
+
+    attribute : str
+        The name of the object in the module
+
+    is_class : bool
+        Whether the object is a class
+
+    attributes : dict
+        The object's string-valued dunder attributes (e.g., `__component_kind__`), and its `name`
+        attribute if it has one
+
+    mro : list of str
+        The qualified names of the classes in the object's method resolution order (or its type's, for instances)
+    """
+    __slots__ = ("module", "attribute", "is_class", "attributes", "mro")
+
+    def __init__(self, module: str, attribute: str, is_class: bool, attributes: typing.Dict[str, str], mro: typing.List[str]):
+        self.module = module
+        self.attribute = attribute
+        self.is_class = is_class
+        self.attributes = attributes
+        self.mro = mro
+
+    @classmethod
+    def from_object(cls, module: str, attribute: str, obj) -> 'IndexEntry':
+        is_class = inspect.isclass(obj)
+        klass = obj if is_class else type(obj)
+        attributes = {}
+        for name in dir(obj):
+            if name.startswith("__") and name.endswith("__") and name not in ("__module__", "__qualname__", "__doc__"):
+                value = getattr(obj, name, None)
+                if isinstance(value, str):
+                    attributes[name] = value
+        name = getattr(obj, "name", None)
+        if isinstance(name, str):
+            attributes["name"] = name
+        mro = ["{0}.{1}".format(k.__module__, k.__qualname__) for k in inspect.getmro(klass)]
+        return cls(module, attribute, is_class, attributes, mro)
+
+    def stub(self) -> types.SimpleNamespace:
+        """
+        Returns an object carrying the entry's `attributes`, for computing registry keys without
+        importing the module
+        """
+        return types.SimpleNamespace(**self.attributes)
+
+    def is_subclass_of(self, qualified_name: str) -> bool:
+        return qualified_name in self.mro
+
+    def resolve(self):
+        """
+        Imports the entry's module and returns the object
+        """
+        return getattr(importlib.import_module(self.module), self.attribute)
+
+    def to_dict(self) -> typing.Dict:
+        return {
+            "module": self.module,
+            "attribute": self.attribute,
+            "is_class": self.is_class,
+            "attributes": self.attributes,
+            "mro": self.mro
+        }
+
+    @classmethod
+    def from_dict(cls, data: typing.Dict) -> 'IndexEntry':
+        return cls(data["module"], data["attribute"], data["is_class"], data["attributes"], data["mro"])
+
+
+class LazyRegistryDict(dict):
+    """
+    A `dict` of registry keys to classes or instances.  Values can be `presalytics.lib.registry.IndexEntry`
+    objects, which are imported and replaced with the objects they describe when they are first read.
+    Keys whose objects fail to import are removed.
+
+    Keys are indexed by a `presalytics.lib.registry.RegistryKeyIndex` as they are added and removed, so `find`
+    does not scan every key.
+    """
+    def __init__(self, *args, **kwargs):
+        super(LazyRegistryDict, self).__init__()
+        self.update(*args, **kwargs)
+
+    @property
+    def key_index(self) -> 'RegistryKeyIndex':
+        key_index = self.__dict__.get("_key_index", None)
+        if key_index is None:
+            key_index = self.__dict__["_key_index"] = RegistryKeyIndex(dict.keys(self))
+        return key_index
+
+    def __setitem__(self, key, value):
+        if key not in self:
+            self.key_index.add(key)
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        self.key_index.remove(key)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs):  # type: ignore
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self):
+        dict.clear(self)
+        self.key_index.clear()
+
+    def popitem(self):
+        key, value = dict.popitem(self)
+        self.key_index.remove(key)
+        return key, value
+
+    def find(self, text: str) -> typing.List[str]:
+        """
+        Returns the keys that contain `text`, in the order they were added
+        """
+        return self.key_index.find(text)
+
+    def __reduce__(self):
+        # Copies and pickles rebuild the key index, rather than sharing it
+        return (self.__class__, (dict(self),))
+
+    def _resolve(self, key, value):
+        if isinstance(value, IndexEntry):
+            try:
+                value = value.resolve()
+            except Exception as ex:
+                logger.exception(ex)
+                logger.error("Unable to import '{0}' from module '{1}' for registry key '{2}'".format(value.attribute, value.module, key))
+                if key in self:
+                    del self[key]
+                raise KeyError(key)
+            dict.__setitem__(self, key, value)
+        return value
+
+    def __getitem__(self, key):
+        return self._resolve(key, dict.__getitem__(self, key))
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def pop(self, key, *args):
+        if key in self:
+            self.key_index.remove(key)
+        value = dict.pop(self, key, *args)
+        if isinstance(value, IndexEntry):
+            try:
+                value = value.resolve()
+            except Exception:
+                pass
+        return value
+
+    def values(self):  # type: ignore
+        return [v for _, v in self.items()]
+
+    def items(self):  # type: ignore
+        items = []
+        for key in list(self.keys()):
+            try:
+                items.append((key, self[key]))
+            except KeyError:
+                pass
+        return items
+
+    def is_loaded(self, key) -> bool:
+        """
+        Returns True if the object for `key` has been imported
+        """
+        return not isinstance(dict.get(self, key, None), IndexEntry)
+
+
+class RegistryKeyIndex(object):
+    """
+    A substring index over registry keys, for searches such as "every key containing 'sales'".  Keys are
+    split into their dot-separated segments (e.g., "widget.matplotlib-figure.sales-chart"), and each distinct
+    segment is stored in a sorted list of its suffixes.  The segments containing a search string are the
+    suffixes that start with it, found by bisection, so a search costs about the size of its result rather
+    than the number of keys.  Many keys share their type and kind segments, so the list grows with the
+    number of distinct names.
+
+    Parameters
+    ----------
+    keys : iterable of str, optional
+        The keys to index
+    """
+    def __init__(self, keys: typing.Iterable[str] = ()):
+        self._keys_by_segment: typing.Dict[str, typing.Set[str]] = {}
+        self._order: typing.Dict[str, int] = {}
+        self._suffixes: typing.List[typing.Tuple[str, str]] = []
+        self._is_sorted = True
+        self._stale = 0
+        self._counter = 0
+        for key in keys:
+            self.add(key)
+
+    def add(self, key: str):
+        if key in self._order:
+            return
+        self._order[key] = self._counter
+        self._counter += 1
+        for segment in set(key.split(".")):
+            keys = self._keys_by_segment.get(segment, None)
+            if keys is None:
+                keys = self._keys_by_segment[segment] = set()
+                self._suffixes.extend((segment[i:], segment) for i in range(len(segment)))
+                self._is_sorted = False
+            keys.add(key)
+
+    def remove(self, key: str):
+        if self._order.pop(key, None) is None:
+            return
+        for segment in set(key.split(".")):
+            keys = self._keys_by_segment.get(segment, None)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_segment[segment]
+                    self._stale += len(segment)
+
+    def clear(self):
+        self.__init__()
+
+    def find_segments(self, text: str) -> typing.Set[str]:
+        """
+        Returns the segments that contain `text`
+        """
+        if self._stale > len(self._suffixes) // 2:
+            # Drops the suffixes of removed segments
+            self._suffixes = list({s for s in self._suffixes if s[1] in self._keys_by_segment})
+            self._is_sorted = False
+            self._stale = 0
+        if not self._is_sorted:
+            self._suffixes.sort()
+            self._is_sorted = True
+        segments = set()
+        i = bisect.bisect_left(self._suffixes, (text,))
+        while i < len(self._suffixes) and self._suffixes[i][0].startswith(text):
+            segment = self._suffixes[i][1]
+            if segment in self._keys_by_segment:
+                segments.add(segment)
+            i += 1
+        return segments
+
+    def find(self, text: str) -> typing.List[str]:
+        """
+        Returns the keys that contain `text`, in the order they were added
+        """
+        parts = text.split(".")
+        longest = max(parts, key=len)
+        if not longest:
+            keys: typing.Set[str] = set(self._order.keys())
+        else:
+            keys = set()
+            for segment in self.find_segments(longest):
+                keys.update(self._keys_by_segment[segment])
+        if len(parts) > 1:
+            keys = {key for key in keys if text in key}
+        return sorted(keys, key=self._order.__getitem__)
+
+
+class RegistryIndex(object):
+    """
+    The classes and instances that registries can load from installed packages prefixed with "presalytics"
+    (i.e., the library and its extensions).  Built by importing the packages and reading each module's
+    `__dict__`, once per process, and cached on disk as json so later processes can list registry keys
+    without importing the packages.
+
+    The cache is invalidated by `fingerprint`, a hash of the packages' names and versions and of the
+    paths, sizes and modification times of their source files.
+
+    Parameters
+    ----------
+    entries : list of presalytics.lib.registry.IndexEntry
+        The classes and instances found, in discovery order
+
+    fingerprint : str
+        The fingerprint of the packages when the index was built
+
+    complete : bool, optional
+        Defaults to True.  False if a module could not be imported while the index was built (e.g., it was
+        still being imported further up the stack, or an optional dependency is missing).  Incomplete
+        indexes are not cached on disk.
+    """
+    VERSION = 2
+
+    FILENAME = "registry-index.json"
+
+    def __init__(self, entries: typing.List[IndexEntry], fingerprint: str, complete: bool = True):
+        self.entries = entries
+        self.fingerprint = fingerprint
+        self.complete = complete
+        self._classes: typing.Optional[typing.Dict[str, IndexEntry]] = None
+
+    def get_entry(self, qualified_name: str) -> typing.Optional[IndexEntry]:
+        """
+        Returns the entry of the class named `qualified_name` (e.g., "presalytics.lib.plugins.base.ScriptPlugin"),
+        by the module it is defined in or any module that imports it.  Names that a package exports lazily
+        with a `_LAZY_IMPORTS` table (e.g., "presalytics.ChartWidget") are followed to their module.  Classes
+        missing from the index (e.g., in modules that were still importing when it was built) are read from
+        modules that have already been imported.
+        """
+        if self._classes is None:
+            classes = {}
+            for entry in self.entries:
+                if entry.is_class:
+                    classes.setdefault("{0}.{1}".format(entry.module, entry.attribute), entry)
+                    classes.setdefault(entry.mro[0], entry)
+            self._classes = classes
+        entry = self._classes.get(qualified_name, None)
+        if entry is None:
+            module_name, _, attribute = qualified_name.rpartition(".")
+            lazy_imports = getattr(sys.modules.get(module_name, None), "_LAZY_IMPORTS", None)
+            if isinstance(lazy_imports, dict) and attribute in lazy_imports:
+                module_name = lazy_imports[attribute]
+                entry = self._classes.get("{0}.{1}".format(module_name, attribute), None)
+        if entry is None:
+            obj = getattr(sys.modules.get(module_name, None), attribute, None)
+            if inspect.isclass(obj):
+                entry = IndexEntry.from_object(module_name, attribute, obj)
+        return entry
+
+    @staticmethod
+    def find_packages() -> typing.List[typing.Tuple[str, typing.Optional[str]]]:
+        """
+        Returns the names and paths of the top-level modules prefixed with "presalytics" on `sys.path`
+        """
+        packages = []
+        seen = set()
+        for finder, name, ispkg in pkgutil.iter_modules():
+            if name.startswith('presalytics') and name not in seen:
+                seen.add(name)
+                path = getattr(finder, "path", None)
+                packages.append((name, os.path.join(path, name) if path else None))
+        return packages
+
+    @classmethod
+    def get_fingerprint(cls, skip_modules: typing.Sequence[str] = ()) -> str:
+        """
+        Hashes the versions and source file metadata of the packages returned by `find_packages`
+        """
+        sha = hashlib.sha256()
+        sha.update(repr((cls.VERSION, sys.version_info[:2], sorted(skip_modules))).encode('utf-8'))
+        for name, path in cls.find_packages():
+            try:
+                version = importlib.metadata.version(name)
+            except Exception:
+                version = None
+            sha.update(repr((name, version)).encode('utf-8'))
+            if not path:
+                continue
+            files = []
+            if os.path.isdir(path):
+                for root, dirs, filenames in os.walk(path):
+                    dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+                    files.extend(os.path.join(root, f) for f in filenames if f.endswith(".py"))
+            elif os.path.isfile(path + ".py"):
+                files.append(path + ".py")
+            for filename in sorted(files):
+                try:
+                    stat = os.stat(filename)
+                except OSError:
+                    continue
+                sha.update(repr((filename, stat.st_mtime_ns, stat.st_size)).encode('utf-8'))
+        return sha.hexdigest()
+
+    @classmethod
+    def build(cls, fingerprint: str, skip_modules: typing.Sequence[str] = ()) -> 'RegistryIndex':
+        """
+        Imports the packages returned by `find_packages` and indexes the classes and instances in their modules
+        """
+        entries: typing.List[IndexEntry] = []
+        complete = True
+
+        def is_skipped(module_name):
+            return any(module_name == m or module_name.startswith(m + '.') for m in skip_modules)
+
+        def index_module(module):
+            nonlocal complete
+            for attribute, val in list(module.__dict__.items()):
+                if inspect.isclass(val) or isinstance(val, abc.ABC):
+                    try:
+                        entries.append(IndexEntry.from_object(module.__name__, attribute, val))
+                    except Exception:
+                        pass
+            if getattr(module, "__path__", None):
+                for loader, name, is_pkg in pkgutil.walk_packages(module.__path__, onerror=RegistryBase.onerror):
+                    full_name = module.__name__ + '.' + name
+                    if is_skipped(full_name):
+                        continue
+                    try:
+                        if module_is_importing(full_name):
+                            complete = False
+                        else:
+                            sub_module = importlib.import_module(full_name)
+                            if sub_module.__name__.startswith('presalytics'):
+                                index_module(sub_module)
+                    except Exception:
+                        complete = False
+
+        for name, path in cls.find_packages():
+            if is_skipped(name):
+                continue
+            try:
+                index_module(importlib.import_module(name))
+            except Exception as ex:
+                complete = False
+                if RegistryBase.show_errors:
+                    logger.exception(ex)
+        return cls(entries, fingerprint, complete)
+
+    @classmethod
+    def load(cls, path: str, fingerprint: str) -> typing.Optional['RegistryIndex']:
+        """
+        Reads an index from `path`.  Returns None if the file is missing, unreadable, or was
+        built for a different `fingerprint`.
+        """
+        try:
+            with open(path, 'rb') as f:
+                data = json.loads(f.read())
+            if data.get("version") != cls.VERSION or data.get("fingerprint") != fingerprint:
+                return None
+            return cls([IndexEntry.from_dict(e) for e in data["entries"]], fingerprint)
+        except FileNotFoundError:
+            return None
+        except Exception as ex:
+            logger.debug("Discarding unreadable registry index: {0}".format(ex))
+            return None
+
+    def save(self, path: str):
+        """
+        Writes the index to `path` atomically
+        """
+        try:
+            directory = os.path.dirname(path)
+            os.makedirs(directory, exist_ok=True)
+            data = {
+                "version": self.VERSION,
+                "fingerprint": self.fingerprint,
+                "entries": [e.to_dict() for e in self.entries]
+            }
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".registry-index-")
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except Exception as ex:
+            logger.debug("Unable to write registry index to disk: {0}".format(ex))
+
+
+def get_registry_index_dir() -> typing.Optional[str]:
+    """
+    Returns the directory where the registry index is cached.  Set from `presalytics.CONFIG`
+    with keyword `["REGISTRY_INDEX_DIR"]`.  Defaults to a "presalytics" folder in `$XDG_CACHE_HOME`
+    (or ~/.cache).  Returns None if caching is disabled (i.e., `["REGISTRY_INDEX_DIR"]` is False or empty).
+    """
+    directory = presalytics.CONFIG.get("REGISTRY_INDEX_DIR", None)
+    if directory is None:
+        cache_home = os.environ.get("XDG_CACHE_HOME", None) or os.path.join(os.path.expanduser("~"), ".cache")
+        directory = os.path.join(cache_home, "presalytics")
+    return directory or None
+
+
+_INDEXES: typing.Dict[typing.Tuple[str, ...], RegistryIndex] = {}
+_INDEXES_LOCK = threading.RLock()
+
+
+def get_registry_index(skip_modules: typing.Sequence[str] = None, refresh: bool = False) -> RegistryIndex:
+    """
+    Returns the process-wide `presalytics.lib.registry.RegistryIndex`, shared by all registries.  On first use,
+    the index is read from the cache in `get_registry_index_dir` if the installed packages have not changed,
+    and is otherwise rebuilt and written back to the cache.
+
+    Parameters
+    ----------
+    skip_modules : list of str, optional
+        Defaults to `presalytics.lib.registry.RegistryBase.skip_modules`.  Modules and packages that are not indexed.
+
+    refresh : bool, optional
+        Defaults to False.  Rebuilds the index, ignoring the in-memory and on-disk caches
+    """
+    if skip_modules is None:
+        skip_modules = RegistryBase.skip_modules
+    cache_key = tuple(sorted(skip_modules))
+    with _INDEXES_LOCK:
+        if not refresh and cache_key in _INDEXES:
+            return _INDEXES[cache_key]
+        fingerprint = RegistryIndex.get_fingerprint(skip_modules)
+        directory = get_registry_index_dir()
+        path = None
+        if directory:
+            path = os.path.join(directory, "{0}-{1}".format(hashlib.sha256(repr(cache_key).encode('utf-8')).hexdigest()[:12], RegistryIndex.FILENAME))
+        index = None
+        if path and not refresh:
+            index = RegistryIndex.load(path, fingerprint)
+        if index is None:
+            index = RegistryIndex.build(fingerprint, skip_modules)
+            if path and index.complete:
+                index.save(path)
+        _INDEXES[cache_key] = index
+        return index
+
+
+class WorkspaceIndexEntry(IndexEntry):
+    """
+    An `presalytics.lib.registry.IndexEntry` for a class found by statically scanning a workspace module.
+    `loader` executes the module and returns it.
+    """
+    __slots__ = ("loader",)
+
+    def __init__(self, module: str, attribute: str, attributes: typing.Dict[str, str], mro: typing.List[str]):
+        super(WorkspaceIndexEntry, self).__init__(module, attribute, True, attributes, mro)
+        self.loader: typing.Optional[typing.Callable[[], types.ModuleType]] = None
+
+    def resolve(self):
+        if self.loader is None:
+            return super(WorkspaceIndexEntry, self).resolve()
+        return getattr(self.loader(), self.attribute)
+
+
+class ScannedClass(object):
+    """
+    A class statement found by `presalytics.lib.registry.scan_workspace_module`
+
+    Parameters
+    ----------
+    name : str
+        The name of the class
+
+    attributes : dict
+        The string literals assigned to dunder attributes (and `name`) in the class body
+
+    bases : list of str
+        The dotted names of the base classes, as written (e.g., "presalytics.ChartWidget")
+
+    dynamic : bool
+        Whether the class's bases or dunder attributes are expressions that cannot be read without executing the module
+    """
+    __slots__ = ("name", "attributes", "bases", "dynamic")
+
+    def __init__(self, name: str, attributes: typing.Dict[str, str], bases: typing.List[str], dynamic: bool):
+        self.name = name
+        self.attributes = attributes
+        self.bases = bases
+        self.dynamic = dynamic
+
+
+class ModuleScan(object):
+    """
+    The classes, imports and top-level assignments of a workspace module, read with `ast` without executing it
+
+    Parameters
+    ----------
+    name : str
+        The module name
+
+    classes : list of presalytics.lib.registry.ScannedClass
+        The classes defined at the top level of the module (including inside `if` and `try` blocks)
+
+    imports : dict
+        Maps names bound by import statements to the dotted names they import
+
+    has_instances : bool
+        Whether the module binds the results of calls to names at the top level, and could hold
+        registered instances (e.g., of `presalytics.story.components.ComponentBase`)
+
+    error : bool
+        Whether the module could not be read or parsed
+    """
+    def __init__(self, name: str, classes: typing.List[ScannedClass], imports: typing.Dict[str, str], has_instances: bool, error: bool = False):
+        self.name = name
+        self.classes = classes
+        self.imports = imports
+        self.has_instances = has_instances
+        self.error = error
+
+
+def get_dotted_name(node: ast.AST) -> typing.Optional[str]:
+    """
+    Returns the dotted name of a `ast.Name` or `ast.Attribute` node (e.g., "presalytics.ChartWidget"), or None
+    """
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name):
+        return None
+    parts.append(node.id)
+    return ".".join(reversed(parts))
+
+
+def _is_scanned_attribute(name: str) -> bool:
+    return name == "name" or (name.startswith("__") and name.endswith("__") and name not in ("__doc__", "__module__", "__qualname__"))
+
+
+def _scan_class(node: ast.ClassDef) -> ScannedClass:
+    attributes = {}
+    dynamic = bool(node.keywords)
+    bases = []
+    for base in node.bases:
+        base_name = get_dotted_name(base)
+        if base_name is None:
+            dynamic = True
+        else:
+            bases.append(base_name)
+    for statement in node.body:
+        if isinstance(statement, ast.Assign):
+            targets, value = statement.targets, statement.value
+        elif isinstance(statement, ast.AnnAssign) and statement.value is not None:
+            targets, value = [statement.target], statement.value
         else:
-            self.load_deferred_modules()
-            return [x for x in self.registry.keys() if string_with_key_or_name in x]
-            
-            
-            
+            continue
+        for target in targets:
+            if not isinstance(target, ast.Name) or not _is_scanned_attribute(target.id):
+                continue
+            if isinstance(value, ast.Constant):
+                if isinstance(value.value, str):
+                    attributes[target.id] = value.value
+            elif not isinstance(value, (ast.Tuple, ast.List, ast.Set, ast.Dict, ast.Lambda)):
+                dynamic = True
+    return ScannedClass(node.name, attributes, bases, dynamic)
+
+
+def _scan_statements(statements, classes, imports) -> bool:
+    """ Adds the classes and imports in top-level `statements` and returns True if they may bind instances """
+    has_instances = False
+    for statement in statements:
+        if isinstance(statement, ast.ClassDef):
+            classes.append(_scan_class(statement))
+        elif isinstance(statement, ast.Import):
+            for alias in statement.names:
+                if alias.asname:
+                    imports[alias.asname] = alias.name
+                else:
+                    top_level = alias.name.split(".")[0]
+                    imports[top_level] = top_level
+        elif isinstance(statement, ast.ImportFrom):
+            if statement.level == 0 and statement.module:
+                for alias in statement.names:
+                    if alias.name != "*":
+                        imports[alias.asname or alias.name] = "{0}.{1}".format(statement.module, alias.name)
+        elif isinstance(statement, (ast.If, ast.Try)):
+            blocks = [statement.body, statement.orelse]
+            if isinstance(statement, ast.Try):
+                blocks.extend([statement.finalbody] + [handler.body for handler in statement.handlers])
+            for block in blocks:
+                has_instances = _scan_statements(block, classes, imports) or has_instances
+        elif isinstance(statement, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+            if statement.value is not None and any(isinstance(n, ast.Call) for n in ast.walk(statement.value)):
+                has_instances = True
+        elif isinstance(statement, (ast.For, ast.AsyncFor, ast.While, ast.With, ast.AsyncWith)):
+            has_instances = True
+    return has_instances
+
+
+_SCANS: typing.Dict[str, typing.Tuple[typing.Tuple, ModuleScan]] = {}
+_SCANS_LOCK = threading.Lock()
+
+
+def scan_workspace_module(name: str, path: str) -> ModuleScan:
+    """
+    Reads the classes and imports of the python file at `path` with `ast`, without executing it.  Results
+    are cached per process until the file's modification time or size changes.
+
+    Parameters
+    ----------
+    name : str
+        The module name
+
+    path : str
+        The path to the python file
+    """
+    try:
+        stat = os.stat(path)
+        cache_key: typing.Tuple = (name, stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        return ModuleScan(name, [], {}, True, error=True)
+    with _SCANS_LOCK:
+        cached = _SCANS.get(path, None)
+        if cached and cached[0] == cache_key:
+            return cached[1]
+    try:
+        with open(path, 'rb') as f:
+            tree = ast.parse(f.read(), filename=path)
+        classes: typing.List[ScannedClass] = []
+        imports: typing.Dict[str, str] = {}
+        has_instances = _scan_statements(tree.body, classes, imports)
+        scan = ModuleScan(name, classes, imports, has_instances)
+    except Exception as ex:
+        logger.debug("Unable to scan workspace module '{0}': {1}".format(path, ex))
+        scan = ModuleScan(name, [], {}, True, error=True)
+    with _SCANS_LOCK:
+        _SCANS[path] = (cache_key, scan)
+    return scan
+
+
+def resolve_workspace_modules(scans: typing.List[ModuleScan], index: 'RegistryIndex') -> typing.Dict[str, typing.Tuple[typing.List[WorkspaceIndexEntry], bool]]:
+    """
+    Computes the inherited attributes and method resolution order of the classes in scanned workspace modules.
+    Base classes are looked up in the same module, in the other scanned modules, and in `index`.
+
+    Returns a `dict` mapping module names to a list of `presalytics.lib.registry.WorkspaceIndexEntry` objects,
+    and whether the module is dynamic (i.e., it could not be scanned, or a class declaring dunder attributes
+    has attributes or bases that cannot be resolved statically).
+    """
+    modules = {scan.name: scan for scan in scans}
+    resolved: typing.Dict[typing.Tuple[str, str], typing.Optional[typing.Tuple[typing.Dict[str, str], typing.List[str]]]] = {}
+
+    def resolve_base(scan: ModuleScan, base_name: str):
+        head, _, tail = base_name.partition(".")
+        classes = {c.name: c for c in scan.classes}
+        if not tail and head in classes:
+            return resolve_class(scan, classes[head])
+        qualified_name = scan.imports.get(head, head) + ("." + tail if tail else "")
+        if qualified_name in ("object", "builtins.object"):
+            return {}, []
+        module_name, _, attribute = qualified_name.rpartition(".")
+        if module_name in modules:
+            for scanned_class in modules[module_name].classes:
+                if scanned_class.name == attribute:
+                    return resolve_class(modules[module_name], scanned_class)
+            return None
+        entry = index.get_entry(qualified_name)
+        if entry is None:
+            return None
+        return entry.attributes, entry.mro
+
+    def resolve_class(scan: ModuleScan, scanned_class: ScannedClass):
+        key = (scan.name, scanned_class.name)
+        if key in resolved:
+            return resolved[key]
+        resolved[key] = None  # guards against cycles
+        result: typing.Optional[typing.Tuple[typing.Dict[str, str], typing.List[str]]] = None
+        if not scanned_class.dynamic:
+            bases = [resolve_base(scan, base_name) for base_name in scanned_class.bases]
+            if all(base is not None for base in bases):
+                attributes: typing.Dict[str, str] = {}
+                mro = ["{0}.{1}".format(scan.name, scanned_class.name)]
+                for base_attributes, base_mro in reversed(bases):  # type: ignore
+                    attributes.update(base_attributes)
+                for base_attributes, base_mro in bases:  # type: ignore
+                    mro.extend(m for m in base_mro if m not in mro)
+                attributes.update(scanned_class.attributes)
+                result = (attributes, mro)
+        resolved[key] = result
+        return result
 
+    results = {}
+    for scan in scans:
+        entries: typing.List[WorkspaceIndexEntry] = []
+        dynamic = scan.error
+        for scanned_class in scan.classes:
+            result = resolve_class(scan, scanned_class)
+            if result is None:
+                if scanned_class.attributes or scanned_class.dynamic:
+                    dynamic = True
+                continue
+            entries.append(WorkspaceIndexEntry(scan.name, scanned_class.name, result[0], result[1]))
+        results[scan.name] = (entries, dynamic)
+    return results
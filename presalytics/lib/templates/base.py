@@ -3,6 +3,7 @@ import typing
 import jinja2
 import presalytics.story.outline
 import presalytics.story.components
+import presalytics.lib.exceptions
 import presalytics.lib.util as util
 if typing.TYPE_CHECKING:
     from presalytics.story.components import WidgetBase
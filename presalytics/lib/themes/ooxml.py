@@ -1,6 +1,7 @@
 import typing
 import presalytics
 import presalytics.client.auth
+import presalytics.client.pool
 import presalytics.story.components
 import presalytics.story.outline
 import presalytics.story.util
@@ -36,7 +37,7 @@ class OoxmlTheme(presalytics.story.components.ThemeBase):
             self.get_configuration()
 
     def get_configuration(self):
-        client = presalytics.Client(**self.client_kwargs)
+        client = presalytics.client.pool.get_pooled_client(**self.client_kwargs)
         theme = client.ooxml_automation.theme_themes_details_get_id(self.ooxml_id)
         extra_params = ['dateCreated', 'dateModified', 'userCreated', 'userModified', 'id', 'themeId']
         colors = {k: v for k, v in theme.colors.to_dict().items() if k not in extra_params}
@@ -66,7 +67,7 @@ class OoxmlTheme(presalytics.story.components.ThemeBase):
             theme_colors: typing.Dict,
             color_types_list=None) -> str:
         if not color_types_list:
-            client = presalytics.Client(**self.client_kwargs)
+            client = presalytics.client.pool.get_pooled_client(**self.client_kwargs)
             color_types_list = client.ooxml_automation.shared_colortypes_get()
         color_id = color_map[color_map_name]
         color_name = next(x.name for x in color_types_list if x.type_id == color_id)
@@ -2,6 +2,7 @@ import datetime
 import typing
 import logging
 import presalytics
+import presalytics.lib.exceptions
 import presalytics.story.outline
 import presalytics.client.api
 import presalytics.lib.widgets.ooxml
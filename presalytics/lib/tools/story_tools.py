@@ -1,7 +1,7 @@
 import typing
 import logging
 import urllib.parse
-import requests
+import presalytics.client.multipart
 import presalytics.lib.tools.ooxml_tools
 import presalytics.lib.exceptions
 if typing.TYPE_CHECKING:
@@ -15,10 +15,12 @@ logger = logging.getLogger(__name__)
 def story_post_file_bytes(client: 'Client', 
                           binary_obj: 'BytesIO', 
                           filename: str,
-                          mime_type: str = None):
+                          mime_type: str = None,
+                          progress: typing.Callable[[int, typing.Optional[int]], None] = None):
     """
     Create a Presalytics API Story object from a file-like `io.BytesIO` object.  Helpful for server-side 
-    interaction with the Presalytics Story API
+    interaction with the Presalytics Story API.  The file is streamed to the API in chunks
+    by a `presalytics.client.multipart.MultipartEncoder`, so it is not copied in memory.
 
     Parameters
     ----------
@@ -27,7 +29,8 @@ def story_post_file_bytes(client: 'Client',
     
     binary_obj : io.BytesIO
         A file-like object for storing file-data in memory.  Often found in multipart messages
-        uploaded from browsers.
+        uploaded from browsers.  Any source accepted by `presalytics.client.multipart.FilePart`
+        (e.g., an open file or an iterable of `bytes`) also works.
     
     filename : str
         The filename of the object to be uploaded
@@ -36,22 +39,25 @@ def story_post_file_bytes(client: 'Client',
         If known, please add the mimetype of the file.  Otherwise, this method will execute an 
         additional API call ascertain the file's mimetype
 
+    progress : callable, optional
+        Called with (bytes sent, total bytes) as the file is uploaded
+
     Returns
     ----------
     A `presalytics.client.presalytics_story.models.story.Story` containing information about the Story object in the Presalytics API
     """
     if not mime_type:
         mime_type = presalytics.lib.tools.ooxml_tools.get_mime_type_from_filename(client, filename)
-    _file = {'file': (filename, binary_obj, mime_type,)}
-    headers = client.get_auth_header()
-    headers.update(client.get_request_id_header())
-    headers.update({
+    file_part = presalytics.client.multipart.FilePart(binary_obj, filename=filename, content_type=mime_type, progress=progress)
+    encoder = presalytics.client.multipart.MultipartEncoder([('file', file_part)])
+    headers = {
         'User-Agent': client.story.api_client.user_agent,
-        'Accept': 'application/json'
-    })
+        'Accept': 'application/json',
+        'Content-Type': encoder.content_type
+    }
     endpoint = urllib.parse.urljoin(client.story.api_client.configuration.host, 'story/file')
     try:
-        resp = requests.post(endpoint, headers=headers, files=_file)
+        resp = client.session.post(endpoint, headers=headers, data=encoder)
     except Exception as ex:
         message = "An error occured in the presalytics API client"
         if locals().get("resp", None):
@@ -6,6 +6,8 @@ import jsonpatch
 import jsonpointer
 import logging
 import presalytics.client.api
+import presalytics.lib.exceptions
+import presalytics.lib.tools.component_tools
 import presalytics.lib.tools.story_tools
 import presalytics.story.outline
 import presalytics.story.components
@@ -1,4 +1,7 @@
 import datetime
+import importlib
+import sys
+import typing
 import presalytics.lib.constants
 
 class classproperty(property):
@@ -26,3 +29,38 @@ def get_site_host():
     return site_host
 
         
+
+
+def lazy_module_attributes(module_name: str, attributes: typing.Dict[str, str]):
+    """
+    Builds module-level `__getattr__` and `__dir__` functions (see [PEP 562](https://www.python.org/dev/peps/pep-0562/))
+    that import a module's attributes the first time they are accessed.  Used to keep
+    `import presalytics` from loading large modules (e.g., the generated api clients) and heavy
+    dependencies until they are needed.
+
+    Parameters
+    ----------
+    module_name : str
+        The `__name__` of the module the functions are built for
+
+    attributes : dict
+        Maps attribute names to the names of the modules that define them
+
+    Returns
+    ----------
+    A `tuple` of the `__getattr__` and `__dir__` functions, to be assigned in the module
+    """
+    def __getattr__(name):
+        try:
+            source = attributes[name]
+        except KeyError:
+            raise AttributeError("module '{0}' has no attribute '{1}'".format(module_name, name))
+        value = getattr(importlib.import_module(source), name)
+        # Cache on the module, so later lookups do not call this function
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(sys.modules[module_name].__dict__.keys()) | set(attributes.keys()))
+
+    return __getattr__, __dir__
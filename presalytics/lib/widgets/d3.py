@@ -10,6 +10,9 @@ import lxml
 import lxml.html
 import presalytics
 import presalytics.lib.exceptions
+import presalytics.lib.plugins.external
+import presalytics.story.components
+import presalytics.story.outline
 
 if typing.TYPE_CHECKING:
     pass
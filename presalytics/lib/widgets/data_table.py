@@ -4,12 +4,14 @@ import base64
 import uuid
 import logging
 import jinja2
-import json
 import os
 import lxml
 import lxml.html
 import presalytics
 import presalytics.lib.exceptions
+import presalytics.lib.json_codec
+import presalytics.lib.plugins.external
+import presalytics.story.components
 import presalytics.story.outline
 
 if typing.TYPE_CHECKING:
@@ -198,7 +200,7 @@ class DataTableWidget(presalytics.story.components.WidgetBase):
                 </script>
             </body>
         </html>""")
-        data = json.dumps(self.table_data, cls=presalytics.story.outline.OutlineEncoder)  # dont use hyphens in data keys
+        data = presalytics.lib.json_codec.dumps(self.table_data, default=presalytics.story.outline.outline_default)  # dont use hyphens in data keys
         extra_css = base64.b64decode(self.css64).decode('utf-8') if self.css64 else DataTableWidget.DEFAULT_CSS  #type: ignore  
         context = {
             "bootstrap4_css_url": presalytics.lib.plugins.external.ApprovedExternalLinks().attr_dict.flatten().get('bootstrap4'),
@@ -12,6 +12,8 @@ import markdown
 import mdx_gfm
 import presalytics
 import presalytics.lib.exceptions
+import presalytics.story.components
+import presalytics.story.outline
 
 
 if typing.TYPE_CHECKING:
@@ -1,13 +1,12 @@
-import mpld3
 import jinja2
 import typing
-import json
 import lxml
 import os
 import presalytics.story.components
 import presalytics.story.outline
 import presalytics.lib.exceptions
 import presalytics.lib.constants
+import presalytics.lib.json_codec
 import presalytics.lib.plugins.matplotlib
 import presalytics.lib.plugins.external
 if typing.TYPE_CHECKING:
@@ -51,6 +50,7 @@ class MatplotlibFigure(presalytics.story.components.WidgetBase):
         self.name = name
         self.figure_dict = None
         if self.fig:
+            import mpld3  # deferred, so importing presalytics does not load matplotlib
             self.figure_dict = mpld3.fig_to_dict(figure)
         else:
             figure_dict = kwargs.pop("figure_dict", None)
@@ -233,7 +233,7 @@ class MatplotlibResponsiveFigure(MatplotlibFigure):
                 </script>
             </body>
         </html>""")
-        figure_json = json.dumps(self.figure_dict, cls=presalytics.lib.plugins.matplotlib.Mpld3NumpyToJson)
+        figure_json = presalytics.lib.json_codec.dumps(self.figure_dict, numpy=presalytics.lib.json_codec.NUMPY_LIST)
         context = {
             "d3_url": presalytics.lib.plugins.external.ApprovedExternalScripts().attr_dict.flatten().get('d3v3'),
             "mpld3_url": presalytics.lib.plugins.external.ApprovedExternalScripts().attr_dict.flatten().get('mpld3'),
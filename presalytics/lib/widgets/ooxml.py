@@ -1,15 +1,12 @@
 import typing
-import time
 import abc
 import urllib.parse
-import requests
 import os
 import datetime
 import dateutil.parser
 import lxml
 import lxml.etree
 import posixpath
-import pandas
 import collections
 import presalytics
 import presalytics.client.api
@@ -22,6 +19,7 @@ import presalytics.lib.plugins.ooxml
 import presalytics.client.presalytics_ooxml_automation.models.chart_chart_data_dto
 import presalytics.client.presalytics_ooxml_automation.models.table_table_data_dto
 if typing.TYPE_CHECKING:
+    import pandas
     from presalytics.story.outline import StoryOutline, Page, Widget
     from presalytics.client.presalytics_story import Story as ApiStory
     from presalytics.client.presalytics_ooxml_automation.models.chart_chart_data_dto import ChartChartDataDTO
@@ -329,22 +327,19 @@ class OoxmlWidgetBase(presalytics.story.components.WidgetBase):
     def get_svg(self, id, timeout_iterator=0) -> str:
         """
         Get an svg-formatted version of the object from the Ooxml Automation service
+
+        Parameters
+        ----------
+        id : str
+            The Ooxml Automation service id of the object
+
+        timeout_iterator : int, optional
+            Deprecated and ignored.  Polling for the svg is handled by
+            `presalytics.client.ooxml_automation_api.OoxmlAutomationApi.fetch_svgs`.
         """
-        svg_url = self.endpoint_map.get_svg_url(id)
         client = self.get_client()
-        headers = client.get_auth_header()
-        headers.update(client.get_request_id_header())
-        response = requests.get(svg_url, headers=headers)
-        svg_data = response.text
-        if response.status_code != 200:
-            raise presalytics.lib.exceptions.ApiError(message=response.text, status_code=response.status_code)
-        if response.text.startswith("Temp data"):
-            if timeout_iterator > 5:
-                raise presalytics.lib.exceptions.ApiError(message="Unable to download svg.  Please check for upstream processing errors.")
-            else:
-                time.sleep(2)
-                svg_data = self.get_svg(id, timeout_iterator)
-        return svg_data
+        for _, svg_data in client.ooxml_automation.fetch_svgs([id], self.endpoint_map):
+            return svg_data
 
     def get_svg_file(self, filename=None):
         """
@@ -695,9 +690,7 @@ class UpdaterWidgetBase(OoxmlWidgetBase):
         Returns an instance of the dto object from the OoxmlAutomation Service API
         """
         client = self.get_client()
-        headers = client.get_auth_header()
-        headers.update(client.get_request_id_header())
-        resp = requests.get(self.build_endpoint(), headers=headers)
+        resp = client.session.get(self.build_endpoint())
         if resp.status_code > 299:
             raise presalytics.lib.exceptions.ApiError(message=resp.text)
         dto = client.ooxml_automation.api_client._ApiClient__deserialize(resp.json(), self._get_dto_class())
@@ -709,10 +702,8 @@ class UpdaterWidgetBase(OoxmlWidgetBase):
         Updates the Endpoint in the Ooxml Automation Service from a dto object
         """
         client = self.get_client()
-        headers = client.get_auth_header()
-        headers.update(client.get_request_id_header())
         data = client.ooxml_automation.api_client.sanitize_for_serialization(dto)
-        resp = requests.put(self.build_endpoint(), json=data, headers=headers)
+        resp = client.session.put(self.build_endpoint(), json=data)
         if resp.status_code > 299:
             raise presalytics.lib.exceptions.ApiError(message=resp.text)
         else:
@@ -813,10 +804,11 @@ class ChartUpdaterWidget(UpdaterWidgetBase):
     def _get_dto_table_name(self):
         return "data_points"
 
-    def get_dataframe(self) -> pandas.DataFrame:
+    def get_dataframe(self) -> 'pandas.DataFrame':
         """
         Returns a panda datagrame of the 
         """
+        import pandas  # deferred, so importing presalytics does not load pandas
         data: collections.OrderedDict
         
         if not self.dto:
@@ -828,7 +820,7 @@ class ChartUpdaterWidget(UpdaterWidgetBase):
             })
         return pandas.DataFrame(data)
     
-    def put_dataframe(self, df: pandas.DataFrame):
+    def put_dataframe(self, df: 'pandas.DataFrame'):
         data_dict = df.to_dict('split')
         data_points = list(map(list, zip(*data_dict['data'])))
         dto = self._get_dto_class()(chart_id=self.chart_id, 
@@ -6,12 +6,12 @@ import lxml
 import lxml.etree
 import abc
 import re
-import requests
 import collections
 import presalytics
 import presalytics.lib.registry
 import presalytics.lib.exceptions
 import presalytics.lib.widgets.ooxml
+import presalytics.story.outline
 
 
 logger = logging.getLogger(__name__)
@@ -474,18 +474,16 @@ class OoxmlEditorWidget(presalytics.lib.widgets.ooxml.OoxmlWidgetBase):
         Update the widget, include changes to the Xml
         """
         client = self.get_client()
-        headers = client.get_auth_header()
-        headers.update(client.get_request_id_header())
         if self.transform:
             xml_url = self.endpoint_map.get_xml_url(self.object_ooxml_id)
-            xml_response = requests.get(xml_url + "?updated=false", headers=headers)
+            xml_response = client.session.get(xml_url, params={"updated": "false"})
             if xml_response.status_code != 200:
                 raise presalytics.lib.exceptions.ApiError(message=xml_response.text)
             dto = xml_response.json()
             new_xml = self.update_xml(dto["openOfficeXml"])
             dto["openOfficeXml"] = new_xml.decode('utf-8')
-            xml_update_response = requests.put(xml_url, json=dto, headers=headers)
-            if xml_response.status_code != 200:
+            xml_update_response = client.session.put(xml_url, json=dto)
+            if xml_update_response.status_code != 200:
                 raise presalytics.lib.exceptions.ApiError(message=xml_update_response.content)
 
     @classmethod
@@ -0,0 +1,162 @@
+"""
+Yaml encoding and decoding for story outlines.
+
+Uses the libyaml-based `yaml.CSafeLoader` and `yaml.CSafeDumper` when PyYAML was built with libyaml,
+and the pure-python `yaml.SafeLoader` and `yaml.SafeDumper` otherwise.
+
+Numpy arrays are written with a safe `!ndarray` tag: a mapping holding the array's dtype, its shape
+and its little-endian data, base64-encoded.  Files written by earlier versions of this library, which
+stored arrays as python objects, cannot be read by a safe loader.  Loading python object tags can execute
+arbitrary code, so `load` and `load_all` raise a `presalytics.lib.exceptions.ValidationError` for those
+files unless `allow_unsafe=True` is passed.  Only use `allow_unsafe` for files you trust, and re-export
+them to replace their python object tags with safe tags.
+
+`load_all` and `dump_all` read and write multi-document yaml streams one document at a time, so
+files holding many outlines are never loaded into memory at once.
+"""
+import base64
+import io
+import logging
+import sys
+import typing
+import yaml
+import yaml.constructor
+import yaml.representer
+from presalytics.lib.exceptions import ValidationError
+
+
+logger = logging.getLogger(__name__)
+
+NDARRAY_TAG = "!ndarray"
+
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+_UnsafeLoader = getattr(yaml, "CUnsafeLoader", yaml.UnsafeLoader)
+
+
+def construct_ndarray(loader, node):
+    """
+    Builds a numpy array from a `!ndarray` mapping.  The array is a read-only view over the decoded data.
+    """
+    import numpy as np
+    value = loader.construct_mapping(node, deep=True)
+    data = base64.b64decode(value["data"])
+    return np.frombuffer(data, dtype=np.dtype(value["dtype"])).reshape(value["shape"])
+
+
+def represent_ndarray(dumper, array):
+    """
+    Writes a numpy array as a `!ndarray` mapping
+    """
+    np = sys.modules["numpy"]
+    if array.dtype.hasobject or array.dtype.fields:
+        raise yaml.representer.RepresenterError("numpy arrays with object or structured dtypes cannot be written to yaml", array)
+    array = np.ascontiguousarray(array, dtype=array.dtype.newbyteorder('<'))
+    return dumper.represent_mapping(NDARRAY_TAG, {
+        "dtype": array.dtype.str,
+        "shape": list(array.shape),
+        "data": base64.b64encode(array.data).decode('ascii')
+    })
+
+
+class OutlineLoader(_SafeLoader):  # type: ignore
+    """
+    Safe yaml loader that reads `!ndarray` tags
+    """
+
+
+OutlineLoader.add_constructor(NDARRAY_TAG, construct_ndarray)
+
+
+class OutlineDumper(_SafeDumper):  # type: ignore
+    """
+    Safe yaml dumper that writes numpy arrays with `!ndarray` tags
+    """
+    def represent_data(self, data):
+        np = sys.modules.get("numpy", None)
+        if np is not None and isinstance(data, np.ndarray):
+            return represent_ndarray(self, data)
+        if np is not None and isinstance(data, np.generic):
+            data = data.item()
+        return super(OutlineDumper, self).represent_data(data)
+
+
+def _read(stream) -> typing.Union[str, bytes]:
+    return stream if isinstance(stream, (str, bytes)) else stream.read()
+
+
+def _unsafe_fallback(error: yaml.constructor.ConstructorError, allow_unsafe: bool):
+    """
+    Raises a `presalytics.lib.exceptions.ValidationError` for a document that a safe loader could not read,
+    unless `allow_unsafe` is True
+    """
+    if not allow_unsafe:
+        message = ("Yaml document contains tags that cannot be loaded safely ({0}).  Files written by earlier versions of "
+                   "presalytics store numpy arrays as python objects, which can execute arbitrary code when loaded.  If you "
+                   "trust this file, load it with `allow_unsafe=True` and re-export it to use safe tags.").format(error.problem)
+        raise ValidationError(message) from error
+    logger.warning("Yaml document contains python object tags.  Loading it with an unsafe loader.  Re-export the outline to use safe tags.")
+
+
+def load(stream, allow_unsafe: bool = False):
+    """
+    Loads the first document in a yaml `str`, `bytes` or file
+
+    Parameters
+    ----------
+    stream : str, bytes or file object
+        The yaml to load
+
+    allow_unsafe : bool, optional
+        Defaults to False.  Loads documents with python object tags (e.g., from earlier versions
+        of this library) with `yaml.UnsafeLoader`.  Only use for trusted files.
+    """
+    text = _read(stream)
+    try:
+        return yaml.load(text, Loader=OutlineLoader)
+    except yaml.constructor.ConstructorError as ex:
+        _unsafe_fallback(ex, allow_unsafe)
+        return yaml.load(text, Loader=_UnsafeLoader)
+
+
+def load_all(stream, allow_unsafe: bool = False) -> typing.Iterator:
+    """
+    Yields each document in a multi-document yaml `str`, `bytes` or file, parsing one document at a time.
+    See `presalytics.lib.yaml_codec.load` for `allow_unsafe`.  Files must be seekable to fall back to an unsafe loader.
+    """
+    start = None if isinstance(stream, (str, bytes)) else stream.tell()
+    count = 0
+    try:
+        for document in yaml.load_all(stream, Loader=OutlineLoader):
+            yield document
+            count += 1
+        return
+    except yaml.constructor.ConstructorError as ex:
+        _unsafe_fallback(ex, allow_unsafe)
+    if start is not None:
+        stream.seek(start)
+    for i, document in enumerate(yaml.load_all(stream, Loader=_UnsafeLoader)):
+        if i >= count:
+            yield document
+
+
+def dump(data, stream: typing.Optional[typing.IO] = None) -> typing.Optional[str]:
+    """
+    Writes `data` as yaml to a text file, or returns a `str` if `stream` is None
+    """
+    return yaml.dump(data, stream, Dumper=OutlineDumper)
+
+
+def dump_all(documents: typing.Iterable, stream: typing.Optional[typing.IO] = None) -> typing.Optional[str]:
+    """
+    Writes each of `documents` as a yaml document to a text file (or returns a `str` if `stream` is None).
+    `documents` can be a generator, which is consumed one document at a time.
+    """
+    if stream is None:
+        stream = io.StringIO()
+        yaml.dump_all(documents, stream, Dumper=OutlineDumper)
+        return stream.getvalue()
+    yaml.dump_all(documents, stream, Dumper=OutlineDumper)
+    return None
@@ -13,7 +13,9 @@ import presalytics.lib
 import presalytics.lib.registry
 import presalytics.lib.exceptions
 import presalytics.lib.constants
+import presalytics.lib.plugins.external
 import presalytics.client.api
+import presalytics.client.pool
 
 if typing.TYPE_CHECKING:
     from presalytics.story.outline import Widget, Page, Plugin, OutlineBase, StoryOutline
@@ -115,11 +117,13 @@ class ComponentBase(abc.ABC):
 
     def get_client(self, **kwargs):
         """
-        Initializes `presalytics.client.api.Client` using `client_info`
+        Returns a `presalytics.client.api.Client` for `client_info`.  Clients are drawn from
+        the process-wide `presalytics.client.pool.ClientPool`, so components sharing the same
+        `client_info` reuse one client's connections and token state.
         """
-        params = self.client_info
+        params = dict(self.client_info)
         params.update(kwargs)
-        return presalytics.client.api.Client(**params)
+        return presalytics.client.pool.get_pooled_client(**params)
 
 
 class WidgetBase(ComponentBase):
@@ -169,7 +173,7 @@ class WidgetBase(ComponentBase):
         client = self.get_client()
         access_token = client.token_util.token.get('access_token', None)
         if access_token:
-            api_user_id = client.oidc.get_user_id(access_token)
+            api_user_id = client.get_user_id()
             payload = {
                 'user_id': api_user_id,
                 'subdocument': subdocument_encoded,
@@ -591,7 +595,7 @@ class Renderer(ComponentBase):
         Updates the StoryOutline and pushes those updates to the Presalytics API Story service
         """
         self.update_outline_from_instances()
-        client = presalytics.client.api.Client(**self.client_info)
+        client = presalytics.client.pool.get_pooled_client(**self.client_info)
         story = client.story.story_id_get(self.story_outline.story_id)
         story.outline = self.story_outline.dump()
         client.story.story_id_put(story.id, story)
@@ -640,7 +644,7 @@ class ComponentRegistry(presalytics.lib.registry.RegistryBase):
 
     """
     def __init__(self, **kwargs):
-        self.instances = {}
+        self.instances = presalytics.lib.registry.LazyRegistryDict()
         self.instance_regex = re.compile(r'(.*)\.(.*)\.(.*)')
         super(ComponentRegistry, self).__init__(**kwargs)
 
@@ -699,9 +703,22 @@ class ComponentRegistry(presalytics.lib.registry.RegistryBase):
                     message = "Unable to register instance {0} with type {1}".format(klass.__name__, klass_type)
                     logger.error(message)
 
+    def get_index_keys(self, entry):
+        """
+        Adds the instance registry keys of `presalytics.story.components.ComponentBase` instances to the keys of classes
+        """
+        keys = super().get_index_keys(entry)
+        if not entry.is_class and entry.is_subclass_of("{0}.{1}".format(ComponentBase.__module__, ComponentBase.__qualname__)):
+            key = self.get_instance_registry_key(entry.stub())
+            if key:
+                keys.append(("instances", key))
+        return keys
+
     def get_instance(self, key):
-        self.load_deferred_modules()
-        return self.instances.get(key, None)
+        value = self.instances.get(key, None)
+        if value is None and self.load_deferred_modules(may_define_instances):
+            value = self.instances.get(key, None)
+        return value
 
     def unregister(self, klass):
         """
@@ -717,5 +734,13 @@ class ComponentRegistry(presalytics.lib.registry.RegistryBase):
         if is_key:
             return [self.get_instance(string_with_key_or_name)]
         else:
-            self.load_deferred_modules()
-            return [x for x in self.instances.keys() if string_with_key_or_name in x]
+            self.load_deferred_modules(lambda mod: may_define_instances(mod) and not presalytics.lib.registry.has_failed(mod))
+            return self.instances.find(string_with_key_or_name)
+
+
+def may_define_instances(mod: typing.Dict[str, typing.Any]) -> bool:
+    """
+    Returns True for deferred workspace modules that could hold component instances, or whose
+    keys could not be read statically
+    """
+    return mod.get("instances", True) or presalytics.lib.registry.is_dynamic_module(mod)
@@ -0,0 +1,241 @@
+"""
+Binary container format for story outlines that carry large numpy arrays.
+
+A container is a zip archive (without compression) holding:
+
+* `outline.json`: the outline, as written by `presalytics.story.outline.OutlineBase.dump`, except that
+each numpy array is replaced by a `{"__ndarray_file__": "arrays/<n>.npy"}` reference
+* `arrays/<n>.npy`: each array's raw little-endian buffer in numpy's `.npy` format
+
+Unlike the base64-encoded arrays in json outlines, arrays are stored at their original size and are decoded
+without copies: they are read-only views over the container's bytes, or over a memory map of the container
+file.  Array data is aligned to 64 bytes within the file.
+
+Outlines are written to containers with `presalytics.story.outline.OutlineBase.dump` (`container=True`) or
+`presalytics.story.outline.OutlineBase.export_container`, and are read by
+`presalytics.story.outline.OutlineBase.load` and `presalytics.story.outline.OutlineBase.import_container`.
+"""
+import io
+import mmap
+import struct
+import sys
+import typing
+import zipfile
+import presalytics.lib.json_codec
+import presalytics.story.outline
+
+
+OUTLINE_MEMBER = "outline.json"
+
+ARRAY_DIRECTORY = "arrays"
+
+ARRAY_REFERENCE = "__ndarray_file__"
+
+ARRAY_ALIGNMENT = 64
+
+ZIP_MAGIC = b"PK\x03\x04"
+
+_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+
+_PADDING_HEADER_ID = 0xD935
+
+
+def is_container(data) -> bool:
+    """
+    Returns True if `data` (`bytes` or a binary file) starts like a zip archive
+    """
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return bytes(data[:4]) == ZIP_MAGIC
+    position = data.tell()
+    try:
+        return data.read(4) == ZIP_MAGIC
+    finally:
+        data.seek(position)
+
+
+class ContainerDictConverter(presalytics.story.outline.OutlineDictConverter):
+    """
+    Converts an outline to a `dict` in which numpy arrays are replaced by references to `.npy` members,
+    collecting the arrays in `arrays`
+    """
+    def __init__(self):
+        super(ContainerDictConverter, self).__init__(numpy_arrays=True)
+        self.arrays: typing.List[typing.Tuple[str, typing.Any]] = []
+
+    def convert(self, val):
+        np = sys.modules.get("numpy", None)
+        if np is not None and isinstance(val, np.ndarray):
+            return self.add_array(val)
+        return super(ContainerDictConverter, self).convert(val)
+
+    def convert_dict(self, val):
+        ret = super(ContainerDictConverter, self).convert_dict(val)
+        if not isinstance(ret, dict):
+            # a `{"__ndarray__": ...}` object decoded by `presalytics.story.outline.json_numpy_obj_hook`
+            return self.add_array(ret)
+        return ret
+
+    def add_array(self, array) -> typing.Dict[str, str]:
+        if array.dtype.hasobject:
+            raise TypeError("numpy arrays with object dtypes cannot be stored in an outline container")
+        name = "{0}/{1}.npy".format(ARRAY_DIRECTORY, len(self.arrays))
+        self.arrays.append((name, array))
+        return {ARRAY_REFERENCE: name}
+
+
+def _to_little_endian(array):
+    np = sys.modules["numpy"]
+    dtype = array.dtype.newbyteorder('<')
+    if dtype != array.dtype:
+        array = array.astype(dtype)
+    return np.ascontiguousarray(array)
+
+
+def _aligned_zip_info(zf: zipfile.ZipFile, name: str, extra_length: int = 0) -> zipfile.ZipInfo:
+    """ Pads the member's local header so that its data starts on an `ARRAY_ALIGNMENT` boundary """
+    zinfo = zipfile.ZipInfo(name, date_time=(1980, 1, 1, 0, 0, 0))
+    zinfo.compress_type = zipfile.ZIP_STORED
+    data_start = zf.fp.tell() + _LOCAL_HEADER.size + len(name.encode('utf-8')) + extra_length  # type: ignore
+    padding = -(data_start + 4) % ARRAY_ALIGNMENT
+    zinfo.extra = struct.pack("<HH", _PADDING_HEADER_ID, padding) + b"\0" * padding
+    return zinfo
+
+
+def write_container(outline: 'presalytics.story.outline.OutlineBase', file: typing.BinaryIO):
+    """
+    Writes an outline to a binary file as a container
+
+    Parameters
+    ----------
+    outline : presalytics.story.outline.OutlineBase
+        The outline to write
+
+    file : file object
+        A seekable binary file, opened for writing
+    """
+    converter = ContainerDictConverter()
+    if type(outline).to_dict is presalytics.story.outline.OutlineBase.to_dict:
+        outline_dict = converter.convert_outline(outline)
+    else:
+        outline_dict = converter.convert(outline.to_dict())
+    with zipfile.ZipFile(file, 'w', compression=zipfile.ZIP_STORED, allowZip64=True) as zf:
+        zinfo = zipfile.ZipInfo(OUTLINE_MEMBER, date_time=(1980, 1, 1, 0, 0, 0))
+        zf.writestr(zinfo, presalytics.lib.json_codec.dumpb(outline_dict))
+        np = sys.modules.get("numpy", None)
+        for name, array in converter.arrays:
+            array = _to_little_endian(array)
+            force_zip64 = array.nbytes > zipfile.ZIP64_LIMIT
+            zinfo = _aligned_zip_info(zf, name, 20 if force_zip64 else 0)
+            with zf.open(zinfo, 'w', force_zip64=force_zip64) as f:
+                np.lib.format.write_array(f, array, allow_pickle=False)  # type: ignore
+
+
+def dump_container(outline: 'presalytics.story.outline.OutlineBase') -> bytes:
+    """
+    Returns an outline as container `bytes`
+    """
+    buffer = io.BytesIO()
+    write_container(outline, buffer)
+    return buffer.getvalue()
+
+
+def _read_array(zf: zipfile.ZipFile, buffer, name: str):
+    import numpy as np
+    zinfo = zf.getinfo(name)
+    if zinfo.compress_type != zipfile.ZIP_STORED or zinfo.flag_bits & 0x1:
+        return np.lib.format.read_array(io.BytesIO(zf.read(name)), allow_pickle=False)
+    header = _LOCAL_HEADER.unpack_from(buffer, zinfo.header_offset)
+    name_length, extra_length = header[-2], header[-1]
+    data_start = zinfo.header_offset + _LOCAL_HEADER.size + name_length + extra_length
+    with io.BytesIO(buffer[data_start:data_start + min(zinfo.file_size, 2 ** 16 + 16)]) as f:
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+        offset = data_start + f.tell()
+    count = 1
+    for dimension in shape:
+        count *= dimension
+    array = np.frombuffer(buffer, dtype=dtype, count=count, offset=offset)
+    return array.reshape(shape[::-1]).transpose() if fortran_order else array.reshape(shape)
+
+
+class _BufferReader(io.RawIOBase):
+    """ A read-only, seekable file over a buffer (e.g., a `mmap.mmap`), for reading zip directories without copies """
+    def __init__(self, buffer: memoryview):
+        super(_BufferReader, self).__init__()
+        self._buffer = buffer
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, b):
+        data = self._buffer[self._position:self._position + len(b)]
+        b[:len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += len(self._buffer)
+        self._position = max(offset, 0)
+        return self._position
+
+    def tell(self):
+        return self._position
+
+
+def read_container(data: typing.Union[bytes, bytearray, memoryview, mmap.mmap]) -> typing.Dict:
+    """
+    Reads the outline `dict` from container bytes.  Numpy arrays are read-only views over `data`.
+
+    Parameters
+    ----------
+    data : bytes or mmap.mmap
+        The container
+
+    Returns
+    ----------
+    A `dict` that can be deserialized with `presalytics.story.outline.OutlineBase.deserialize`
+    """
+    buffer = memoryview(data).cast('B')
+    with zipfile.ZipFile(_BufferReader(buffer)) as zf:
+        arrays = {}
+
+        def object_hook(dct):
+            if ARRAY_REFERENCE in dct:
+                name = dct[ARRAY_REFERENCE]
+                if name not in arrays:
+                    arrays[name] = _read_array(zf, buffer, name)
+                return arrays[name]
+            return dct
+
+        return presalytics.lib.json_codec.loads(zf.read(OUTLINE_MEMBER), object_hook=object_hook)
+
+
+def read_container_file(filename: str, mmap_mode: typing.Optional[str] = 'r') -> typing.Dict:
+    """
+    Reads the outline `dict` from a container file
+
+    Parameters
+    ----------
+    filename : str
+        The path to the container
+
+    mmap_mode : str, optional
+        Defaults to 'r'.  Memory-maps the file, so arrays are paged in from disk when they are read.
+        If None, the file is read into memory.
+    """
+    with open(filename, 'rb') as f:
+        if mmap_mode is None:
+            return read_container(f.read())
+        if mmap_mode != 'r':
+            raise ValueError("Outline containers can only be memory-mapped read-only (mmap_mode='r')")
+        return read_container(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
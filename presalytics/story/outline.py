@@ -3,20 +3,22 @@ Module helps serialize and deserialize presalytics story outlines to/from json a
 Classes in this module acts are interfaces between story outlines and `component` objects
 """
 import json
-import numpy as np
 import base64
-import yaml
 import inspect
 import datetime
 import dateutil.parser
 import uuid
 import abc
+import functools
+import hashlib
 import typing
+import weakref
 import sys
 import os
 import semantic_version
-import jsonschema
 from presalytics.story.util import to_camel_case, to_snake_case
+import presalytics.lib.json_codec
+import presalytics.lib.yaml_codec
 from presalytics.lib.exceptions import ValidationError
 
 class OutlineEncoder(json.JSONEncoder):
@@ -28,38 +30,182 @@ class OutlineEncoder(json.JSONEncoder):
         Override method for deserializing objects that inherit from 
         `presalytics.story.outline.OutlineBase`
         """
-        if issubclass(obj.__class__, OutlineBase):
-            return obj.to_dict()
-        if isinstance(obj, datetime.datetime):
-            return obj.replace(tzinfo=datetime.timezone.utc).isoformat()
-        if isinstance(obj, uuid.UUID):
-            return str(obj)
         # Generalized numpy encoder/decoder -- for http transport
         # If input object is an ndarray it will be converted into a dict 
         # holding dtype, shape and the data, base64 encoded.
-        if isinstance(obj, np.ndarray):
-            if obj.flags['C_CONTIGUOUS']:
-                obj_data = obj.data
-            else:
-                cont_obj = np.ascontiguousarray(obj)
-                assert(cont_obj.flags['C_CONTIGUOUS'])
-                obj_data = cont_obj.data
-            data_b64 = base64.b64encode(obj_data).decode('utf-8')
-            return dict(__ndarray__=data_b64,
-                        dtype=str(obj.dtype),
-                        shape=obj.shape)
-        return json.JSONEncoder.default(self, obj)
+        try:
+            return presalytics.lib.json_codec.encode_default(obj, default=outline_default)
+        except TypeError:
+            return json.JSONEncoder.default(self, obj)
+
+
+def outline_default(obj):
+    """
+    `default` callback for `presalytics.lib.json_codec` that encodes objects that inherit from
+    `presalytics.story.outline.OutlineBase`
+    """
+    if issubclass(obj.__class__, OutlineBase):
+        return obj.to_dict()
+    raise TypeError("Object of type {0} is not JSON serializable".format(obj.__class__.__name__))
 
 def json_numpy_obj_hook(dct):
     """
     Decodes a previously encoded numpy ndarray with proper shape and dtype.
     """
     if isinstance(dct, dict) and '__ndarray__' in dct:
+        import numpy as np
         data = base64.b64decode(dct['__ndarray__'].encode('utf-8'))
         return np.frombuffer(data, dct['dtype']).reshape(dct['shape'])
     return dct
 
 
+_JSON_SCALARS = frozenset([str, int, float, bool, type(None)])
+
+
+class OutlineDictConverter(object):
+    """
+    Converts a tree of `presalytics.story.outline.OutlineBase` objects into `dict`, `list` and json scalar
+    values in a single pass.  Each node is visited once, and attribute names are converted to camelCase
+    with the memoized `presalytics.story.util.to_camel_case`.
+
+    The result is the same as encoding each attribute to json and decoding it again:
+
+    * Empty `list` and `dict` attributes are omitted unless they are listed in the object's `__required__` attribute
+    * `datetime.datetime`, `datetime.date` and `uuid.UUID` objects become strings (naive datetimes are treated as UTC)
+    * Tuples become lists, and the keys of `dict` objects become strings
+    * numpy scalars become python numbers
+    * Other objects raise a `TypeError`
+
+    Parameters
+    ----------
+    numpy_arrays : bool, optional
+        Defaults to True.  Returns numpy arrays, including `{"__ndarray__": ...}` objects in the
+        source data (see `presalytics.story.outline.json_numpy_obj_hook`), as copies.  If False,
+        arrays are returned encoded as `{"__ndarray__": ...}` objects, ready to be written as json.
+    """
+    def __init__(self, numpy_arrays: bool = True):
+        self.numpy_arrays = numpy_arrays
+
+    def convert_outline(self, outline: 'OutlineBase') -> typing.Dict:
+        ret = {}
+        required = outline.__required__
+        for key, val in outline.__dict__.items():
+            if key not in required and isinstance(val, (list, dict)) and len(val) == 0:
+                continue
+            ret[to_camel_case(key)] = val if type(val) in _JSON_SCALARS else self.convert(val)
+        return ret
+
+    def convert(self, val):
+        val_type = type(val)
+        if val_type in _JSON_SCALARS:
+            return val
+        if val_type is list or val_type is tuple:
+            return [v if type(v) in _JSON_SCALARS else self.convert(v) for v in val]
+        if val_type is dict or isinstance(val, dict):
+            return self.convert_dict(val)
+        if isinstance(val, OutlineBase):
+            if type(val).to_dict is OutlineBase.to_dict:
+                return self.convert_outline(val)
+            return self.convert(val.to_dict())
+        if isinstance(val, (list, tuple)):
+            return [self.convert(v) for v in val]
+        if isinstance(val, str):
+            return str.__str__(val)
+        if isinstance(val, int):
+            return int(val)
+        if isinstance(val, float):
+            return float(val)
+        np = sys.modules.get("numpy", None)
+        if np is not None and isinstance(val, np.ndarray):
+            if self.numpy_arrays:
+                return np.array(val, order='C')
+            return presalytics.lib.json_codec.encode_ndarray(val)
+        return self.convert(presalytics.lib.json_codec.encode_default(val, default=outline_default))
+
+    def convert_dict(self, val: typing.Dict) -> typing.Dict:
+        ret = {}
+        for k, v in val.items():
+            if type(k) is not str:
+                k = self.convert_key(k)
+            ret[k] = v if type(v) in _JSON_SCALARS else self.convert(v)
+        if self.numpy_arrays and '__ndarray__' in ret:
+            return json_numpy_obj_hook(ret)
+        return ret
+
+    @staticmethod
+    def convert_key(key) -> str:
+        if isinstance(key, str):
+            return str.__str__(key)
+        if key is None:
+            return "null"
+        if isinstance(key, bool):
+            return "true" if key else "false"
+        if isinstance(key, int):
+            return int.__repr__(key)
+        if isinstance(key, float):
+            return float.__repr__(key)
+        try:
+            encoded = presalytics.lib.json_codec.encode_default(key)
+        except TypeError:
+            encoded = None
+        if not isinstance(encoded, str):
+            raise TypeError("Keys must be str, int, float, bool or None, not {0}".format(key.__class__.__name__))
+        return encoded
+
+
+def outline_to_dict(outline: 'OutlineBase', numpy_arrays: bool = True) -> typing.Dict:
+    """
+    Converts a `presalytics.story.outline.OutlineBase` object and its children to a `dict`.  See
+    `presalytics.story.outline.OutlineDictConverter`.
+
+    Parameters
+    ----------
+    outline : presalytics.story.outline.OutlineBase
+        The object to convert
+
+    numpy_arrays : bool, optional
+        Defaults to True.  If False, numpy arrays are encoded as `{"__ndarray__": ...}` objects
+
+    Returns
+    ----------
+    A `dict` object containing the object's attributes, with camelCase keys
+    """
+    return OutlineDictConverter(numpy_arrays=numpy_arrays).convert_outline(outline)
+
+
+_CONSTRUCTOR_ARGS: typing.Dict[typing.Type, typing.Tuple[str, ...]] = {}
+
+
+def get_constructor_args(cls) -> typing.Tuple[str, ...]:
+    """
+    Returns the names of the positional arguments of a class's constructor, excluding `self`.
+    Cached per class.
+    """
+    try:
+        return _CONSTRUCTOR_ARGS[cls]
+    except KeyError:
+        pass
+    positional = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    parameters = inspect.signature(cls.__init__).parameters.values()
+    args = tuple(p.name for p in parameters if p.kind in positional and p.name != 'self')
+    _CONSTRUCTOR_ARGS[cls] = args
+    return args
+
+
+def parse_outline_datetime(value) -> datetime.datetime:
+    """
+    Parses an ISO 8601 string (or any format `dateutil` reads) into a `datetime.datetime`.
+    `datetime.datetime` objects are returned as they are.
+    """
+    if isinstance(value, datetime.datetime):
+        return value
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return dateutil.parser.parse(value)
+
+
+@functools.lru_cache(maxsize=None)
 def get_current_spec_version():
     """
     Get the latest version of the story outline schema via reading foldernames in 
@@ -75,7 +221,12 @@ def get_current_spec_version():
             latest = semantic_version.Version(_dir)
     return str(latest)
 
+@functools.lru_cache(maxsize=None)
 def load_schema(version_number):
+    """
+    Loads the story outline json schema for a version of the outline spec.  Each version's schema
+    is parsed once and cached, so the returned `dict` is shared and should not be modified.
+    """
     path = os.path.join(os.path.dirname(__file__), "schemas", version_number, "story-outline.schema.json")
     with open(path, 'r') as f:
         data = json.load(f)
@@ -86,6 +237,142 @@ def load_latest_schema():
     return load_schema(version_number)
 
 
+_ANNOTATION_KEYWORDS = frozenset(["$id", "$comment", "title", "description", "default", "examples"])
+
+
+class OutlineSchemaValidator(object):
+    """
+    Validates outline `dict` objects (see `presalytics.story.outline.OutlineBase.to_dict`) against the
+    json schema for a version of the story outline spec.  The schema is checked and compiled into a
+    `jsonschema` validator once, when the instance is created.  Use `get_schema_validator` to share
+    instances between outlines.
+
+    Outlines are validated in subtrees: the outline's top-level attributes (including its `info`),
+    each page without its widgets, each widget and each theme.  `validate` returns fingerprints of
+    the subtrees that passed, and skips the subtrees whose fingerprints are passed back in, so an
+    outline that is validated again after an edit only revalidates the subtrees that changed.
+    Properties whose schemas only check their type (e.g., a widget's `data`) are fingerprinted by
+    the result of that check rather than by their contents.
+
+    Parameters
+    ----------
+    version_number : str
+        The version of the story outline schema (e.g., "0.3.1")
+    """
+    def __init__(self, version_number: str):
+        import jsonschema
+        self.version_number = version_number
+        schema = load_schema(version_number)
+        validator_class = jsonschema.validators.validator_for(schema)
+        validator_class.check_schema(schema)
+        self.validator = validator_class(schema)
+        self.definition_validators = {
+            name: self.validator.evolve(schema={"$ref": "#/definitions/{0}".format(name)})
+            for name in ["page", "widget", "theme"]
+        }
+        self.type_only_properties = {
+            name: self.get_type_only_properties(schema if name is None else schema["definitions"][name])
+            for name in [None, "page", "widget", "theme"]
+        }
+
+    @staticmethod
+    def get_type_only_properties(schema: typing.Dict) -> typing.Dict[str, typing.Any]:
+        """
+        Returns the properties of `schema` whose schemas check nothing but their type, mapped to that type
+        (None if the schema accepts any type)
+        """
+        ret = {}
+        for key, property_schema in schema.get("properties", {}).items():
+            if isinstance(property_schema, dict) and _ANNOTATION_KEYWORDS.issuperset(property_schema.keys() - {"type"}):
+                ret[key] = property_schema.get("type", None)
+        return ret
+
+    def is_type(self, instance, types) -> bool:
+        if types is None:
+            return True
+        if isinstance(types, str):
+            types = [types]
+        return any(self.validator.is_type(instance, t) for t in types)
+
+    def iter_subtrees(self, outline_dict: typing.Dict) -> typing.Iterator[typing.Tuple[str, typing.Tuple, typing.Any]]:
+        """
+        Yields a `(definition, path, instance)` tuple for each subtree of `outline_dict`.  `definition` is
+        None for the outline's top-level attributes.
+        """
+        root = dict(outline_dict)
+        pages = root.get("pages", None)
+        themes = root.get("themes", None)
+        if isinstance(pages, list):
+            root["pages"] = []
+        if isinstance(themes, list):
+            root["themes"] = []
+        yield None, (), root
+        for i, page in enumerate(pages if isinstance(pages, list) else []):
+            widgets = page.get("widgets", None) if isinstance(page, dict) else None
+            if isinstance(widgets, list):
+                page = dict(page, widgets=[])
+            yield "page", ("pages", i), page
+            for j, widget in enumerate(widgets if isinstance(widgets, list) else []):
+                yield "widget", ("pages", i, "widgets", j), widget
+        for i, theme in enumerate(themes if isinstance(themes, list) else []):
+            yield "theme", ("themes", i), theme
+
+    def fingerprint(self, definition: typing.Optional[str], instance) -> bytes:
+        """
+        Hashes a subtree, and the definition it is validated against, into a 16-byte digest
+        """
+        type_checks = []
+        type_only = self.type_only_properties[definition]
+        if type_only and isinstance(instance, dict):
+            type_checks = [(key, self.is_type(instance[key], types)) for key, types in type_only.items() if key in instance]
+            instance = {key: val for key, val in instance.items() if key not in type_only}
+        key = "{0}:{1}:{2}:".format(self.version_number, definition, type_checks).encode('utf-8')
+        return hashlib.blake2b(key + presalytics.lib.json_codec.dumpb(instance), digest_size=16).digest()
+
+    def validate(self, outline_dict: typing.Dict, validated: typing.AbstractSet[bytes] = frozenset()) -> typing.FrozenSet[bytes]:
+        """
+        Validates an outline `dict`.  Raises a `presalytics.lib.exceptions.ValidationError` if the outline
+        is invalid.
+
+        Parameters
+        ----------
+        outline_dict : dict
+            The outline, as returned by `presalytics.story.outline.OutlineBase.to_dict`
+
+        validated : set of bytes, optional
+            Fingerprints of subtrees that have already passed validation, as returned by a previous
+            call to this method.  These subtrees are not validated again.
+
+        Returns
+        ----------
+        A `frozenset` of the fingerprints of each subtree of the outline
+        """
+        import jsonschema
+        fingerprints = set()
+        for definition, path, instance in self.iter_subtrees(outline_dict):
+            fingerprint = self.fingerprint(definition, instance)
+            if fingerprint not in validated:
+                validator = self.validator if definition is None else self.definition_validators[definition]
+                error = jsonschema.exceptions.best_match(validator.iter_errors(instance))
+                if error is not None:
+                    location = "/".join(str(p) for p in path + tuple(error.absolute_path)) or "outline"
+                    message = "Story outline failed schema validation at {0}: {1}".format(location, error.message)
+                    raise ValidationError(message)
+            fingerprints.add(fingerprint)
+        return frozenset(fingerprints)
+
+
+@functools.lru_cache(maxsize=None)
+def get_schema_validator(version_number: str) -> OutlineSchemaValidator:
+    """
+    Returns a shared `presalytics.story.outline.OutlineSchemaValidator` for a version of the story outline schema
+    """
+    return OutlineSchemaValidator(version_number)
+
+
+_VALIDATED_SUBTREES: 'weakref.WeakKeyDictionary[StoryOutline, typing.FrozenSet[bytes]]' = weakref.WeakKeyDictionary()
+
+
 
 class OutlineBase(abc.ABC):
     """
@@ -138,52 +425,110 @@ class OutlineBase(abc.ABC):
         ----------
             A `class` instance
         """
-        if type(json_obj) == cls:
+        if isinstance(json_obj, cls):
             return json_obj
-        updated_obj = {}
+        updated_obj = dict.fromkeys(get_constructor_args(cls))
         for key, val in json_obj.items():
-            new_key = to_snake_case(key)
-            updated_obj.update({new_key: val})
-        for req in inspect.getargspec(cls).args:
-            if req not in updated_obj and req != 'self':
-                updated_obj.update({req: None})
+            updated_obj[to_snake_case(key)] = val
         return cls(**updated_obj)
 
     @classmethod
-    def load(cls, json_str: str):
+    def deserialize_many(cls, json_objs: typing.Iterable) -> typing.List:
         """
-        Serializes a `str` into  class instance
+        Deserializes a sequence of `dict` objects (e.g., the pages of a story outline) into class instances.
+        Instances of the class are kept as they are, rather than being deserialized again.
 
         Parameters
         ----------
-        json_str : str
-            A dictionary containing attributes of the class
+        json_objs : list of dict
+            Dictionaries containing attributes of the class
+
+        Returns
+        ----------
+        A `list` of `class` instances
+        """
+        if cls.deserialize.__func__ is not OutlineBase.deserialize.__func__:  # type: ignore
+            return [cls.deserialize(json_obj) for json_obj in json_objs]
+        args = get_constructor_args(cls)
+        ret = []
+        for json_obj in json_objs:
+            if isinstance(json_obj, cls):
+                ret.append(json_obj)
+                continue
+            updated_obj = dict.fromkeys(args)
+            for key, val in json_obj.items():
+                updated_obj[to_snake_case(key)] = val
+            ret.append(cls(**updated_obj))
+        return ret
+
+    @classmethod
+    def load(cls, json_str: typing.Union[str, bytes]):
+        """
+        Serializes a `str` into  class instance.  The json is decoded in one call, and the
+        children of the outline are built with `deserialize_many`.
+
+        Parameters
+        ----------
+        json_str : str or bytes
+            A dictionary containing attributes of the class, or the `bytes` of an outline container
+            (see `presalytics.story.container`)
         
         Returns
         ----------
         A `class` instance
         """
-        json_obj = json.loads(json_str)
+        if isinstance(json_str, (bytes, bytearray, memoryview)):
+            import presalytics.story.container as outline_container
+            if outline_container.is_container(json_str):
+                return cls.deserialize(outline_container.read_container(json_str))
+        json_obj = presalytics.lib.json_codec.loads(json_str)
         return cls.deserialize(json_obj)
 
     @classmethod
-    def import_yaml(cls, yaml_file: str):
+    def import_yaml(cls, yaml_file: str, allow_unsafe: bool = False):
         """
-        Serializes a yaml from a file into a class instance
+        Serializes a yaml from a file into a class instance.  Numpy arrays are read from
+        `!ndarray` tags (see `presalytics.lib.yaml_codec`).
 
         Parameters
         ----------
         yaml_file : str
             Filepath to the file with yaml representing that class
+
+        allow_unsafe : bool, optional
+            Defaults to False.  Reads files with python object tags, written by earlier versions of
+            this library.  Loading these tags can execute arbitrary code, so only use for trusted files.
         
         Returns
         ----------
         A `class` instance
         """
         with open(yaml_file, 'r') as file:
-            obj = yaml.unsafe_load(file) # use unsafe loader per: https://github.com/yaml/pyyaml/issues/286, Monitor for fix.
+            obj = presalytics.lib.yaml_codec.load(file, allow_unsafe=allow_unsafe)
         return cls.deserialize(obj)
 
+    @classmethod
+    def import_yaml_all(cls, yaml_file: str, allow_unsafe: bool = False) -> typing.Iterator:
+        """
+        Serializes each document in a multi-document yaml file into a class instance.  Documents
+        are read from the file one at a time, as the iterator is consumed.
+
+        Parameters
+        ----------
+        yaml_file : str
+            Filepath to the file with yaml documents representing instances of that class
+
+        allow_unsafe : bool, optional
+            Defaults to False.  See `presalytics.story.outline.OutlineBase.import_yaml`
+
+        Returns
+        ----------
+        An iterator of `class` instances
+        """
+        with open(yaml_file, 'r') as file:
+            for obj in presalytics.lib.yaml_codec.load_all(file, allow_unsafe=allow_unsafe):
+                yield cls.deserialize(obj)
+
     def export_yaml(self, filename):
         """
         Dumps yaml-formatted text representing the class instance into a file
@@ -194,17 +539,80 @@ class OutlineBase(abc.ABC):
             Filepath to the location where the yaml fiel shoudl be dumped
         """
         with open(filename, 'w') as file:
-            yaml.dump(self.to_dict(), file)
+            presalytics.lib.yaml_codec.dump(self.to_dict(), file)
+
+    @staticmethod
+    def export_yaml_all(outlines: typing.Iterable['OutlineBase'], filename: str):
+        """
+        Dumps each of `outlines` into a file as a multi-document yaml stream.  `outlines` can
+        be a generator: each outline is converted and written before the next is read.
+
+        Parameters
+        ----------
+        outlines : iterable of presalytics.story.outline.OutlineBase
+            The outlines to dump
 
-    def dump(self):
+        filename : str
+            Filepath to the location where the yaml file should be dumped
+        """
+        with open(filename, 'w') as file:
+            presalytics.lib.yaml_codec.dump_all((outline.to_dict() for outline in outlines), file)
+
+    @classmethod
+    def import_container(cls, filename: str, mmap_mode: typing.Optional[str] = 'r'):
+        """
+        Serializes an outline container file (see `presalytics.story.container`) into a class instance
+
+        Parameters
+        ----------
+        filename : str
+            Filepath to the container
+
+        mmap_mode : str, optional
+            Defaults to 'r'.  Memory-maps the file, so numpy arrays are read from disk as they are used.
+            If None, the file is read into memory.
+
+        Returns
+        ----------
+        A `class` instance
+        """
+        import presalytics.story.container as outline_container
+        return cls.deserialize(outline_container.read_container_file(filename, mmap_mode=mmap_mode))
+
+    def export_container(self, filename):
+        """
+        Writes the class instance to an outline container file (see `presalytics.story.container`), which
+        stores numpy arrays as raw binary `.npy` files instead of base64 strings
+
+        Parameters
+        ----------
+        filename : str
+            Filepath to the location where the container should be written
+        """
+        import presalytics.story.container as outline_container
+        with open(filename, 'wb') as file:
+            outline_container.write_container(self, file)
+
+    def dump(self, container=False):
         """
         Serialize the class instance to a stringified Json object
 
+        Parameters
+        ----------
+        container : bool, optional
+            Defaults to False.  Returns the `bytes` of an outline container (see `presalytics.story.container`)
+            instead of json
+
         Returns
         ---------
         A `str` object representing the class instance in json
         """
-        return json.dumps(self, cls=OutlineEncoder)
+        if container:
+            import presalytics.story.container as outline_container
+            return outline_container.dump_container(self)
+        if type(self).to_dict is not OutlineBase.to_dict:
+            return presalytics.lib.json_codec.dumps(self.to_dict(), default=outline_default)
+        return presalytics.lib.json_codec.dumps(outline_to_dict(self, numpy_arrays=False))
 
     def to_dict(self):
         """
@@ -215,19 +623,7 @@ class OutlineBase(abc.ABC):
         ----------
         A `dict` object containing instance attributes
         """
-        ret = {}
-        for key, val in self.__dict__.items():
-            if key not in self.__required__:
-                if isinstance(val, list):
-                    if len(val) == 0:
-                        continue
-                if isinstance(val, dict):
-                    if len(val.items()) == 0:
-                        continue
-            ret_key = "{}".format(to_camel_case(key))
-            ret_val = json.loads(json.dumps(val, cls=OutlineEncoder), encoding='utf-8', object_hook=json_numpy_obj_hook)
-            ret[ret_key] = ret_val
-        return ret
+        return outline_to_dict(self)
 
 
 class Info(OutlineBase):
@@ -273,8 +669,8 @@ class Info(OutlineBase):
                  **kwargs):
         super(Info, self).__init__(**kwargs)
         self.revision = revision
-        self.date_created = dateutil.parser.parse(date_created).replace(tzinfo=datetime.timezone.utc)
-        self.date_modified = dateutil.parser.parse(date_modified).replace(tzinfo=datetime.timezone.utc)
+        self.date_created = parse_outline_datetime(date_created).replace(tzinfo=datetime.timezone.utc)
+        self.date_modified = parse_outline_datetime(date_modified).replace(tzinfo=datetime.timezone.utc)
         self.created_by = created_by
         self.modified_by = modified_by
         self.revision_notes = revision_notes
@@ -360,7 +756,7 @@ class Widget(OutlineBase):
         else:
             self.data = {}
         if plugins:
-            self.plugins = [Plugin.deserialize(x) for x in plugins]
+            self.plugins = Plugin.deserialize_many(plugins)
         else:
             self.plugins = []
 
@@ -404,11 +800,11 @@ class Page(OutlineBase):
         self.name = name
         self.kind = kind
         if widgets:
-            self.widgets = [Widget.deserialize(x) for x in widgets]
+            self.widgets = Widget.deserialize_many(widgets)
         else:
             self.widgets = []
         if plugins:
-            self.plugins = [Plugin.deserialize(x) for x in plugins]
+            self.plugins = Plugin.deserialize_many(plugins)
         else:
             self.plugins = []
 
@@ -454,7 +850,7 @@ class Theme(OutlineBase):
         else:
             self.data = {}
         if plugins:
-            self.plugins = [Plugin.deserialize(x) for x in plugins]
+            self.plugins = Plugin.deserialize_many(plugins)
         else:
             self.plugins = []
 
@@ -520,7 +916,7 @@ class StoryOutline(OutlineBase):
         super(StoryOutline, self).__init__(**kwargs)
         self.outline_version = get_current_spec_version()
         self.info = Info.deserialize(info)
-        self.pages = [Page.deserialize(x) for x in pages]
+        self.pages = Page.deserialize_many(pages)
         if description:
             self.description = description
         else:
@@ -530,18 +926,37 @@ class StoryOutline(OutlineBase):
         else:
             self.title = ""
         if themes:
-            self.themes = [Theme.deserialize(x) for x in themes]
+            self.themes = Theme.deserialize_many(themes)
         else:
             self.themes = []
         if plugins:
-            self.plugins = [Plugin.deserialize(x) for x in plugins]
+            self.plugins = Plugin.deserialize_many(plugins)
         else:
             self.plugins = []
         self.story_id = story_id
-        if not kwargs.get("validate", True):
+        if kwargs.get("validate", False):
             self.validate()
 
-        def validate(self):
-            super(StoryOutline, self).validate()
-            jsonschema.validate(instance=self.to_dict(), schema=load_latest_schema())
+    def validate(self, incremental: bool = True, schema: bool = True):
+        """
+        Ensures that the outline has all required attributes and is valid against the json schema
+        for its `outline_version`.  Raises a `presalytics.lib.exceptions.ValidationError` if it is not.
+
+        Parameters
+        ----------
+        incremental : bool, optional
+            Defaults to True.  Only validates the subtrees of the outline (e.g., pages and widgets) that
+            have changed since the outline last passed validation.  If False, validates the whole outline.
+
+        schema : bool, optional
+            Defaults to True.  If False, only checks for required attributes (see
+            `presalytics.story.outline.OutlineBase.validate`), as `presalytics.story.revealer.Revealer` does
+        """
+        super(StoryOutline, self).validate()
+        if not schema:
+            return
+        validator = get_schema_validator(self.outline_version)
+        validated = _VALIDATED_SUBTREES.get(self, frozenset()) if incremental else frozenset()
+        outline_dict = OutlineDictConverter(numpy_arrays=False).convert(self)
+        _VALIDATED_SUBTREES[self] = validator.validate(outline_dict, validated)
         
\ No newline at end of file
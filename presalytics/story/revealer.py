@@ -69,7 +69,7 @@ class Revealer(presalytics.story.components.Renderer):
             **kwargs):
         super(Revealer, self).__init__(story_outline, **kwargs)
         logger.info("Initializing story render for {}".format(story_outline.title))
-        self.story_outline.validate()
+        self.story_outline.validate(schema=False)
         if isinstance(pages, int):
             pages = [pages]
         elif not pages:
@@ -6,7 +6,7 @@ import urllib.parse
 import flask
 import threading
 import webbrowser
-import requests
+import presalytics.client.transport
 import presalytics.lib.util
 import presalytics.lib.exceptions
 
@@ -116,7 +116,7 @@ class LocalServer(object):
         for img in preloaders:
             try:
                 preloader_url = urllib.parse.urljoin(host, "/static/preloaders/" + img)
-                response = requests.get(preloader_url)
+                response = presalytics.client.transport.get_session().get(preloader_url)
                 if response.status_code == 200:
                     filename = os.path.join(local_preloader_path, img)
                     open(filename, 'wb').write(response.content)
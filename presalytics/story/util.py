@@ -2,17 +2,20 @@
 Utility functions for the presalytics.story module
 """
 import re
+import functools
 import logging
 import typing
 
 logger = logging.getLogger('presalytics.story.util')
 
 
+@functools.lru_cache(maxsize=4096)
 def to_snake_case(camel_case_str):
     s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', camel_case_str)
     return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
 
 
+@functools.lru_cache(maxsize=4096)
 def to_camel_case(snake_str):
     components = snake_str.split('_')
     return components[0] + ''.join(x.title() for x in components[1:])
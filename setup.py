@@ -43,6 +43,11 @@ REQUIRES = [
     'py-gfm'
 ]
 
+EXTRAS_REQUIRE = {
+    "async": ["aiohttp"],
+    "fast": ["orjson"]
+}
+
 with open("README.md", "r") as fh:
     long_description = fh.read()
     
@@ -55,6 +60,7 @@ setup(
     url="https://presalytics.io/docs",
     keywords=["Presalytics"],
     install_requires=REQUIRES,
+    extras_require=EXTRAS_REQUIRE,
     packages=find_packages(),
     include_package_data=True,
     long_description_content_type="text/markdown",
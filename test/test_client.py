@@ -4,8 +4,34 @@ Unit test for Client class
 import unittest
 import os
 import uuid
+import time
+import threading
+import tempfile
+import datetime
+import base64
+import io
+import copy
+import json
+import email.parser
+import hashlib
+import http.server
+import unittest.mock
+import rsa
+import jose.jwt
 import presalytics.lib.exceptions
 import presalytics.client.api
+import presalytics.client.pool
+import presalytics.client.polling
+import presalytics.client.oidc
+import presalytics.client.auth
+import presalytics.client.token_store
+import presalytics.client.cache
+import presalytics.client.multipart
+import presalytics.client.presalytics_ooxml_automation.models
+import presalytics.client.presalytics_story.rest
+import presalytics.client.presalytics_story.api_client
+import presalytics.client.presalytics_story.models
+import presalytics.client.deserializer
 
 
 class TestClient(unittest.TestCase):
@@ -104,3 +130,344 @@ class TestClient(unittest.TestCase):
             # except Exception:
             #     pass
 
+    def test_client_pool(self):
+        pool = presalytics.client.pool.ClientPool(max_size=2, idle_timeout=600)
+        client = pool.get_client(token="access-token-1", delegate_login=True)
+        self.assertIs(client, pool.get_client(token="access-token-1", delegate_login=True))
+        other_client = pool.get_client(token="access-token-2", delegate_login=True)
+        self.assertIsNot(client, other_client)
+        pool.get_client(token="access-token-3", delegate_login=True)
+        self.assertEqual(len(pool), 2)
+        pool.idle_timeout = 0
+        pool.evict_idle()
+        self.assertEqual(len(pool), 0)
+
+    def test_poller(self):
+        checks = {}
+
+        def check(key):
+            checks[key] = checks.get(key, 0) + 1
+            return checks[key] >= key, key * 10
+
+        poller = presalytics.client.polling.Poller(initial_interval=0.01, max_interval=0.02, deadline=5)
+        results = dict(poller.poll([3, 1, 2, 1], check))
+        self.assertEqual(results, {1: 10, 2: 20, 3: 30})
+        self.assertEqual(checks, {1: 1, 2: 2, 3: 3})
+        slow_poller = presalytics.client.polling.Poller(initial_interval=0.01, deadline=0.05)
+        with self.assertRaises(presalytics.lib.exceptions.PollingTimeout):
+            slow_poller.wait(1000, check)
+
+    def test_single_flight_token_refresh(self):
+        class CountingOidc(object):
+            calls = 0
+
+            def refresh_token(self, refresh_token):
+                CountingOidc.calls += 1
+                time.sleep(0.1)
+                return {"access_token": "new-access-token", "refresh_token": refresh_token, "expires_in": 3600}
+
+        expired = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(seconds=5)
+        token = {"access_token": "old-access-token", "refresh_token": "refresh-token", "access_token_expire_time": expired.isoformat()}
+        client = presalytics.client.api.Client(token=token, client_secret="secret", delegate_login=True)
+        client.oidc = CountingOidc()
+        threads = [threading.Thread(target=client.get_auth_header) for _ in range(10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(CountingOidc.calls, 1)
+        self.assertEqual(client.get_auth_header()["Authorization"], "Bearer new-access-token")
+        self.assertFalse(client.is_token_expired())
+
+    def test_memoized_token_validation(self):
+        public_key, private_key = rsa.newkeys(1024)
+
+        def b64(i):
+            return base64.urlsafe_b64encode(i.to_bytes((i.bit_length() + 7) // 8, 'big')).rstrip(b'=').decode()
+
+        jwks = {"keys": [{"kty": "RSA", "kid": "test-kid", "use": "sig", "n": b64(public_key.n), "e": b64(public_key.e)}]}
+        oidc = presalytics.client.oidc.OidcClient()
+        claims = {
+            "aud": oidc.audience,
+            "iss": oidc.auth_host,
+            "exp": int(time.time()) + 600,
+            oidc.USER_ID_CLAIM: "test-user-id"
+        }
+        token = jose.jwt.encode(claims, private_key.save_pkcs1().decode(), algorithm="RS256", headers={"kid": "test-kid"})
+        with unittest.mock.patch.object(presalytics.client.oidc, "get_jwks", return_value=jwks), \
+                unittest.mock.patch.object(jose.jwt, "decode", wraps=jose.jwt.decode) as decode:
+            user_ids = [oidc.get_user_id(token) for _ in range(10)]
+        self.assertEqual(user_ids, ["test-user-id"] * 10)
+        self.assertEqual(decode.call_count, 1)
+
+    def test_token_stores(self):
+        expires = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=600)
+        token = {"access_token": "access-token", "refresh_token": "refresh-token", "access_token_expire_time": expires}
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            legacy_file = os.path.join(tmp_dir, "token.json")
+            with open(legacy_file, 'w') as f:
+                f.write('{"access_token": "legacy-token"}')
+            stores = [
+                presalytics.client.token_store.MemoryTokenStore(),
+                presalytics.client.token_store.FileTokenStore(legacy_file),
+                presalytics.client.token_store.SqliteTokenStore(os.path.join(tmp_dir, "token.sqlite3"))
+            ]
+            for store in stores:
+                key = presalytics.client.token_store.get_token_store_key("user@example.com", "python-client")
+                self.assertIsNone(store.get(key))
+                store.put(key, token)
+                store.put("python-client:other@example.com", {"access_token": "other-token"})
+                self.assertEqual(store.get(key)["access_token"], "access-token")
+                token_util = presalytics.client.auth.TokenUtil(token_cache=True, token_store=store, store_key=key)
+                self.assertFalse(token_util.is_api_access_token_expired())
+                store.delete(key)
+                self.assertIsNone(store.get(key))
+                self.assertEqual(store.get("python-client:other@example.com")["access_token"], "other-token")
+
+    def test_reference_data_cache(self):
+        color_types = [presalytics.client.presalytics_ooxml_automation.models.SharedColorTypes(name="Text1", type_id=1)]
+        call_api = "presalytics.client.presalytics_ooxml_automation.api_client.ApiClient.call_api"
+        client = presalytics.client.api.Client(token="access-token", delegate_login=True)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            api_client = client.ooxml_automation.api_client
+            api_client.response_cache = presalytics.client.cache.ResponseCache(directory=tmp_dir)
+            with unittest.mock.patch(call_api, return_value=color_types) as mock_call:
+                first = client.ooxml_automation.shared_colortypes_get()
+                first[0].name = "Modified"
+                second = client.ooxml_automation.shared_colortypes_get()
+                client.ooxml_automation.shared_colortypes_get_id("color-type-id")
+                self.assertEqual(mock_call.call_count, 2)
+                self.assertEqual(second[0].name, "Text1")
+                api_client.response_cache = presalytics.client.cache.ResponseCache(directory=tmp_dir)
+                client.ooxml_automation.shared_colortypes_get()
+                self.assertEqual(mock_call.call_count, 2)
+                client.ooxml_automation.theme_themes_get_id("theme-id")
+                client.ooxml_automation.theme_themes_get_id("theme-id")
+                self.assertEqual(mock_call.call_count, 4)
+
+    def test_unauthorized_retry(self):
+        sent_headers = []
+
+        def call_api(resource_path, method, path_params=None, query_params=None, header_params=None, *args):
+            sent_headers.append(header_params["Authorization"])
+            if len(sent_headers) == 1:
+                raise presalytics.client.presalytics_story.rest.ApiException(
+                    http_resp=unittest.mock.Mock(status=401, reason="Unauthorized", data=json.dumps({"status": 401, "detail": "revoked"}), getheaders=dict))
+            return "retried"
+
+        client = presalytics.client.api.Client(token="old-token", delegate_login=True)
+
+        def acquire_token(rejected_token=None):
+            self.assertEqual(rejected_token, "old-token")
+            client.token_util.token["access_token"] = "new-token"
+
+        with unittest.mock.patch.object(client, "_acquire_token", side_effect=acquire_token), \
+                unittest.mock.patch("presalytics.client.presalytics_story.api_client.ApiClient.call_api", side_effect=call_api):
+            result = client.story.api_client.call_api("/story-id", "PUT")
+        self.assertEqual(result, "retried")
+        self.assertEqual(sent_headers, ["Bearer old-token", "Bearer new-token"])
+
+    def test_async_unauthorized_retry(self):
+        import asyncio
+        import presalytics.client.async_api
+        sent_headers = []
+
+        async def call_api_async(self, resource_path, method, path_params=None, query_params=None, header_params=None, *args):
+            sent_headers.append(header_params["Authorization"])
+            if len(sent_headers) == 1:
+                raise presalytics.client.presalytics_story.rest.ApiException(
+                    http_resp=unittest.mock.Mock(status=401, reason="Unauthorized", data=json.dumps({"status": 401, "detail": "expired"}), getheaders=dict))
+            return "retried"
+
+        client = presalytics.client.async_api.AsyncClient(token="old-token", delegate_login=True)
+
+        def acquire_token(rejected_token=None):
+            self.assertEqual(rejected_token, "old-token")
+            client.token_util.token["access_token"] = "new-token"
+
+        with unittest.mock.patch.object(client, "_acquire_token", side_effect=acquire_token), \
+                unittest.mock.patch.object(presalytics.client.async_api.AsyncStoryApiClientWithAuth, "_call_api_async", call_api_async):
+            result = asyncio.run(client.story.api_client.call_api("/story-id", "GET"))
+        self.assertEqual(result, "retried")
+        self.assertEqual(sent_headers, ["Bearer old-token", "Bearer new-token"])
+
+    def test_conditional_story_requests(self):
+        story_json = json.dumps({"id": "story-id", "title": "Cached Story"}).encode('utf-8')
+        requests_sent = []
+
+        def request(method, url, query_params=None, headers=None, **kwargs):
+            requests_sent.append(headers)
+            if headers.get("If-None-Match") == '"v1"':
+                raise presalytics.client.presalytics_story.rest.ApiException(status=304, reason="Not Modified")
+            response = unittest.mock.Mock(status=200, reason="OK", data=story_json)
+            response.getheaders.return_value = {"ETag": '"v1"'}
+            return response
+
+        client = presalytics.client.api.Client(token="access-token", delegate_login=True)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            client.story.api_client.validator_cache = presalytics.client.cache.ResponseCache(ttl=None, directory=tmp_dir)
+            with unittest.mock.patch("presalytics.client.presalytics_story.api_client.ApiClient.request", side_effect=request):
+                first = client.story.story_id_get("story-id")
+                first.title = "Modified"
+                second = client.story.story_id_get("story-id")
+        self.assertNotIn("If-None-Match", requests_sent[0])
+        self.assertEqual(requests_sent[1]["If-None-Match"], '"v1"')
+        self.assertEqual(second.title, "Cached Story")
+
+    def test_conditional_story_requests_per_user(self):
+        story_json = json.dumps({"id": "story-id", "title": "Cached Story"}).encode('utf-8')
+        requests_sent = []
+
+        def request(method, url, query_params=None, headers=None, **kwargs):
+            requests_sent.append(headers)
+            response = unittest.mock.Mock(status=200, reason="OK", data=story_json)
+            response.getheaders.return_value = {"ETag": '"v1"'}
+            return response
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = presalytics.client.cache.ResponseCache(ttl=None, directory=tmp_dir)
+            with unittest.mock.patch("presalytics.client.presalytics_story.api_client.ApiClient.request", side_effect=request):
+                # tokens without readable claims are keyed by the token, tokens with claims by their subject
+                for token, claims in [("token-1", None), ("token-2", None), ("token-3", {"sub": "user"}), ("token-4", {"sub": "user"})]:
+                    client = presalytics.client.api.Client(token=token, delegate_login=True)
+                    client.story.api_client.validator_cache = cache
+                    if claims:
+                        client.get_token_claims = unittest.mock.Mock(return_value=claims)
+                    client.story.story_id_get("story-id")
+        self.assertNotIn("If-None-Match", requests_sent[0])
+        self.assertNotIn("If-None-Match", requests_sent[1])
+        self.assertNotIn("If-None-Match", requests_sent[2])
+        self.assertEqual(requests_sent[3]["If-None-Match"], '"v1"')
+
+    def test_resumable_download(self):
+        payload = os.urandom(300000)
+        requests_seen = []
+
+        class FileHandler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                range_header = self.headers.get("Range")
+                requests_seen.append(range_header)
+                start = int(range_header[6:-1]) if range_header else 0
+                self.send_response(206 if range_header else 200)
+                self.send_header("Content-Length", str(len(payload) - start))
+                self.send_header("Content-Disposition", 'attachment; filename="deck.pptx"')
+                self.send_header("ETag", '"v1"')
+                self.end_headers()
+                end = len(payload) if range_header else 100000  # drop the first connection
+                self.wfile.write(payload[start:end])
+                self.close_connection = True
+
+            def log_message(self, *args):
+                pass
+
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), FileHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        client = presalytics.client.api.Client(token="access-token", delegate_login=True)
+        client.story.api_client.configuration.host = "http://127.0.0.1:{0}".format(server.server_address[1])
+        try:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                filepath = client.download_file("story-id", "ooxml-id", download_folder=tmp_dir, chunk_size=8192,
+                                                checksum=hashlib.sha256(payload).hexdigest())
+                with open(filepath, 'rb') as f:
+                    self.assertEqual(f.read(), payload)
+                self.assertEqual(os.path.basename(filepath), "deck.pptx")
+                self.assertEqual(len(requests_seen), 2)
+                self.assertTrue(requests_seen[1].startswith("bytes="))
+                with self.assertRaises(presalytics.lib.exceptions.ChecksumMismatch):
+                    client.download_file("story-id", "ooxml-id", download_folder=tmp_dir, chunk_size=8192, checksum="0" * 64)
+        finally:
+            server.shutdown()
+
+    def test_streaming_multipart_upload(self):
+        payload = os.urandom(200000)
+        progress = []
+        encoder = presalytics.client.multipart.MultipartEncoder([
+            ('name', 'deck'),
+            ('file', presalytics.client.multipart.FilePart(io.BytesIO(payload), filename="deck.pptx", progress=lambda sent, total: progress.append(sent)))
+        ])
+        body = encoder.to_string()
+        self.assertEqual(len(body), encoder.len)
+        self.assertEqual(progress[-1], len(payload))
+        message = email.parser.BytesParser().parsebytes(b'Content-Type: ' + encoder.content_type.encode() + b'\r\n\r\n' + body)
+        parts = message.get_payload()
+        self.assertEqual(parts[0].get_payload(), 'deck')
+        self.assertEqual(parts[1].get_filename(), "deck.pptx")
+        self.assertEqual(parts[1].get_payload(decode=True), payload)
+        chunked = presalytics.client.multipart.MultipartEncoder({'file': ("deck.pptx", iter([payload[:1000], payload[1000:]]))})
+        self.assertIsNone(chunked.len)
+        self.assertIn(payload, chunked.to_string())
+
+        received = {}
+
+        class UploadHandler(http.server.BaseHTTPRequestHandler):
+            def do_POST(self):
+                received["content_length"] = int(self.headers["Content-Length"])
+                received["body"] = self.rfile.read(received["content_length"])
+                data = json.dumps({"id": "story-id", "title": "Uploaded"}).encode('utf-8')
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), UploadHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        client = presalytics.client.api.Client(token="access-token", delegate_login=True)
+        client.story.api_client.configuration.host = "http://127.0.0.1:{0}".format(server.server_address[1])
+        try:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                filepath = os.path.join(tmp_dir, "deck.pptx")
+                with open(filepath, 'wb') as f:
+                    f.write(payload)
+                story = client.story.story_post_file(file=filepath)
+        finally:
+            server.shutdown()
+        self.assertEqual(story.id, "story-id")
+        self.assertEqual(received["content_length"], len(received["body"]))
+        self.assertIn(payload, received["body"])
+
+    def test_compiled_deserializer(self):
+        data = [{
+            "id": "story-id",
+            "title": "Story",
+            "created_at": "2020-01-01T00:00:00+00:00",
+            "is_public": False,
+            "outline_history": [{"id": "history-id", "outline": "{}", "created_at": "2020-01-01T00:00:00Z"}],
+            "collaborators": None
+        }]
+        generated = presalytics.client.presalytics_story.api_client.ApiClient()
+        client = presalytics.client.api.Client(token="access-token", delegate_login=True)
+        expected = generated._ApiClient__deserialize(data, 'list[Story]')
+        stories = client.story.api_client._ApiClient__deserialize(data, 'list[Story]')
+        self.assertEqual([s.to_dict() for s in stories], [s.to_dict() for s in expected])
+        plans = client.story.api_client.get_deserializer_plans()
+        self.assertIs(plans, presalytics.client.deserializer.get_deserializer_plans("presalytics.client.presalytics_story"))
+        self.assertIs(plans.get_decoder('list[Story]'), plans.get_decoder('list[Story]'))
+
+    def test_lazy_models(self):
+        data = {
+            "id": "story-id",
+            "title": "Story",
+            "created_at": "2020-01-01T00:00:00+00:00",
+            "outline_history": [{"id": "history-id", "created_at": "2020-01-01T00:00:00Z"}]
+        }
+        client = presalytics.client.api.Client(token="access-token", delegate_login=True, lazy_models=True)
+        story = client.story.api_client._ApiClient__deserialize(data, 'Story')
+        self.assertIsInstance(story, presalytics.client.presalytics_story.models.Story)
+        self.assertIs(story.to_dict(), data)
+        self.assertNotIn("_created_at", story.__dict__)
+        self.assertEqual(story.outline_history[0].id, "history-id")
+        self.assertEqual(story, presalytics.client.deserializer.get_deserializer_plans("presalytics.client.presalytics_story").decode(data, 'Story'))
+        story_copy = copy.deepcopy(story)
+        story_copy.title = "Modified"
+        self.assertEqual(story_copy.to_dict()["title"], "Modified")
+        self.assertEqual(story.title, "Story")
+        edited = client.story.api_client._ApiClient__deserialize(copy.deepcopy(data), 'Story')
+        edited.outline_history[0].outline = "changed"
+        self.assertEqual(edited.to_dict()["outline_history"][0]["outline"], "changed")
+        appended = client.story.api_client._ApiClient__deserialize(copy.deepcopy(data), 'Story')
+        appended.outline_history.append(presalytics.client.presalytics_story.models.StoryOutlineHistory(outline="new"))
+        self.assertEqual(len(appended.to_dict()["outline_history"]), 2)
@@ -4,6 +4,9 @@ import pathlib
 import unittest
 import typing
 import presalytics
+import presalytics.story.components
+import presalytics.story.outline
+import presalytics.lib.widgets.ooxml
 import io
 import lxml
 from presalytics.client.api import get_client
@@ -49,7 +52,9 @@ class TestComponents(unittest.TestCase):
             {
                 'name': 'TextReplace',
                 'function_params': {
-                    'test_text': "Test Passed!"
+                    'replace_map': {
+                        'test_text': "Test Passed!"
+                    }
                 }
             }
         ]}
@@ -105,7 +110,9 @@ class TestComponents(unittest.TestCase):
             {
                 'name': 'TextReplace',
                 'function_params': {
-                    'test_text': "Test Passed!"
+                    'replace_map': {
+                        'test_text': "Test Passed!"
+                    }
                 }
             }
         ]}
@@ -0,0 +1,96 @@
+import unittest
+import os
+import sys
+import json
+import time
+import tempfile
+import subprocess
+
+
+class TestImport(unittest.TestCase):
+    """
+    Regression tests for the time and modules it takes to run `import presalytics`.  Each import
+    runs in a fresh interpreter in an empty working directory.
+
+    The budget can be overridden with the `PRESALYTICS_IMPORT_BUDGET` environment variable
+    (in seconds) for slow machines.
+    """
+    IMPORT_BUDGET = 0.5
+
+    LAZY_MODULES = [
+        'presalytics.client.presalytics_ooxml_automation.api.default_api',
+        'presalytics.client.presalytics_story.api.default_api',
+        'presalytics.client.presalytics_story.models.story',
+        'presalytics.story.components',
+        'environs',
+        'pandas',
+        'matplotlib',
+        'mpld3',
+        'aiohttp'
+    ]
+
+    def run_import(self, code, cwd=None, env=None):
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env = dict(os.environ, **(env or {}))
+        env["PYTHONPATH"] = os.pathsep.join([root, env.get("PYTHONPATH", "")])
+        with tempfile.TemporaryDirectory() as tmp:
+            start = time.perf_counter()
+            output = subprocess.check_output([sys.executable, "-c", code], cwd=cwd or tmp, env=env)
+            return time.perf_counter() - start, output
+
+    def test_import_time(self):
+        budget = float(os.environ.get("PRESALYTICS_IMPORT_BUDGET", self.IMPORT_BUDGET))
+        baseline = min(self.run_import("pass")[0] for _ in range(3))
+        elapsed = min(self.run_import("import presalytics")[0] for _ in range(3))
+        self.assertLess(elapsed - baseline, budget)
+
+    def test_lazy_modules(self):
+        code = "import sys, json, presalytics; print(json.dumps(sorted(sys.modules)))"
+        modules = json.loads(self.run_import(code)[1])
+        for name in self.LAZY_MODULES:
+            self.assertNotIn(name, modules)
+
+    def test_lazy_attributes(self):
+        code = "import presalytics; print(presalytics.Client.__module__, presalytics.client.presalytics_story.models.Story.__name__)"
+        output = self.run_import(code)[1].decode('utf-8').split()
+        self.assertEqual(output, ["presalytics.client.api", "Story"])
+
+    def test_init(self):
+        with tempfile.TemporaryDirectory() as cwd:
+            code = "; ".join([
+                "import sys, json, os, presalytics",
+                "hooked = [sys.excepthook is sys.__excepthook__]",
+                "files = [os.listdir('.')]",
+                "config = presalytics.CONFIG",
+                "files.append(os.listdir('.'))",
+                "presalytics.init()",
+                "presalytics.init()",
+                "hooked.append(sys.excepthook is sys.__excepthook__)",
+                "files.append(os.listdir('.'))",
+                "print(json.dumps([hooked, files, presalytics.CONFIG is config, len(presalytics.COMPONENTS.registry) > 0]))"
+            ])
+            output = json.loads(self.run_import(code, cwd=cwd)[1])
+        self.assertEqual(output, [[True, False], [[], [], ['log']], True, True])
+
+    def test_registry_index_cache(self):
+        with tempfile.TemporaryDirectory() as cache_home:
+            env = {"XDG_CACHE_HOME": cache_home}
+            code = "import json, presalytics; presalytics.init(); print(json.dumps(sorted(presalytics.COMPONENTS.registry)))"
+            keys = json.loads(self.run_import(code, env=env)[1])
+            self.assertEqual(len(os.listdir(os.path.join(cache_home, "presalytics"))), 1)
+            code = "import presalytics.lib.registry; presalytics.lib.registry.RegistryIndex.build = None; " + code
+            self.assertEqual(json.loads(self.run_import(code, env=env)[1]), keys)
+
+    def test_registry_first_access_from_library(self):
+        keys = []
+        for first_access in ["presalytics.init()", "presalytics.lib.widgets.ooxml_editors.get_transform_registry()"]:
+            with tempfile.TemporaryDirectory() as cache_home:
+                code = "; ".join([
+                    "import json, presalytics, presalytics.lib.widgets.ooxml_editors",
+                    first_access,
+                    "print(json.dumps(sorted(presalytics.COMPONENTS.registry)))"
+                ])
+                keys.append(json.loads(self.run_import(code, env={"XDG_CACHE_HOME": cache_home})[1]))
+        self.assertEqual(keys[0], keys[1])
+        for key in ["widget.ooxml-xml-editor", "widget.chart", "renderer.revealer"]:
+            self.assertIn(key, keys[1])
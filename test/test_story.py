@@ -1,5 +1,6 @@
 import unittest
 import os
+import sys
 import json
 import lxml
 import lxml.html
@@ -12,6 +13,12 @@ import presalytics.story.outline
 import presalytics.lib.tools.component_tools
 import presalytics.lib.widgets.ooxml_editors
 import presalytics.lib.widgets.d3
+import presalytics.lib.widgets.matplotlib
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class TestStory(unittest.TestCase):
@@ -43,6 +50,266 @@ class TestStory(unittest.TestCase):
         self.assertEqual(new_dict["pages"][0]["widgets"][0]["data"]["temp"], "data")
         self.assertIsNotNone(json_str)
 
+    def test_json_codec(self):
+        import datetime
+        import numpy as np
+        import presalytics.lib.json_codec
+        obj = {
+            "array": np.arange(6, dtype=np.float64).reshape((2, 3)),
+            "created": datetime.datetime(2020, 1, 1, 12, 30),
+            "id": uuid.UUID(int=1),
+            "count": np.int64(3),
+            "name": "caf\u00e9"
+        }
+        encoded = presalytics.lib.json_codec.get_json_codec("json").dumps(obj)
+        decoded = presalytics.lib.json_codec.loads(encoded, object_hook=presalytics.story.outline.json_numpy_obj_hook)
+        np.testing.assert_array_equal(decoded["array"], obj["array"])
+        self.assertEqual(decoded["created"], "2020-01-01T12:30:00+00:00")
+        self.assertEqual(decoded["id"], str(uuid.UUID(int=1)))
+        self.assertEqual(decoded["count"], 3)
+        as_list = presalytics.lib.json_codec.dumps(obj["array"], numpy=presalytics.lib.json_codec.NUMPY_LIST)
+        self.assertEqual(json.loads(as_list), [[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]])
+
+    @unittest.skipUnless(orjson, "orjson is not installed (pip install presalytics[fast])")
+    def test_json_codec_orjson(self):
+        import datetime
+        import numpy as np
+        import presalytics.lib.json_codec
+        obj = {
+            "array": np.arange(6, dtype=np.float64).reshape((2, 3)),
+            "created": datetime.datetime(2020, 1, 1, 12, 30),
+            "id": uuid.UUID(int=1),
+            "count": np.int64(3),
+            "name": "caf\u00e9"
+        }
+        encoded = [presalytics.lib.json_codec.get_json_codec(backend).dumps(obj) for backend in ["json", "orjson"]]
+        self.assertEqual(encoded[0], encoded[1])
+
+    def test_deserialize(self):
+        import datetime
+        outline = presalytics.story.outline
+        self.assertEqual(outline.get_constructor_args(outline.Page), ("name", "kind", "widgets", "plugins"))
+        widget = outline.Widget("chart", "matplotlib-responsive", {})
+        page = outline.Page.deserialize({"name": "page", "kind": "widget-page", "widgets": [widget, {"name": "d3", "kind": "d3", "data": {}}]})
+        self.assertIs(page.widgets[0], widget)
+        self.assertIsInstance(page.widgets[1], outline.Widget)
+        self.assertIs(outline.Page.deserialize(page), page)
+        self.assertEqual(outline.Page.deserialize_many([page]), [page])
+        empty = outline.Page.deserialize({"name": "page", "kind": "widget-page"})
+        self.assertEqual((empty.widgets, empty.plugins), ([], []))
+
+        class Named(outline.OutlineBase):
+            def __init__(self, name, kind, **kwargs):
+                super(Named, self).__init__(**kwargs)
+                self.name = name
+                self.kind = kind
+
+        self.assertIsNone(Named.deserialize({"name": "named"}).kind)
+
+        class NamedPage(outline.Page):
+            @classmethod
+            def deserialize(cls, json_obj):
+                page = super(NamedPage, cls).deserialize(json_obj)
+                page.name = page.name.upper()
+                return page
+
+        self.assertEqual([p.name for p in NamedPage.deserialize_many([{"name": "page", "kind": "widget-page"}])], ["PAGE"])
+        created = datetime.datetime(2020, 2, 29, 22, 12, 10, tzinfo=datetime.timezone.utc)
+        info = outline.Info.deserialize({
+            "revision": "0",
+            "dateCreated": created,
+            "dateModified": "February 29, 2020 10:12:10 PM",
+            "createdBy": "user",
+            "modifiedBy": "user",
+            "revisionNotes": "notes"
+        })
+        self.assertEqual(info.date_created, created)
+        self.assertEqual(info.date_modified, created)
+        self.assertEqual(outline.parse_outline_datetime("2020-02-29T22:12:10+00:00"), created)
+
+    def test_outline_to_dict(self):
+        import datetime
+        import numpy as np
+        import presalytics.lib.json_codec
+        outline = presalytics.story.outline
+        widget = outline.Widget("chart", "matplotlib-responsive", {
+            "array": np.arange(4, dtype=np.int32),
+            "created": datetime.datetime(2020, 1, 1),
+            "id": uuid.UUID(int=1),
+            "pairs": [(1, 2)],
+            "counts": {1: np.int64(2), None: True}
+        })
+        widget.plugins = [outline.Plugin("script", "mpld3", {})]
+        page = outline.Page("page", "widget-page", None)
+        page.widgets = [widget]
+        page_dict = page.to_dict()
+        widget_dict = page_dict["widgets"][0]
+        np.testing.assert_array_equal(widget_dict["data"].pop("array"), np.arange(4, dtype=np.int32))
+        self.assertEqual(widget_dict["data"], {
+            "created": "2020-01-01T00:00:00+00:00",
+            "id": str(uuid.UUID(int=1)),
+            "pairs": [[1, 2]],
+            "counts": {"1": 2, "null": True}
+        })
+        self.assertEqual(widget_dict["plugins"], [{"kind": "script", "name": "mpld3", "config": {}}])
+        self.assertNotIn("additionalProperties", page_dict)
+        dumped = presalytics.lib.json_codec.loads(page.dump(), object_hook=presalytics.story.outline.json_numpy_obj_hook)
+        np.testing.assert_array_equal(dumped["widgets"][0]["data"].pop("array"), np.arange(4, dtype=np.int32))
+        self.assertEqual(dumped, page_dict)
+
+    def test_outline_container(self):
+        import tempfile
+        import numpy as np
+        outline = presalytics.story.outline
+        data = {
+            "x": np.arange(1000, dtype='>f8'),
+            "y": np.arange(12, dtype=np.int16).reshape((3, 4)).T,
+            "labels": ["a", "b"]
+        }
+        widget = outline.Widget("chart", "matplotlib-responsive", data)
+        page = outline.Page("page", "widget-page", None)
+        page.widgets = [widget]
+        container = page.dump(container=True)
+        self.assertLess(len(container), len(page.dump()))
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "page.zip")
+            page.export_container(filename)
+            for loaded in [outline.Page.load(container), outline.Page.import_container(filename)]:
+                loaded_data = loaded.widgets[0].data
+                self.assertEqual(loaded_data["x"].dtype.byteorder, '=' if sys.byteorder == 'little' else '<')
+                np.testing.assert_array_equal(loaded_data["x"], data["x"])
+                np.testing.assert_array_equal(loaded_data["y"], data["y"])
+                self.assertFalse(loaded_data["x"].flags.writeable)
+                self.assertEqual(loaded_data["labels"], ["a", "b"])
+            del loaded, loaded_data
+
+    def test_cli_container(self):
+        import tempfile
+        import subprocess
+        test_file = os.path.join(os.path.dirname(__file__), 'files', 'matplotlib-outline.yaml')
+        outline = presalytics.story.outline.StoryOutline.import_yaml(test_file)
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join([root, os.environ.get("PYTHONPATH", "")]))
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "story.zip")
+            outline.export_container(filename)
+            patch = json.dumps([{"op": "replace", "path": "/title", "value": "Patched"}])
+            subprocess.check_call([sys.executable, "-m", "presalytics.cli", "-f", filename, "modify", "patch", "--patch", patch], cwd=tmp, env=env)
+            patched = presalytics.story.outline.StoryOutline.import_container(filename, mmap_mode=None)
+        self.assertEqual(patched.title, "Patched")
+        self.assertEqual(patched.pages[0].widgets[0].name, outline.pages[0].widgets[0].name)
+
+    def test_yaml_codec(self):
+        import tempfile
+        import numpy as np
+        import presalytics.lib.yaml_codec
+        outline = presalytics.story.outline
+        array = np.arange(6, dtype='>f4').reshape((2, 3))
+        text = presalytics.lib.yaml_codec.dump({"x": array, "n": np.int64(3)})
+        self.assertIn(presalytics.lib.yaml_codec.NDARRAY_TAG, text)
+        self.assertNotIn("python/", text)
+        loaded = presalytics.lib.yaml_codec.load(text)
+        np.testing.assert_array_equal(loaded["x"], array)
+        self.assertEqual(loaded["n"], 3)
+        import yaml
+        import presalytics.lib.exceptions
+        legacy = yaml.dump({"x": array})
+        with self.assertRaises(presalytics.lib.exceptions.ValidationError):
+            presalytics.lib.yaml_codec.load(legacy)
+        with self.assertRaises(presalytics.lib.exceptions.ValidationError):
+            presalytics.lib.yaml_codec.load("!!python/object/apply:os.getcwd []")
+        with self.assertRaises(presalytics.lib.exceptions.ValidationError):
+            list(presalytics.lib.yaml_codec.load_all(text + "---\n" + legacy))
+        np.testing.assert_array_equal(presalytics.lib.yaml_codec.load(legacy, allow_unsafe=True)["x"], array)
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "pages.yaml")
+            outline.OutlineBase.export_yaml_all((outline.Page("page-{0}".format(i), "widget-page", None) for i in range(3)), filename)
+            self.assertEqual([p.name for p in outline.Page.import_yaml_all(filename)], ["page-0", "page-1", "page-2"])
+
+    def test_validate_outline(self):
+        import presalytics.lib.exceptions
+        test_file = os.path.join(os.path.dirname(__file__), 'files', 'matplotlib-outline.yaml')
+        outline = presalytics.story.outline.StoryOutline.import_yaml(test_file)
+        validator = presalytics.story.outline.get_schema_validator(outline.outline_version)
+        self.assertIs(validator, presalytics.story.outline.get_schema_validator(outline.outline_version))
+        outline.validate()
+        outline.pages[0].widgets[0].data["temp"] = "edited"
+        outline.validate()
+        outline.pages[0].widgets[0].name = 3
+        with self.assertRaises(presalytics.lib.exceptions.ValidationError):
+            outline.validate()
+        outline_dict = outline.to_dict()
+        fingerprints = frozenset(validator.fingerprint(definition, instance) for definition, _, instance in validator.iter_subtrees(outline_dict))
+        self.assertEqual(validator.validate(outline_dict, fingerprints), fingerprints)
+        outline.pages[0].widgets[0].name = "widget"
+        outline.validate(incremental=False)
+        outline.info.revision = 3
+        presalytics.story.revealer.Revealer(outline)
+        outline_dict = outline.to_dict()
+        presalytics.story.outline.StoryOutline.deserialize(outline_dict)
+        with self.assertRaises(presalytics.lib.exceptions.ValidationError):
+            presalytics.story.outline.StoryOutline.deserialize(dict(outline_dict, validate=True))
+
+    def test_registry_index(self):
+        import tempfile
+        import presalytics.lib.registry
+        import presalytics.lib.plugins.base
+        import presalytics.lib.plugins.matplotlib
+        registry_module = presalytics.lib.registry
+        with tempfile.TemporaryDirectory() as cache_dir:
+            fingerprint = registry_module.RegistryIndex.get_fingerprint(registry_module.RegistryBase.skip_modules)
+            index = registry_module.RegistryIndex.build(fingerprint, registry_module.RegistryBase.skip_modules)
+            path = os.path.join(cache_dir, registry_module.RegistryIndex.FILENAME)
+            index.save(path)
+            self.assertIsNone(registry_module.RegistryIndex.load(path, "stale-fingerprint"))
+            loaded = registry_module.RegistryIndex.load(path, fingerprint)
+        self.assertEqual([e.to_dict() for e in loaded.entries], [e.to_dict() for e in index.entries])
+        plugins = presalytics.lib.plugins.base.PluginRegistry(autodiscover_paths=[])
+        plugins.registry.clear()
+        plugins.load_index(loaded)
+        self.assertFalse(plugins.registry.is_loaded("script.mpld3"))
+        self.assertIs(plugins.get("script.mpld3"), presalytics.lib.plugins.matplotlib.Mpld3Plugin)
+        self.assertTrue(plugins.registry.is_loaded("script.mpld3"))
+        self.assertTrue(registry_module.module_is_in_stackframe(__name__))
+        self.assertFalse(registry_module.module_is_in_stackframe("presalytics.not_a_module"))
+
+    def test_workspace_scan(self):
+        import sys
+        import tempfile
+        import presalytics.story.components
+        files = {
+            "ws_scan_widgets.py": "from presalytics.story.components import WidgetBase\n\n\nclass ScanWidget(WidgetBase):\n    __component_kind__ = 'ws-scan-widget'\n\n\nclass ScanChild(ScanWidget):\n    __component_kind__ = 'ws-scan-child'\n",
+            "ws_scan_dynamic.py": "import presalytics.story.components\n\nKIND = 'ws-scan-dynamic'\n\n\nclass DynamicWidget(presalytics.story.components.WidgetBase):\n    __component_kind__ = KIND\n",
+            "ws_scan_plugins.py": "import presalytics\n\n\nclass ScanPlugin(presalytics.lib.plugins.base.ScriptPlugin):\n    __plugin_name__ = 'ws-scan-plugin'\n"
+        }
+        modules = [name.replace(".py", "") for name in files.keys()]
+        try:
+            with tempfile.TemporaryDirectory() as workspace:
+                for name, source in files.items():
+                    with open(os.path.join(workspace, name), 'w') as f:
+                        f.write(source)
+                registry = presalytics.story.components.ComponentRegistry(autodiscover_paths=[workspace])
+                self.assertIn("widget.ws-scan-child", registry.registry.keys())
+                self.assertFalse(any(m in sys.modules for m in modules))
+                self.assertEqual(registry.get("widget.ws-scan-child").__name__, "ScanChild")
+                self.assertIn("ws_scan_widgets", sys.modules)
+                self.assertNotIn("ws_scan_dynamic", sys.modules)
+                self.assertEqual(registry.get("widget.ws-scan-dynamic").__name__, "DynamicWidget")
+                self.assertNotIn("ws_scan_plugins", sys.modules)
+        finally:
+            for name in modules:
+                sys.modules.pop(name, None)
+
+    def test_registry_find(self):
+        import presalytics.lib.registry
+        registry = presalytics.lib.registry.LazyRegistryDict()
+        for i in range(200):
+            registry["widget.{0}.customer-{1}".format("d3" if i % 2 else "matplotlib-figure", i)] = i
+        registry.pop("widget.d3.customer-11")
+        registry["page.widget-page.customer-11"] = 11
+        for text in ["customer-1", "d3", "ure.cust", "page.widget", "-11", ".", "missing"]:
+            self.assertEqual(registry.find(text), [k for k in registry.keys() if text in k])
+
     def test_plugins(self):
         from presalytics import PLUGINS
 